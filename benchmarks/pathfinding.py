@@ -0,0 +1,227 @@
+"""
+วัดความเร็วของ PathFinder.find_path เทียบกับ A* แบบเดิม (PriorityQueue + dict ของ tuple)
+บนตารางสุ่มขนาด 32x32 ถึง 512x512
+
+- legacy: โค้ดเดิมทุกอย่าง (ต้นทุน 1 ทุกทิศ, heuristic แบบ Manhattan ซึ่งประเมินเกินจริง
+  จึงค้นหาแบบเกือบ greedy และได้เส้นทางที่ยาวกว่า)
+- legacy octile: โครงสร้างข้อมูลเดิมแต่ใช้ต้นทุนและ heuristic แบบ octile เหมือน find_path ใหม่
+  (ค้นหาโหนดชุดเดียวกัน จึงเทียบความเร็วของโครงสร้างข้อมูลได้ตรงๆ)
+
+คอลัมน์ "vs octile" คือความเร็วที่ได้จากโครงสร้างข้อมูลเมื่อค้นหาโหนดชุดเดียวกันเท่านั้น
+คอลัมน์ "vs legacy" เทียบกับโค้ดที่ถูกแทนที่จริง: ตั้งแต่ 64x64 ขึ้นไป find_path ใหม่ช้ากว่า
+เพราะค้นหาเส้นทางที่สั้นที่สุดจริง ส่วนโค้ดเดิมใช้ heuristic ที่ประเมินเกินจริงจึงขยายโหนดน้อยกว่า
+
+ส่วนที่สองเทียบ strategy ของ PathFinder ("astar", "jps", "hpa") บนแผนที่โล่งและแผนที่เขาวงกต
+ด้วยจำนวนโหนดที่ถูกขยายและเวลาต่อการค้นหา
+
+ก่อนวัดเวลาจะตรวจว่า "jps" ได้ความยาวเส้นทางเท่ากับ "astar" บนตารางสุ่ม (รวมถึงเมื่อมีสิ่งกีดขวาง
+ถูกเพิ่มหรือลบระหว่างการค้นหา) และตรวจซ้ำทุกแผนที่ในตารางเทียบ strategy ถ้าไม่เท่ากันจะจบด้วย error
+
+วิธีใช้: python benchmarks/pathfinding.py [จำนวนรอบต่อขนาด]
+"""
+import math
+import os
+import random
+import sys
+import time
+from queue import PriorityQueue
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.Path import DIAGONAL_COST, PathFinder  # noqa: E402
+from game.walkability import WalkabilityGrid  # noqa: E402
+
+SIZES = (32, 64, 128, 256, 512)
+OBSTACLE_RATIO = 0.2  # สัดส่วนช่องที่ถูกบล็อก
+STRATEGY_SIZES = (64, 128, 256, 512)
+JPS_CHECK_GRIDS = 60  # จำนวนตารางสุ่มที่ใช้ตรวจ JPS
+LENGTH_TOLERANCE = 1e-6  # ความต่างของความยาวเส้นทางที่ยอมให้ (จากการบวกเลขทศนิยม)
+
+
+def make_grid(size: int, seed: int = 1) -> WalkabilityGrid:
+    """ตารางสุ่มที่มีสิ่งกีดขวางตาม OBSTACLE_RATIO (มุมซ้ายบนและขวาล่างเดินได้เสมอ)"""
+    rng = random.Random(seed)
+    terrain = bytearray(0 if rng.random() < OBSTACLE_RATIO else 1 for _ in range(size * size))
+    terrain[0] = terrain[-1] = 1
+    return WalkabilityGrid(size, size, terrain)
+
+
+def make_open_grid(size: int) -> WalkabilityGrid:
+    """ตารางโล่งที่มีกำแพงสั้นๆ กระจายอยู่เล็กน้อย (ประมาณ 2% ของช่อง)"""
+    grid = WalkabilityGrid(size, size)
+    rng = random.Random(2)
+    terrain = bytearray(grid.cells)
+    for _ in range(size * size // 250):
+        x, y = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        horizontal = rng.random() < 0.5
+        for i in range(5):
+            wall_x, wall_y = (x + i, y) if horizontal else (x, y + i)
+            if wall_x < size - 1 and wall_y < size - 1:
+                terrain[wall_y * size + wall_x] = 0
+    return WalkabilityGrid(size, size, terrain)
+
+
+def make_maze_grid(size: int, seed: int = 3) -> WalkabilityGrid:
+    """เขาวงกตทางเดินกว้าง 1 ช่อง (depth-first backtracker) มุมซ้ายบนและขวาล่างเดินได้เสมอ"""
+    rng = random.Random(seed)
+    terrain = bytearray(size * size)
+    terrain[0] = 1
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy, dx, dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 <= x + dx < size and 0 <= y + dy < size and not terrain[(y + dy) * size + x + dx]]
+        if not options:
+            stack.pop()
+            continue
+        new_x, new_y, dx, dy = rng.choice(options)
+        terrain[(y + dy // 2) * size + x + dx // 2] = 1
+        terrain[new_y * size + new_x] = 1
+        stack.append((new_x, new_y))
+    # ขนาดคู่: เปิดทางจากช่องสุดท้ายของเขาวงกตไปยังมุมขวาล่าง
+    terrain[-1] = terrain[-2] = terrain[-size - 1] = 1
+    return WalkabilityGrid(size, size, terrain)
+
+
+def legacy_find_path(path_finder: PathFinder, start, goal, octile: bool = False):
+    """
+    A* แบบเดิมก่อนปรับปรุง (PriorityQueue, dict ของ tuple)
+
+    :param octile: False = ต้นทุน 1 ทุกทิศกับ Manhattan แบบเดิม, True = ต้นทุนและ heuristic แบบ octile
+    """
+    frontier = PriorityQueue()
+    frontier.put((0, start))
+    came_from = {start: None}
+    cost_so_far = {start: 0}
+    while not frontier.empty():
+        current = frontier.get()[1]
+        if current == goal:
+            break
+        for next_pos in path_finder.get_neighbors(current):
+            if octile:
+                diagonal = next_pos[0] != current[0] and next_pos[1] != current[1]
+                new_cost = cost_so_far[current] + (DIAGONAL_COST if diagonal else 1)
+            else:
+                new_cost = cost_so_far[current] + 1
+            if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
+                cost_so_far[next_pos] = new_cost
+                if octile:
+                    priority = new_cost + path_finder.heuristic(goal, next_pos)
+                else:
+                    priority = new_cost + abs(goal[0] - next_pos[0]) + abs(goal[1] - next_pos[1])
+                frontier.put((priority, next_pos))
+                came_from[next_pos] = current
+    path = []
+    current = goal
+    while current is not None:
+        path.append(current)
+        current = came_from.get(current)
+    path.reverse()
+    return path if path[0] == start else []
+
+
+def path_length(path) -> float:
+    """ความยาวของเส้นทางแบบ octile (แนวทแยง = √2)"""
+    return sum(math.hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(path, path[1:]))
+
+
+def check_same_length(expected, path, start, goal, label: str):
+    """จบโปรแกรมด้วย error ถ้าความยาวของ path ไม่เท่ากับความยาวของเส้นทาง expected จาก A*"""
+    if bool(path) != bool(expected) or abs(path_length(path) - path_length(expected)) > LENGTH_TOLERANCE:
+        raise SystemExit(f"{label}: jps length {path_length(path):.3f} != astar length "
+                         f"{path_length(expected):.3f} for {start} -> {goal}")
+
+
+def check_path(grid: WalkabilityGrid, path, start, goal, label: str):
+    """จบโปรแกรมด้วย error ถ้าเส้นทางไม่ได้เริ่มที่ start จบที่ goal และเดินทีละช่องบนช่องที่เดินได้"""
+    if not path:
+        return
+    valid = path[0] == start and path[-1] == goal and all(
+        max(abs(b[0] - a[0]), abs(b[1] - a[1])) == 1 and grid.is_walkable(*b) for a, b in zip(path, path[1:]))
+    if not valid:
+        raise SystemExit(f"{label}: invalid jps path for {start} -> {goal}")
+
+
+def check_jps(grids: int = JPS_CHECK_GRIDS, seed: int = 4):
+    """
+    ตรวจว่า JPS ได้ความยาวเส้นทางเท่ากับ A* บนตารางสุ่ม
+    ระหว่างการค้นหาแต่ละครั้งจะเพิ่มหรือลบสิ่งกีดขวาง เพื่อตรวจว่า JPS ไม่ใช้แถวและคอลัมน์เก่าที่เก็บไว้
+    """
+    rng = random.Random(seed)
+    queries = 0
+    for _ in range(grids):
+        width, height = rng.randint(2, 40), rng.randint(2, 40)
+        ratio = rng.uniform(0.0, 0.4)
+        grid = WalkabilityGrid(width, height,
+                               bytearray(0 if rng.random() < ratio else 1 for _ in range(width * height)))
+        astar = PathFinder(None, grid, cache_size=0)
+        jps = PathFinder(None, grid, cache_size=0, strategy="jps")
+        for _ in range(20):
+            for _ in range(rng.randint(0, 3)):
+                x, y = rng.randrange(width), rng.randrange(height)
+                if rng.random() < 0.7:
+                    grid.add_obstacle(x, y)
+                else:
+                    grid.remove_obstacle(x, y)
+            start = (rng.randrange(width), rng.randrange(height))
+            goal = (rng.randrange(width), rng.randrange(height))
+            path = jps.find_path(start, goal)
+            check_same_length(astar.find_path(start, goal), path, start, goal, f"random {width}x{height}")
+            check_path(grid, path, start, goal, f"random {width}x{height}")
+            queries += 1
+    print(f"jps check: {queries} queries on {grids} random grids match astar")
+
+
+def measure(find, repeats: int):
+    """เวลาเฉลี่ยต่อครั้ง (มิลลิวินาที) และผลลัพธ์ของครั้งสุดท้าย"""
+    result = None
+    started = time.perf_counter()
+    for _ in range(repeats):
+        result = find()
+    return (time.perf_counter() - started) * 1000 / repeats, result
+
+
+def compare_strategies(repeats: int):
+    """
+    เทียบจำนวนโหนดที่ถูกขยาย เวลา และความยาวเส้นทางของแต่ละ strategy (ไม่ใช้แคช)
+    และจบด้วย error ถ้าเส้นทางของ "jps" ยาวไม่เท่ากับของ "astar" บนแผนที่และคำถามเดียวกัน
+    """
+    print(f"\n{'map':>6} {'size':>9} {'strategy':>9} {'expanded':>9} {'ms':>9} {'len':>8}")
+    for name, make in (("open", make_open_grid), ("maze", make_maze_grid)):
+        for size in STRATEGY_SIZES:
+            grid = make(size)
+            start, goal = (0, 0), (size - 1, size - 1)
+            astar_path = PathFinder(None, grid, cache_size=0).find_path(start, goal)
+            for strategy in PathFinder.STRATEGIES:
+                path_finder = PathFinder(None, grid, cache_size=0, strategy=strategy)
+                if path_finder.hierarchy is not None:
+                    path_finder.hierarchy.prebuild()  # ไม่นับเวลาสร้างกราฟระดับบน
+                path_finder.find_path(start, goal)
+                ms, path = measure(lambda: path_finder.find_path(start, goal), repeats)
+                if strategy == "jps":
+                    check_same_length(astar_path, path, start, goal, f"{name} {size}x{size}")
+                print(f"{name:>6} {size:>4}x{size:<4} {strategy:>9} {path_finder.expanded:>9} "
+                      f"{ms:>9.2f} {path_length(path):>8.1f}")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    check_jps()
+    # vs legacy: เทียบกับโค้ดเดิมจริง (ค่าน้อยกว่า 1 = ช้ากว่า เพราะโค้ดเดิมค้นหาแบบเกือบ greedy
+    # จึงขยายโหนดน้อยกว่าแต่ได้เส้นทางที่ไม่สั้นที่สุด), vs octile: เทียบกับการค้นหาโหนดชุดเดียวกัน
+    print(f"{'size':>9} {'legacy ms':>10} {'len':>7} {'octile ms':>10} {'new ms':>9} {'len':>7} "
+          f"{'vs legacy':>10} {'vs octile':>10}")
+    for size in SIZES:
+        path_finder = PathFinder(None, make_grid(size), cache_size=0)  # วัดการค้นหาจริงทุกครั้ง ไม่ใช้แคช
+        start, goal = (0, 0), (size - 1, size - 1)
+        path_finder.find_path(start, goal)  # จอง list ของ find_path ก่อนจับเวลา
+        legacy_ms, legacy_path = measure(lambda: legacy_find_path(path_finder, start, goal), repeats)
+        octile_ms, _ = measure(lambda: legacy_find_path(path_finder, start, goal, octile=True), repeats)
+        new_ms, new_path = measure(lambda: path_finder.find_path(start, goal), repeats)
+        print(f"{size:>4}x{size:<4} {legacy_ms:>10.2f} {path_length(legacy_path):>7.1f} {octile_ms:>10.2f} "
+              f"{new_ms:>9.2f} {path_length(new_path):>7.1f} {legacy_ms / new_ms:>9.2f}x {octile_ms / new_ms:>9.2f}x")
+    compare_strategies(repeats)
+
+
+if __name__ == "__main__":
+    main()
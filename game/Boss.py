@@ -1,6 +1,10 @@
 import pygame
 import random
-from .SpriteSheetLoader import SpriteSheetLoader
+from .asset_manager import assets
+from .render_queue import RenderQueue
+from .font_cache import get_font
+from .health_bar import health_bars
+from .frame_cache import get_scaled_frame
 
 class Boss:
     def __init__(self, x, y):
@@ -16,16 +20,19 @@ class Boss:
         self.idle_frame_duration = 100
         self.last_frame_update_time = pygame.time.get_ticks()
         self.image = self.unit_idle_frames[self.idle_frame_index]  # ใช้เฟรมแรกเป็นภาพเริ่มต้น
-        self.font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 20)  # โหลดฟอนต์สำหรับแสดงตัวเลข
+        self.font = get_font(20)  # โหลดฟอนต์สำหรับแสดงตัวเลข
         self.move_timer = 0  # ตัวแปรสำหรับจัดการการเคลื่อนไหว
         self.move_duration = 2000  # เวลาในการเคลื่อนที่ (มิลลิวินาที)
         self.direction = random.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])  # ทิศทางเริ่มต้น
 
-    def load_idle_animation(self):
+    @staticmethod
+    def load_idle_animation():
         """โหลดแอนิเมชัน idle สำหรับบอส"""
-        return SpriteSheetLoader.load_sprite_sheet("assets/sprites/AmongUsIdle.png", frame_width=32, frame_height=32)
+        return assets.get_frames("assets/sprites/AmongUsIdle.png")
 
-    def draw(self, screen, camera, config):
+    def queue_draw(self, render_queue, camera, config):
+        """ส่งภาพบอสเข้าคิวการวาดตามความลึก"""
+        depth = RenderQueue.depth_key(self.x, self.y, RenderQueue.LAYER_UNIT)
         # แปลงพิกัด Cartesian เป็นพิกัดไอโซเมตริก
         iso_x, iso_y = self.cart_to_iso(self.x, self.y)
         screen_x = iso_x * camera.zoom + config.OFFSET_X + camera.position.x
@@ -34,30 +41,30 @@ class Boss:
         # อัปเดตเฟรม idle
         self.update_idle_frame()
 
-        scaled_image = pygame.transform.scale(self.image, (int(self.image.get_width() * camera.zoom), int(self.image.get_height() * camera.zoom)))
-        screen.blit(scaled_image, (screen_x, screen_y))
+        scaled_image = get_scaled_frame(self.image, camera.zoom)
+        render_queue.submit(depth, scaled_image, (screen_x, screen_y))
 
         # วาดหลอดเลือด
-        self.draw_health_bar(screen, screen_x, screen_y, scaled_image)
+        self.queue_health_bar(render_queue, screen_x, screen_y, scaled_image)
 
-    def draw_health_bar(self, screen, x, y, scaled_image):
-        """วาดหลอดเลือดของบอส"""
+    def queue_health_bar(self, render_queue, x, y, scaled_image):
+        """ส่งหลอดเลือดและตัวเลขพลังชีวิตของบอสเข้าชั้นหลอดเลือด (ใช้ภาพจากแคช)"""
         # พื้นหลังของหลอดเลือด
         bar_width = 50
         bar_height = 5
         bar_x = x + (scaled_image.get_width() - bar_width) // 2
         bar_y = y - 10  # ปรับตำแหน่ง Y ให้สูงขึ้น
 
-        pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))  # สีพื้นหลัง
         health_ratio = self.health / self.max_health
-        health_bar_width = int(bar_width * health_ratio)
-        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, health_bar_width, bar_height))  # สีหลอดเลือด
+        bar_surface = health_bars.get_bar(self, bar_width, bar_height, health_ratio,
+                                          (100, 100, 100), (255, 0, 0))  # พื้นหลังสีเทา หลอดเลือดสีแดง
+        render_queue.submit_bar(bar_surface, (bar_x, bar_y))
 
-        # วาดตัวเลขแสดงพลังชีวิต
+        # ตัวเลขแสดงพลังชีวิต
         health_text = f"{self.health}/{self.max_health}"
-        text_surface = self.font.render(health_text, True, (255, 255, 255))  # สีของตัวเลขเป็นสีขาว
+        text_surface = health_bars.get_label(self, self.font, health_text, (255, 255, 255))  # สีของตัวเลขเป็นสีขาว
         text_rect = text_surface.get_rect(center=(bar_x + bar_width // 2, bar_y - 15))  # ตำแหน่งของตัวเลขอยู่เหนือหลอดเลือด
-        screen.blit(text_surface, text_rect)
+        render_queue.submit_bar(text_surface, text_rect)
 
     def update_idle_frame(self):
         """อัปเดตเฟรม idle ของบอส"""
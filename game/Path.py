@@ -1,29 +1,115 @@
-from queue import PriorityQueue
+import heapq
+import math
+from .hpa import HierarchicalGraph
+from .jps import JumpPointSearch
+from .path_cache import PathCache
+from .walkability import WalkabilityGrid
+
+DIAGONAL_COST = math.sqrt(2)  # ต้นทุนการเดินแนวทแยง (แนวตรง = 1)
+BUDGET_EPSILON = 1e-9  # ค่าเผื่อความคลาดเคลื่อนของทศนิยมเมื่อเทียบต้นทุนกับงบการเดิน
+
+
+class ReachableArea:
+    """
+    ผลลัพธ์ของ PathFinder.reachable: ช่องที่เดินไปถึงได้ภายในงบการเดิน
+    - costs เก็บต้นทุนต่ำสุดจากจุดเริ่มต้นถึงแต่ละช่อง
+    - parents เก็บช่องก่อนหน้าบนเส้นทางที่ถูกที่สุด (ต้นไม้ของเส้นทาง) ใช้สร้างเส้นทางไปยังช่องใดก็ได้โดยไม่ต้องค้นหาใหม่
+    - version คือ version ของตารางช่องที่เดินได้ตอนคำนวณ ใช้ตรวจว่าข้อมูลเก่าหรือไม่
+    """
+    def __init__(self, start, budget, costs, parents, version):
+        """
+        :param start: จุดเริ่มต้น
+        :param budget: งบการเดินสูงสุด
+        :param costs: dict ตำแหน่ง -> ต้นทุน
+        :param parents: dict ตำแหน่ง -> ตำแหน่งก่อนหน้า (จุดเริ่มต้น -> None)
+        :param version: version ของ WalkabilityGrid ตอนคำนวณ
+        """
+        self.start = start
+        self.budget = budget
+        self.costs = costs
+        self.parents = parents
+        self.version = version
+        self.tiles = list(costs)  # ช่องทั้งหมด เรียงตามลำดับที่ถูกปิด (ต้นทุนน้อยไปมาก)
+
+    def __contains__(self, pos) -> bool:
+        return pos in self.costs
+
+    def cost(self, pos):
+        """ต้นทุนถึงช่อง pos หรือ None ถ้าไปไม่ถึงภายในงบ"""
+        return self.costs.get(pos)
+
+    def path_to(self, goal):
+        """
+        เส้นทางจากจุดเริ่มต้นไปยัง goal ตามต้นไม้ของเส้นทาง
+
+        :param goal: ช่องปลายทาง
+        :return: รายการตำแหน่ง (รวมจุดเริ่มต้น) หรือ [] ถ้าไปไม่ถึงภายในงบ
+        """
+        if goal not in self.parents:
+            return []
+        path = []
+        current = goal
+        while current is not None:
+            path.append(current)
+            current = self.parents[current]
+        path.reverse()
+        return path
+
 # คลาสสำหรับค้นหาเส้นทางใน Isometric Map
 class PathFinder:
-    def __init__(self, iso_map):
+    STRATEGIES = ("astar", "hpa", "jps")
+
+    def __init__(self, iso_map, grid=None, cache_size: int = 256, strategy: str = "astar", cluster_size: int = 16):
         """
         เริ่มต้นการค้นหาเส้นทาง
         
         :param iso_map: แผนที่ Isometric ที่ใช้ในการค้นหาเส้นทาง
+        :param grid: ตารางช่องที่เดินได้ (None = สร้างจากแผนที่)
+        :param cache_size: จำนวนเส้นทางสูงสุดในแคช (0 = ไม่ใช้แคช)
+        :param strategy: วิธีค้นหาเส้นทาง "astar" (A* บนทุกช่อง), "hpa" (ค้นหาแบบลำดับชั้นสำหรับแผนที่ใหญ่)
+                         หรือ "jps" (Jump Point Search ได้ความยาวเส้นทางเท่ากับ A* แต่ขยายโหนดน้อยกว่า)
+        :param cluster_size: ขนาดของ cluster เมื่อใช้ "hpa"
         """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown pathfinding strategy: {strategy}")
         self.iso_map = iso_map
+        self.grid = grid if grid is not None else WalkabilityGrid.from_map(iso_map)
+        # แคชเส้นทาง ล้างทันทีเมื่อช่องที่เดินได้เปลี่ยน (เช่น สร้าง Tower)
+        self.cache = PathCache(cache_size)
+        self.grid.add_listener(self._on_grid_changed)
         # กำหนดทิศทางที่สามารถเคลื่อนที่ได้ (4 ทิศทางหลัก + 4 ทิศทางทแยง)
         self.directions = [(0, 1), (1, 0), (0, -1), (-1, 0),  # แนวตั้งและแนวนอน
                           (1, 1), (-1, -1), (1, -1), (-1, 1)]  # แนวทแยง
+        # (dx, dy, ระยะห่างของ index, ต้นทุน) ของแต่ละทิศทาง สำหรับ find_path
+        width = self.grid.width
+        self._steps = [(dx, dy, dy * width + dx, DIAGONAL_COST if dx and dy else 1.0)
+                       for dx, dy in self.directions]
+        self._cost = []
+        self._parent = []
+        self._seen = []
+        self._closed = []
+        self._search_id = 0
+        self.strategy = strategy
+        # กราฟระดับบนของ HPA* (สร้างทางเข้าครั้งเดียว และสร้างใหม่เฉพาะ cluster ที่ถูกแตะเมื่อช่องเปลี่ยน)
+        self.hierarchy = (HierarchicalGraph(self.grid, self._steps, self.heuristic, cluster_size)
+                          if strategy == "hpa" else None)
+        self.jump_search = JumpPointSearch(self.grid, self.heuristic) if strategy == "jps" else None
+        self.expanded = 0  # จำนวนโหนดที่ถูกขยายในการค้นหาครั้งล่าสุด (ไม่นับผลจากแคช)
 
     def heuristic(self, a, b):
-        """คำนวณระยะห่างแบบ Manhattan distance"""
+        """คำนวณระยะห่างแบบ octile distance"""
 
         """
-        คำนวณระยะห่างแบบ Manhattan distance
+        คำนวณระยะห่างแบบ octile distance (เดินได้ 8 ทิศทาง แนวทแยงมีต้นทุน √2 จึงไม่ประเมินเกินจริง)
         
         :param a: จุดเริ่มต้น
         :param b: จุดปลายทาง
         :return: ระยะทางโดยประมาณ
         """
 
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        dx = abs(a[0] - b[0])
+        dy = abs(a[1] - b[1])
+        return dx + dy + (DIAGONAL_COST - 2) * min(dx, dy)
 
     def get_neighbors(self, pos):
         """หา tile ที่สามารถเดินไปได้รอบๆ ตำแหน่งปัจจุบัน"""
@@ -34,14 +120,12 @@ class PathFinder:
         """
 
         neighbors = []
+        is_walkable = self.grid.is_walkable
         for dx, dy in self.directions:
             new_x, new_y = pos[0] + dx, pos[1] + dy
-            # ตรวจสอบว่าอยู่ในขอบเขตของแผนที่
-            if (0 <= new_x < self.iso_map.tmx_data.width and 
-                0 <= new_y < self.iso_map.tmx_data.height):
-                # เช็คว่าสามารถเดินผ่านได้
-                if self.is_walkable((new_x, new_y)):
-                    neighbors.append((new_x, new_y))
+            # ตรวจสอบขอบเขตของแผนที่และช่องที่เดินผ่านได้จากตาราง
+            if is_walkable(new_x, new_y):
+                neighbors.append((new_x, new_y))
         return neighbors
 
     def is_walkable(self, pos):
@@ -52,61 +136,190 @@ class PathFinder:
         :return: True ถ้าสามารถเดินผ่านได้, False ถ้าถูกบล็อก
         """
 
-        # ตรวจสอบคุณสมบัติของ tile จาก TMX
-        for layer in self.iso_map.tmx_data.visible_layers:
-            if hasattr(layer, 'data'):
-                # ดึง Global ID ของ tile
-                gid = layer.data[pos[1]][pos[0]]
-                # ดึงคุณสมบัติของ tile
-                props = self.iso_map.tmx_data.get_tile_properties_by_gid(gid)
-                # ถ้ามี property 'blocked' และเป็น True ให้ถือว่าเดินไม่ได้
-                if props and props.get('blocked', False):
-                    return False
-        return True
+        # อ่านจากตารางที่สร้างไว้ล่วงหน้า (property 'blocked' ของ TMX และสิ่งกีดขวางเช่น Tower)
+        return self.grid.is_walkable(pos[0], pos[1])
+
+    def _on_grid_changed(self, changed):
+        """ล้างแคชเส้นทางเมื่อช่องที่เดินได้เปลี่ยน"""
+        self.cache.invalidate()
 
     def find_path(self, start, goal):
         """หาเส้นทางโดยใช้ A* algorithm"""
 
         """
+        ผลลัพธ์ถูกเก็บในแคชตาม (start, goal, version ของตาราง) คู่เดิมในเทิร์นเดียวกันจึงไม่ต้องค้นหาซ้ำ
+
+        :param start: จุดเริ่มต้น
+        :param goal: จุดหมายปลายทาง
+        :return: รายการตำแหน่งของเส้นทาง (รวมจุดเริ่มต้น) หรือ [] ถ้าไปไม่ถึง
+        """
+        start = (start[0], start[1])
+        goal = (goal[0], goal[1])
+        version = self.grid.version
+        path = self.cache.get(start, goal, version)
+        if path is None:
+            if self.hierarchy is not None:
+                # ใช้ A* ปกติเมื่อ HPA* ไม่เหมาะ (เช่น อยู่ใน cluster เดียวกัน)
+                path = self.hierarchy.find_path(start, goal)
+                self.expanded = self.hierarchy.expanded
+                if path is None:
+                    path = self._search(start, goal)
+            elif self.jump_search is not None:
+                path = self.jump_search.find_path(start, goal)
+                self.expanded = self.jump_search.expanded
+            else:
+                path = self._search(start, goal)
+            self.cache.put(start, goal, version, path)
+        return list(path)  # สำเนาใหม่ทุกครั้ง ผู้เรียกแก้ไขได้โดยไม่กระทบแคช
+
+    def _search(self, start, goal):
+        """
+        A* บน index ของช่อง
+        - ค้นหาบน index ของช่องแบบแถวต่อแถว (y * width + x) ด้วย heapq แทน PriorityQueue ที่ล็อกทุกครั้ง
+        - ต้นทุนและโหนดก่อนหน้าเก็บใน list ที่จองไว้ครั้งเดียว แยกการค้นหาแต่ละครั้งด้วยหมายเลขรอบ
+        - ต้นทุนแบบ octile (แนวตรง 1, แนวทแยง √2) และหยุดทันทีเมื่อดึงจุดหมายออกจากคิว
+
         :param start: จุดเริ่มต้น
         :param goal: จุดหมายปลายทาง
-        :return: รายการตำแหน่งของเส้นทาง
+        :return: รายการตำแหน่งของเส้นทาง (รวมจุดเริ่มต้น) หรือ [] ถ้าไปไม่ถึง
         """
-        # Priority Queue สำหรับเก็บโหนดที่ต้องสำรวจ
-        frontier = PriorityQueue()
-        frontier.put((0, start))
+        self.expanded = 0
+        if start == goal:
+            return [start]
+        grid = self.grid
+        if not grid.in_bounds(start[0], start[1]) or not grid.is_walkable(goal[0], goal[1]):
+            return []
 
-        # เก็บบันทึกเส้นทางและต้นทุนการเดินทาง
-        came_from = {start: None}
-        cost_so_far = {start: 0}
+        width = grid.width
+        size = width * grid.height
+        cells = grid.cells
+        cost, parent, seen, closed = self._search_buffers(size)
+        self._search_id += 1
+        search_id = self._search_id
+        steps = self._steps
+        goal_x, goal_y = goal
+        start_index = start[1] * width + start[0]
+        goal_index = goal_y * width + goal_x
+        diagonal_bonus = DIAGONAL_COST - 2  # ใช้ใน heuristic แบบ octile
 
-        # อัลกอริทึม A* หลัก
-        while not frontier.empty():
-            current = frontier.get()[1]
+        seen[start_index] = search_id
+        cost[start_index] = 0.0
+        parent[start_index] = -1
+        # (ค่าประเมินรวม, heuristic สำหรับตัดสินเมื่อค่าเท่ากัน, index)
+        frontier = [(0.0, 0.0, start_index)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        expanded = 0
 
-            # หากถึงจุดหมายแล้ว
-            if current == goal:
+        while frontier:
+            _, _, current = heappop(frontier)
+            if current == goal_index:
                 break
-            
-            # คำนวณต้นทุนการเดินทาง
-            for next_pos in self.get_neighbors(current):
-                new_cost = cost_so_far[current] + 1
-
-                # ปรับปรุงเส้นทางหากพบเส้นทางที่สั้นกว่า
-                if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
-                    cost_so_far[next_pos] = new_cost
-                    
-                    # คำนวณลำดับความสำคัญโดยรวมระยะทางกับค่า heuristic
-                    priority = new_cost + self.heuristic(goal, next_pos)
-                    frontier.put((priority, next_pos))
-                    came_from[next_pos] = current
-
-        # สร้างเส้นทาง
+            if closed[current] == search_id:
+                continue  # รายการเก่าที่ค้างในคิว (พบเส้นทางที่ถูกกว่าไปแล้ว)
+            closed[current] = search_id
+            expanded += 1
+            current_cost = cost[current]
+            y, x = divmod(current, width)
+
+            for dx, dy, offset, step_cost in steps:
+                new_x = x + dx
+                next_index = current + offset
+                # ตรวจคอลัมน์จาก x และตรวจแถวจากช่วงของ index
+                if not (0 <= new_x < width and 0 <= next_index < size) or not cells[next_index]:
+                    continue
+                new_cost = current_cost + step_cost
+                if seen[next_index] == search_id:
+                    if new_cost >= cost[next_index]:
+                        continue
+                else:
+                    seen[next_index] = search_id
+                cost[next_index] = new_cost
+                parent[next_index] = current
+                h_x = abs(new_x - goal_x)
+                h_y = abs(y + dy - goal_y)
+                h = h_x + h_y + diagonal_bonus * (h_x if h_x < h_y else h_y)
+                heappush(frontier, (new_cost + h, h, next_index))
+        else:
+            self.expanded = expanded
+            return []
+        self.expanded = expanded
+
+        # สร้างเส้นทางย้อนจากจุดหมาย
         path = []
-        current = goal
-        while current is not None:
-            path.append(current)
-            current = came_from.get(current)
+        current = goal_index
+        while current != -1:
+            y, x = divmod(current, width)
+            path.append((x, y))
+            current = parent[current]
         path.reverse()
-        # ส่งคืนเส้นทางเฉพาะเมื่อเริ่มจากจุดเริ่มต้นเท่านั้น
-        return path if path[0] == start else []
+        return path
+
+    def reachable(self, start, budget):
+        """
+        หาช่องทั้งหมดที่เดินไปถึงได้ภายในงบการเดิน ด้วย Dijkstra ครั้งเดียว
+        (ต้นทุนแบบ octile เหมือน find_path จึงได้ระยะใกล้เคียงระยะจริงแต่เลี่ยงสิ่งกีดขวาง)
+
+        :param start: จุดเริ่มต้น
+        :param budget: ต้นทุนสูงสุดที่เดินได้ (เช่น move_range ของยูนิต)
+        :return: ReachableArea ที่มีต้นทุนและเส้นทางไปยังทุกช่องที่ไปถึงได้
+        """
+        grid = self.grid
+        if not grid.in_bounds(start[0], start[1]):
+            return ReachableArea(start, budget, {}, {}, grid.version)
+
+        width = grid.width
+        size = width * grid.height
+        cells = grid.cells
+        steps = self._steps
+        limit = budget + BUDGET_EPSILON
+        start_index = start[1] * width + start[0]
+
+        # พื้นที่ถูกจำกัดด้วยงบการเดิน จึงใช้ dict ที่มีขนาดตามพื้นที่แทน list ขนาดทั้งแผนที่
+        cost = {start_index: 0.0}
+        parent = {start_index: -1}
+        closed = {}  # index -> ต้นทุนสุดท้าย (เรียงตามลำดับที่ปิด)
+        frontier = [(0.0, start_index)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        while frontier:
+            current_cost, current = heappop(frontier)
+            if current in closed:
+                continue
+            closed[current] = current_cost
+            x = current % width
+
+            for dx, dy, offset, step_cost in steps:
+                new_x = x + dx
+                next_index = current + offset
+                if not (0 <= new_x < width and 0 <= next_index < size) or not cells[next_index]:
+                    continue
+                new_cost = current_cost + step_cost
+                if new_cost > limit or next_index in closed or new_cost >= cost.get(next_index, limit + 1):
+                    continue
+                cost[next_index] = new_cost
+                parent[next_index] = current
+                heappush(frontier, (new_cost, next_index))
+
+        costs = {}
+        parents = {}
+        for index, index_cost in closed.items():
+            y, x = divmod(index, width)
+            costs[(x, y)] = index_cost
+            previous = parent[index]
+            parents[(x, y)] = None if previous == -1 else (previous % width, previous // width)
+        return ReachableArea(start, budget, costs, parents, grid.version)
+
+    def _search_buffers(self, size):
+        """
+        list ที่ใช้ซ้ำทุกการค้นหา (จองใหม่เมื่อขนาดแผนที่เปลี่ยนเท่านั้น)
+        ช่องที่ seen/closed ไม่เท่ากับหมายเลขรอบปัจจุบันถือว่ายังไม่ถูกแตะ จึงไม่ต้องล้างค่าก่อนค้นหา
+
+        :return: (ต้นทุน, โหนดก่อนหน้า, รอบที่พบ, รอบที่ปิด)
+        """
+        if len(self._cost) != size:
+            self._cost = [0.0] * size
+            self._parent = [-1] * size
+            self._seen = [0] * size
+            self._closed = [0] * size
+            self._search_id = 0
+        return self._cost, self._parent, self._seen, self._closed
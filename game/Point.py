@@ -1,8 +1,29 @@
 import pygame
 import math
 from .Unit import Unit
+from .render_queue import RenderQueue
+from .asset_manager import assets
+from .frame_cache import get_scaled_frame
 
 class CapturePoint:
+    SPRITE_SIZE = (32, 32)  # ขนาดของ sprite จุดยึดครองที่ซูม 1.0
+    _shared_sprites = None  # sprite ที่ใช้ร่วมกันทุกจุดยึดครอง
+
+    @classmethod
+    def load_shared_sprites(cls):
+        """โหลดและปรับขนาด sprite ของจุดยึดครองเพียงครั้งเดียว แล้วใช้ร่วมกันทุกจุด"""
+        if cls._shared_sprites is None:
+            sprite_paths = {
+                'neutral': "assets/crystal_mine_nocap.png",
+                'blue': "assets/sprites/bluel_mine_cap.png",  # สำหรับผู้เล่น 1 (สีน้ำเงิน)
+                'red': "assets/sprites/red_mine_cap.png",  # สำหรับผู้เล่น 2 (สีแดง)
+            }
+            cls._shared_sprites = {
+                name: pygame.transform.scale(assets.get_image(path), cls.SPRITE_SIZE)
+                for name, path in sprite_paths.items()
+            }
+        return cls._shared_sprites
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -14,18 +35,14 @@ class CapturePoint:
         self.income_interval = 1000  # ทุกๆ 1 วินาที
         self.last_income_time = pygame.time.get_ticks()
         
-        # โหลด sprites
-        self.neutral_sprite = pygame.image.load("assets/crystal_mine_nocap.png").convert_alpha()
-        self.captured_sprite_blue = pygame.image.load("assets/sprites/bluel_mine_cap.png").convert_alpha()  # สำหรับผู้เล่น 1 (สีน้ำเงิน)
-        self.captured_sprite_red = pygame.image.load("assets/sprites/red_mine_cap.png").convert_alpha()  # สำหรับผู้เล่น 2 (สีแดง)
+        # sprites ที่ปรับขนาดแล้ว ใช้ร่วมกันทุกจุดยึดครอง
+        sprites = self.load_shared_sprites()
+        self.sprite_size = self.SPRITE_SIZE
+        self.neutral_sprite = sprites['neutral']
+        self.captured_sprite_blue = sprites['blue']
+        self.captured_sprite_red = sprites['red']
         self.current_sprite = self.neutral_sprite
         
-        # ปรับขนาด sprite (ถ้าจำเป็น)
-        self.sprite_size = (32, 32)  # ปรับขนาดตามต้องการ
-        self.neutral_sprite = pygame.transform.scale(self.neutral_sprite, self.sprite_size)
-        self.captured_sprite_blue = pygame.transform.scale(self.captured_sprite_blue, self.sprite_size)
-        self.captured_sprite_red = pygame.transform.scale(self.captured_sprite_red, self.sprite_size)
-        
         # เอฟเฟกต์การกะพริบ
         self.pulse_speed = 0.005
         self.alpha = 255
@@ -84,39 +101,40 @@ class CapturePoint:
         
         return self.value if self.owner is not None else 0
 
-    def draw(self, screen, iso_map, camera, config):
-        """วาดจุดยึดครองบนหน้าจอ"""
+    def queue_draw(self, render_queue, iso_map, camera, config):
+        """ส่งภาพจุดยึดครองเข้าคิวการวาดตามความลึก"""
         # คำนวณตำแหน่งบนหน้าจอ
         iso_x, iso_y = iso_map.cart_to_iso(self.x, self.y)
         screen_x = iso_x * camera.zoom + config.OFFSET_X + camera.position.x
     
         # ปรับตำแหน่ง Y ให้สูงขึ้น
         screen_y = (iso_y * camera.zoom + config.OFFSET_Y + camera.position.y) - (config.TILE_HEIGHT * camera.zoom) - (camera.zoom)
+        depth = RenderQueue.depth_key(self.x, self.y, RenderQueue.LAYER_OBJECT)
 
-        # สร้าง sprite ที่มีขนาดตามการซูม
-        scaled_size = (int(self.sprite_size[0] * camera.zoom), 
-                      int(self.sprite_size[1] * camera.zoom))
-        scaled_sprite = pygame.transform.scale(self.current_sprite, scaled_size)
-
-        # สร้าง surface ใหม่สำหรับ alpha
-        alpha_sprite = scaled_sprite.copy()
-        alpha_sprite.set_alpha(self.alpha)
+        # sprite ที่มีขนาดตามการซูม (ปรับขนาดครั้งเดียวต่อระดับการซูม)
+        scaled_sprite = get_scaled_frame(self.current_sprite, camera.zoom)
+        scaled_size = scaled_sprite.get_size()
 
-        # วาด sprite
-        screen.blit(alpha_sprite, (screen_x, screen_y))
+        # วาด sprite พร้อมเอฟเฟกต์กะพริบ (ตั้งค่า alpha ตอนวาด ไม่ต้องคัดลอกภาพ)
+        render_queue.submit(depth, scaled_sprite, (screen_x, screen_y), int(self.alpha))
 
         # วาดแถบความคืบหน้า
         if 0 < self.capture_progress < 100:
-            bar_width = int(scaled_size[0] * 0.8)
-            bar_height = int(scaled_size[1] * 0.1)
-            bar_x = screen_x + (scaled_size[0] - bar_width) // 2
-            bar_y = screen_y + scaled_size[1] + 5
+            render_queue.submit_draw(depth, lambda screen: self.draw_progress_bar(screen, screen_x, screen_y, scaled_size))
 
-            # พื้นหลังแถบ
-            pygame.draw.rect(screen, (100, 100, 100), 
-                           (bar_x, bar_y, bar_width, bar_height))
-            
-            # แถบความคืบหน้า
-            progress_width = int(bar_width * (self.capture_progress / 100))
-            pygame.draw.rect(screen, (0, 255, 0), 
-                           (bar_x, bar_y, progress_width, bar_height))
\ No newline at end of file
+    def draw_progress_bar(self, screen, screen_x, screen_y, scaled_size):
+        """วาดแถบความคืบหน้าการยึดครองใต้ sprite"""
+        bar_width = int(scaled_size[0] * 0.8)
+        bar_height = int(scaled_size[1] * 0.1)
+        bar_x = screen_x + (scaled_size[0] - bar_width) // 2
+        bar_y = screen_y + scaled_size[1] + 5
+
+        # พื้นหลังแถบ
+        bar_rect = pygame.draw.rect(screen, (100, 100, 100), 
+                                  (bar_x, bar_y, bar_width, bar_height))
+        
+        # แถบความคืบหน้า
+        progress_width = int(bar_width * (self.capture_progress / 100))
+        pygame.draw.rect(screen, (0, 255, 0), 
+                       (bar_x, bar_y, progress_width, bar_height))
+        return bar_rect  # พื้นที่ที่ถูกวาด
\ No newline at end of file
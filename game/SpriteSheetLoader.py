@@ -1,10 +1,22 @@
 import pygame
+from .sprite_atlas import sprite_atlas
+from .asset_bundle import load_image
 
 class SpriteSheetLoader:
+    @staticmethod
+    def load_image(filename):
+        """โหลดภาพจาก sprite atlas (ถ้าไม่ได้อยู่ใน atlas จะโหลดจาก asset bundle หรือไฟล์โดยตรง)"""
+        image = sprite_atlas.get(filename)
+        if image is None:
+            image = load_image(filename).convert_alpha()
+        return image
+
     @staticmethod
     def load_sprite_sheet(filename, frame_width=32, frame_height=32, color_key=None):
-        spritesheet = pygame.image.load(filename).convert_alpha()
+        spritesheet = SpriteSheetLoader.load_image(filename)
         if color_key:
+            # ใช้ subsurface ใหม่เพื่อไม่ให้ color key ไปกระทบภาพใน atlas ที่ใช้ร่วมกัน
+            spritesheet = spritesheet.subsurface(spritesheet.get_rect())
             spritesheet.set_colorkey(color_key)
         
         frames = []
@@ -1,5 +1,9 @@
 import pygame
 import math
+from .render_queue import RenderQueue
+from .health_bar import health_bars
+from .frame_cache import get_scaled_frame
+from .asset_manager import assets
 
 class Tower:
     def __init__(self, x, y, player_id, image):
@@ -18,37 +22,38 @@ class Tower:
         """โหลดภาพตามผู้เล่น"""
         try:
             if self.player_id == 1:
-                image = pygame.image.load("assets/sprites/building-blue.png").convert_alpha()  # สำหรับผู้เล่น 1
+                image = assets.get_image("assets/sprites/building-blue.png")  # สำหรับผู้เล่น 1
             elif self.player_id == 2:
-                image = pygame.image.load("assets/sprites/building-red.png").convert_alpha()  # สำหรับผู้เล่น 2
+                image = assets.get_image("assets/sprites/building-red.png")  # สำหรับผู้เล่น 2
             return image
         except pygame.error as e:
             print(f"Unable to load image: {e}")
             return None  # คืนค่า None หากไม่สามารถโหลดภาพได้
 
-    def draw(self, screen, camera, config):
-        """วาด Tower บนหน้าจอ"""
+    def queue_draw(self, render_queue, camera, config):
+        """ส่งภาพ Tower เข้าคิวการวาดตามความลึก"""
         if self.image is not None:  # ตรวจสอบว่าภาพถูกโหลดหรือไม่
             iso_x, iso_y = self.cart_to_iso(self.x, self.y)
             screen_x = iso_x * camera.zoom + config.OFFSET_X + camera.position.x
             screen_y = iso_y * camera.zoom + config.OFFSET_Y + camera.position.y - (config.TILE_HEIGHT * camera.zoom)
+            depth = RenderQueue.depth_key(self.x, self.y, RenderQueue.LAYER_OBJECT)
 
             # วาดภาพ Tower
-            scaled_image = pygame.transform.scale(self.image, (int(self.image.get_width() * camera.zoom),
-                                                                int(self.image.get_height() * camera.zoom)))
-            screen.blit(scaled_image, (screen_x, screen_y))
+            scaled_image = get_scaled_frame(self.image, camera.zoom)
+            render_queue.submit(depth, scaled_image, (screen_x, screen_y))
 
             # วาดสถานะสุขภาพ
-            self.draw_health_bar(screen, screen_x, screen_y)
+            self.queue_health_bar(render_queue, screen_x, screen_y)
         else:
             print("Tower image not available.")
 
-    def draw_health_bar(self, screen, screen_x, screen_y):
-        """วาดแถบสุขภาพของ Tower"""
+    def queue_health_bar(self, render_queue, screen_x, screen_y):
+        """ส่งแถบสุขภาพของ Tower เข้าชั้นหลอดเลือด (ใช้ภาพจากแคช)"""
         health_bar_length = 40
         health_ratio = self.health / 100  # สมมุติว่าค่าสุขภาพสูงสุดคือ 100
-        pygame.draw.rect(screen, (255, 0, 0), (screen_x, screen_y - 10, health_bar_length, 5))  # แถบสุขภาพเต็ม
-        pygame.draw.rect(screen, (0, 255, 0), (screen_x, screen_y - 10, health_bar_length * health_ratio, 5))  # แถบสุขภาพที่ลดลง
+        bar_surface = health_bars.get_bar(self, health_bar_length, 5, health_ratio,
+                                          (255, 0, 0), (0, 255, 0))  # แถบสุขภาพเต็มสีแดง ส่วนที่เหลือสีเขียว
+        render_queue.submit_bar(bar_surface, (screen_x, screen_y - 10))
 
     def cart_to_iso(self, x, y):
         """แปลงพิกัดคาร์ทีเซียนเป็นพิกัดไอโซเมตริก"""
@@ -1,11 +1,16 @@
 import pygame
 import math
 from .game_object import GameObject
-from .SpriteSheetLoader import SpriteSheetLoader
+from .asset_manager import assets
+from .sound_bank import sound_bank
 from enum import Enum
 from .Boss import Boss
 from .monster import Monster
 from .iso_map import IsometricMap
+from .render_queue import RenderQueue
+from .font_cache import get_font, render_text
+from .health_bar import health_bars
+from .frame_cache import get_scaled_frame
 # กำหนดประเภทของยูนิต
 class UnitType(Enum):
     SOLDIER = "soldier"
@@ -24,6 +29,27 @@ class UnitType(Enum):
         }
         return costs.get(unit_type, 0)
 
+# ไฟล์ทรัพยากรของยูนิตแต่ละประเภท: (ผู้เล่น 1 สีน้ำเงิน, ผู้เล่น 2 สีแดง)
+UNIT_IDLE_SHEETS = {
+    UnitType.SOLDIER: ("assets/sprites/unit1_idle_blue.png", "assets/sprites/unit1_idle_red.png"),
+    UnitType.ARCHER: ("assets/sprites/unit2_idle_blue.png", "assets/sprites/unit2_idle_red.png"),
+    UnitType.MAGE: ("assets/sprites/mage_blue.png", "assets/sprites/mage_red.png"),
+    UnitType.CAVALRY: ("assets/sprites/House-blue.png", "assets/sprites/House-red.png"),
+}
+UNIT_ATTACK_SHEETS = {
+    UnitType.SOLDIER: ("assets/sprites/unit1_attack_blue.png", "assets/sprites/unit1_attack_red.png"),
+    UnitType.ARCHER: ("assets/sprites/unit2_attack_blue.png", "assets/sprites/unit2_attack_red.png"),
+    UnitType.MAGE: ("assets/sprites/Blue-mage-attack.png", "assets/sprites/red-mage-attack.png"),
+    UnitType.CAVALRY: ("assets/sprites/House-blue-attack.png", "assets/sprites/House-red-attack.png"),
+}
+UNIT_ATTACK_SOUNDS = {
+    UnitType.SOLDIER: "sound/sword.wav",
+    UnitType.ARCHER: "sound/arrow.wav",
+    UnitType.MAGE: "sound/magic.wav",
+    UnitType.CAVALRY: "sound/spear.wav",
+}
+UNIT_INFO_BACKGROUND = "assets/BG/bg_info.png"
+
 class Unit:
     def __init__(self, unit_idle_frames, unit_type, x=0, y=0, owner=None, name="Unit", move_range=5):
         self.unit_idle_frames = unit_idle_frames
@@ -106,35 +132,34 @@ class Unit:
         """คำนวณระยะห่างระหว่างยูนิตและเป้าหมาย"""
         return math.sqrt((self.x - target_x) ** 2 + (self.y - target_y) ** 2)
 
-    def draw_hp_bar(self, screen, x, y, max_hp, current_hp, zoom):
-        """วาด HP Bar สำหรับยูนิต"""
+    def queue_hp_bar(self, render_queue, x, y, zoom):
+        """ส่ง HP Bar ของยูนิตเข้าชั้นหลอดเลือด (ใช้ภาพจากแคช)"""
         bar_width = 30 * zoom  # ปรับความกว้างของ HP Bar ให้เล็กลง
         bar_height = 3 * zoom   # ปรับความสูงของ HP Bar ให้เล็กลง
-        hp_percentage = current_hp / max_hp  # คำนวณเปอร์เซ็นต์ของ HP
+        hp_percentage = self.current_hp / self.max_hp  # คำนวณเปอร์เซ็นต์ของ HP
 
-        # วาดกรอบของ HP Bar
-        pygame.draw.rect(screen, (255, 0, 0), (x, y, bar_width, bar_height))  # กรอบสีแดง
-        # วาด HP ที่เหลือ
-        pygame.draw.rect(screen, (0, 255, 0), (x, y, bar_width * hp_percentage, bar_height))  # HP สีเขียว
+        # กรอบสีแดง และ HP ที่เหลือสีเขียว
+        bar_surface = health_bars.get_bar(self, bar_width, bar_height, hp_percentage, (255, 0, 0), (0, 255, 0))
+        render_queue.submit_bar(bar_surface, (x, y))
 
     def draw_info(self, screen, x, y):
         """วาดข้อมูลยูนิตบนหน้าจอ"""
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 20)
+        font = get_font(20)
 
         # โหลดภาพพื้นหลังสำหรับข้อมูลยูนิต
-        background_image = pygame.image.load("assets/BG/bg_info.png").convert()  # เปลี่ยนเป็น path ของภาพพื้นหลังที่คุณต้องการ
+        background_image = assets.get_image(UNIT_INFO_BACKGROUND, alpha=False)  # ภาพที่โหลดไว้ครั้งเดียวจาก AssetManager
         background_rect = background_image.get_rect()  # รับขนาดของพื้นหลัง
         background_rect.topleft = (x - 5, y + 50 - 5)  # ตั้งตำแหน่งของพื้นหลังให้ตรงกับข้อมูลยูนิต
 
         # วาดพื้นหลัง
-        screen.blit(background_image, background_rect)
+        touched_rect = screen.blit(background_image, background_rect)
 
-        info_surface = font.render(f"Name: {self.name}", True, (255, 255, 255))
-        screen.blit(info_surface, (x, y + 50))  # ปรับตำแหน่ง Y ให้ต่ำกว่าข้อความรอบ
+        info_surface = render_text(font, f"Name: {self.name}", True, (255, 255, 255))
+        touched_rect.union_ip(screen.blit(info_surface, (x, y + 50)))  # ปรับตำแหน่ง Y ให้ต่ำกว่าข้อความรอบ
 
         # ขยับ HP ลง 1 บรรทัด
-        hp_surface = font.render(f"HP: {self.current_hp}/{self.max_hp}", True, (255, 255, 255))
-        screen.blit(hp_surface, (x, y + 50 + 30))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
+        hp_surface = render_text(font, f"HP: {self.current_hp}/{self.max_hp}", True, (255, 255, 255))
+        touched_rect.union_ip(screen.blit(hp_surface, (x, y + 50 + 30)))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
 
         # วาด HP Bar ข้างๆ ข้อมูล HP
         bar_width = 100  # ความกว้างของ HP Bar
@@ -143,22 +168,23 @@ class Unit:
         hp_bar_y = y + 50 + 30  # ปรับตำแหน่ง Y ของ HP Bar
 
         # วาดกรอบของ HP Bar
-        pygame.draw.rect(screen, (255, 0, 0), (hp_bar_x, hp_bar_y, bar_width, bar_height))  # กรอบสีแดง
+        touched_rect.union_ip(pygame.draw.rect(screen, (255, 0, 0), (hp_bar_x, hp_bar_y, bar_width, bar_height)))  # กรอบสีแดง
         hp_percentage = self.current_hp / self.max_hp  # คำนวณเปอร์เซ็นต์ของ HP
         # วาด HP ที่เหลือ
         pygame.draw.rect(screen, (0, 255, 0), (hp_bar_x, hp_bar_y, bar_width * hp_percentage, bar_height))  # HP สีเขียว
 
         # ขยับ Attack ลง 1 บรรทัด
-        attack_surface = font.render(f"Attack: {self.attack_value}", True, (255, 255, 255))
-        screen.blit(attack_surface, (x, y + 50 + 60))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
+        attack_surface = render_text(font, f"Attack: {self.attack_value}", True, (255, 255, 255))
+        touched_rect.union_ip(screen.blit(attack_surface, (x, y + 50 + 60)))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
 
         # ขยับ Move Range ลง 1 บรรทัด
-        move_range_surface = font.render(f"Move Range: {self.move_range}", True, (255, 255, 255))
-        screen.blit(move_range_surface, (x, y + 50 + 90))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
+        move_range_surface = render_text(font, f"Move Range: {self.move_range}", True, (255, 255, 255))
+        touched_rect.union_ip(screen.blit(move_range_surface, (x, y + 50 + 90)))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
 
         # ขยับ Attack Range ลง 1 บรรทัด
-        attack_range_surface = font.render(f"Attack Range: {self.attack_range}", True, (255, 255, 255))
-        screen.blit(attack_range_surface, (x, y + 50 + 120))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
+        attack_range_surface = render_text(font, f"Attack Range: {self.attack_range}", True, (255, 255, 255))
+        touched_rect.union_ip(screen.blit(attack_range_surface, (x, y + 50 + 120)))  # ปรับตำแหน่ง Y ลง 1 บรรทัด (30 พิกเซล)
+        return touched_rect  # พื้นที่ที่ถูกวาด
     
     def reset_action(self):
         """รีเซ็ตสถานะการทำ action ของยูนิต"""
@@ -178,7 +204,15 @@ class Unit:
 
     def set_destination(self, x, y, path_finder):
         """กำหนดจุดหมายและหาเส้นทาง"""
-        self.path = path_finder.find_path((int(self.x), int(self.y)), (x, y))
+        self.follow_path(path_finder.find_path((int(self.x), int(self.y)), (x, y)))
+
+    def follow_path(self, path):
+        """
+        เริ่มเดินตามเส้นทางที่คำนวณไว้แล้ว
+
+        :param path: รายการตำแหน่งที่เริ่มจากตำแหน่งปัจจุบันของยูนิต (จาก find_path หรือ ReachableArea.path_to)
+        """
+        self.path = list(path)
         if self.path:
             self.path.pop(0)  # ลบตำแหน่งปัจจุบันออก
             self.moving = True
@@ -224,85 +258,75 @@ class Unit:
                     self.is_attacking = False  # รีเซ็ตสถานะการโจมตี
                 self.last_attack_frame_update_time = current_time  # อัปเดตเวลาสำหรับการอัปเดตเฟรมการโจมตี
 
-    def draw(self, screen, iso_map, camera, config):
+    def queue_draw(self, render_queue, iso_map, camera, config):
+        """ส่งภาพของยูนิตเข้าคิวการวาดตามความลึก"""
         if self.current_hp <= 0:
             return  # ถ้า HP เป็น 0 ไม่วาดยูนิต
 
         iso_x, iso_y = iso_map.cart_to_iso(self.x, self.y)
         screen_x = iso_x * camera.zoom + config.OFFSET_X + camera.position.x
         screen_y = (iso_y * camera.zoom + config.OFFSET_Y + camera.position.y) - (config.TILE_HEIGHT * camera.zoom) - (10 * camera.zoom)
+        depth = RenderQueue.depth_key(self.x, self.y, RenderQueue.LAYER_UNIT)
 
         # วาดเฟรม idle 
         current_frame = self.unit_idle_frames[self.idle_frame_index]
         if isinstance(current_frame, pygame.Surface):
-            scaled_image = pygame.transform.scale(current_frame, 
-        (int(current_frame.get_width() * camera.zoom), 
-             int(current_frame.get_height() * camera.zoom)))
-            screen.blit(scaled_image, (screen_x, screen_y))
+            scaled_image = get_scaled_frame(current_frame, camera.zoom)
+            render_queue.submit(depth, scaled_image, (screen_x, screen_y))
 
         # วาดแอนิเมชันการโจมตีถ้ากำลังโจมตี
         if self.is_attacking:
             attack_frame = self.attack_frames[self.attack_frame_index]
-            scaled_attack_frame = pygame.transform.scale(attack_frame, 
-        (int(attack_frame.get_width() * camera.zoom), 
-         int(attack_frame.get_height() * camera.zoom)))
-            screen.blit(scaled_attack_frame, (screen_x, screen_y))
+            scaled_attack_frame = get_scaled_frame(attack_frame, camera.zoom)
+            render_queue.submit(depth, scaled_attack_frame, (screen_x, screen_y))
 
-        # วาดข้อมูลยูนิตถ้ามีการคลิก
+        # วาดข้อมูลยูนิตถ้ามีการคลิก (อยู่เหนือทุกสิ่งบนแผนที่)
         if self.clicked_this_turn:
-            self.draw_info(screen, screen.get_width() - 200, 50)  # วาดข้อมูลที่ขวาบนของหน้าจอ
+            render_queue.submit_overlay(lambda screen: self.draw_info(screen, screen.get_width() - 200, 50))  # วาดข้อมูลที่ขวาบนของหน้าจอ
 
         # วาดข้อความการกระทำ
         if self.action_text:
-            font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 24)
-            text_surface = font.render(self.action_text, True, (255, 255, 255))
-            screen.blit(text_surface, (screen_x, screen_y - 40))  # ปรับตำแหน่งให้สูงขึ้น
+            def draw_action_text(screen):
+                font = get_font(24)
+                text_surface = render_text(font, self.action_text, True, (255, 255, 255))
+                return screen.blit(text_surface, (screen_x, screen_y - 40))  # ปรับตำแหน่งให้สูงขึ้น
+            render_queue.submit_draw(depth, draw_action_text)
 
         # วาด HP Bar ข้างๆ ยูนิต
         hp_bar_x = screen_x
         hp_bar_y = screen_y - 10 * camera.zoom  # ปรับตำแหน่ง HP Bar ให้อยู่ด้านบนของยูนิต
-        self.draw_hp_bar(screen, hp_bar_x, hp_bar_y, self.max_hp, self.current_hp, camera.zoom)  # ส่งค่าซูมไปยังฟังก์ชัน
-        self.draw_attackable_targets(screen, iso_map, camera, config)
+        self.queue_hp_bar(render_queue, hp_bar_x, hp_bar_y, camera.zoom)  # ส่งค่าซูมไปยังฟังก์ชัน
+
+        # วาดกรอบ tile ที่โจมตีได้บนพื้น ใต้ภาพของเป้าหมาย
+        for target in self.targets:
+            if self.is_in_range(target):
+                target_depth = RenderQueue.depth_key(int(target.x), int(target.y), RenderQueue.LAYER_GROUND)
+                render_queue.submit_draw(target_depth, lambda screen, target=target: self.draw_target_highlight(screen, target, iso_map, camera, config))
+
+    @staticmethod
+    def preload_assets():
+        """โหลดทรัพยากรของยูนิตทุกประเภทไว้ล่วงหน้า เพื่อให้การสร้างยูนิตไม่ต้องอ่านไฟล์จากดิสก์"""
+        for unit_type in UnitType:
+            for path in UNIT_IDLE_SHEETS[unit_type] + UNIT_ATTACK_SHEETS[unit_type]:
+                assets.get_frames(path)
+            sound_bank.register(UNIT_ATTACK_SOUNDS[unit_type], max_instances=2)
+        assets.get_image(UNIT_INFO_BACKGROUND, alpha=False)
 
     def load_attack_animation(self):
-        """โหลดแอนิเมชันการโจมตีตามประเภทของยูนิตและเจ้าของ"""
-        if self.unit_type == UnitType.SOLDIER:
-            if self.owner == 0:  # ผู้เล่น 1
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/unit1_attack_blue.png", frame_width=32, frame_height=32)
-            else:  # ผู้เล่น 2
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/unit1_attack_red.png", frame_width=32, frame_height=32)
-        elif self.unit_type == UnitType.ARCHER:
-            if self.owner == 0:  # ผู้เล่น 1
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/unit2_attack_blue.png", frame_width=32, frame_height=32)
-            else:  # ผู้เล่น 2
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/unit2_attack_red.png", frame_width=32, frame_height=32)
-        elif self.unit_type == UnitType.MAGE:
-            if self.owner == 0:  # ผู้เล่น 1
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/Blue-mage-attack.png", frame_width=32, frame_height=32)
-            else:  # ผู้เล่น 2
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/red-mage-attack.png", frame_width=32, frame_height=32)
-        elif self.unit_type == UnitType.CAVALRY:
-            if self.owner == 0:  # ผู้เล่น 1
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/House-blue-attack.png", frame_width=32, frame_height=32)
-            else:  # ผู้เล่น 2
-                return SpriteSheetLoader.load_sprite_sheet("assets/sprites/House-red-attack.png", frame_width=32, frame_height=32)
-        return []
+        """ดึงแอนิเมชันการโจมตีตามประเภทของยูนิตและเจ้าของ (ผู้เล่น 1 = 0, ผู้เล่น 2 = อื่น ๆ)"""
+        sheets = UNIT_ATTACK_SHEETS.get(self.unit_type)
+        if sheets is None:
+            return []
+        return assets.get_frames(sheets[0] if self.owner == 0 else sheets[1])
     
     def load_attack_sound(self):
-        """โหลดเสียงโจมตีตามประเภทของยูนิต"""
-        if self.unit_type == UnitType.SOLDIER:
-            self.attack_sound = pygame.mixer.Sound("sound/sword.wav")
-        elif self.unit_type == UnitType.ARCHER:
-            self.attack_sound = pygame.mixer.Sound("sound/arrow.wav")
-        elif self.unit_type == UnitType.MAGE:
-            self.attack_sound = pygame.mixer.Sound("sound/magic.wav")
-        elif self.unit_type == UnitType.CAVALRY:
-            self.attack_sound = pygame.mixer.Sound("sound/spear.wav")
+        """กำหนดเสียงโจมตีตามประเภทของยูนิต (เก็บเป็นพาธใน SoundBank ที่ใช้ร่วมกัน)"""
+        self.attack_sound = UNIT_ATTACK_SOUNDS.get(self.unit_type)
 
     def play_attack_sound(self):
         """เล่นเสียงโจมตีถ้ามีการโหลดเสียงแล้ว"""
         if self.attack_sound:
-            self.attack_sound.play()
+            sound_bank.play(self.attack_sound)  # จำกัดจำนวนเสียงที่เล่นซ้อนกันผ่าน SoundBank
 
     def attack(self, target, game):
         """โจมตีเป้าหมาย"""
@@ -362,29 +386,35 @@ class Unit:
         return distance <= self.attack_range
     
     def draw_attackable_targets(self, screen, iso_map, camera, config):
-        """วาด highlight สำหรับ tile ที่สามารถโจมตีได้"""
+        """วาด highlight สำหรับ tile ที่สามารถโจมตีได้ และคืนค่าพื้นที่ที่ถูกวาด"""
+        rects = []
         for target in self.targets:
             if self.is_in_range(target):
-                # แปลงพิกัดเป้าหมายเป็นพิกัด tile
-                tile_x, tile_y = int(target.x), int(target.y)
-            
-                # แปลงพิกัด tile เป็นพิกัดไอโซเมตริก
-                iso_x, iso_y = iso_map.cart_to_iso(tile_x, tile_y)
-                screen_x = iso_x * camera.zoom + config.OFFSET_X + camera.position.x
-                screen_y = iso_y * camera.zoom + config.OFFSET_Y + camera.position.y
-
-                # กำหนดจุดสำหรับวาดกรอบรูปสี่เหลี่ยมข้าวหลามตัด
-                points = [
-                    (screen_x, screen_y + (config.TILE_HEIGHT * camera.zoom) // 2),
-                    (screen_x + (config.TILE_WIDTH * camera.zoom) // 2, screen_y),
-                    (screen_x + (config.TILE_WIDTH * camera.zoom), 
-                     screen_y + (config.TILE_HEIGHT * camera.zoom) // 2),
-                    (screen_x + (config.TILE_WIDTH * camera.zoom) // 2, 
-                     screen_y + (config.TILE_HEIGHT * camera.zoom))
-                ]
-
-                # วาดกรอบ
-                pygame.draw.lines(screen, (255, 0, 0), True, points, 3)  # สีแดง ความหนา 3 พิกเซล
+                rects.append(self.draw_target_highlight(screen, target, iso_map, camera, config))
+        return rects
+
+    def draw_target_highlight(self, screen, target, iso_map, camera, config):
+        """วาดกรอบสีแดงรอบ tile ของเป้าหมายหนึ่งตัว"""
+        # แปลงพิกัดเป้าหมายเป็นพิกัด tile
+        tile_x, tile_y = int(target.x), int(target.y)
+    
+        # แปลงพิกัด tile เป็นพิกัดไอโซเมตริก
+        iso_x, iso_y = iso_map.cart_to_iso(tile_x, tile_y)
+        screen_x = iso_x * camera.zoom + config.OFFSET_X + camera.position.x
+        screen_y = iso_y * camera.zoom + config.OFFSET_Y + camera.position.y
+
+        # กำหนดจุดสำหรับวาดกรอบรูปสี่เหลี่ยมข้าวหลามตัด
+        points = [
+            (screen_x, screen_y + (config.TILE_HEIGHT * camera.zoom) // 2),
+            (screen_x + (config.TILE_WIDTH * camera.zoom) // 2, screen_y),
+            (screen_x + (config.TILE_WIDTH * camera.zoom), 
+             screen_y + (config.TILE_HEIGHT * camera.zoom) // 2),
+            (screen_x + (config.TILE_WIDTH * camera.zoom) // 2, 
+             screen_y + (config.TILE_HEIGHT * camera.zoom))
+        ]
+
+        # วาดกรอบ
+        return pygame.draw.lines(screen, (255, 0, 0), True, points, 3)  # สีแดง ความหนา 3 พิกเซล
 
 
     def update_targets(self, all_units, boss, monsters):
@@ -0,0 +1,231 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import pygame
+
+BUNDLE_PATH = "assets/assets.bundle"
+
+# โฟลเดอร์และไฟล์ภาพที่ถูกรวมไว้ใน bundle (ภาพทั้งหมดที่ SpriteSheetLoader และ AssetManager ใช้)
+BUNDLE_IMAGE_SOURCES = (
+    "assets/sprites",
+    "assets/Monster",
+    "assets/BG",
+    "assets/crystal_mine_nocap.png",
+)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# โครงสร้างไฟล์: magic, เวอร์ชัน, ความยาวของดัชนี (JSON) แล้วตามด้วยข้อมูลดิบที่จัดแนวทุก 16 ไบต์
+# (offset ในดัชนีนับจากจุดเริ่มของข้อมูลดิบ)
+MAGIC = b"GBDL"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+ALIGN = 16
+
+
+def _key(path: str) -> str:
+    """แปลงพาธให้อยู่ในรูปแบบเดียวกันสำหรับใช้เป็น key"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _data_start(index_length: int) -> int:
+    """ตำแหน่งเริ่มของข้อมูลดิบ (ต่อจากดัชนี จัดแนวทุก ALIGN ไบต์)"""
+    start = HEADER.size + index_length
+    return start + (-start % ALIGN)
+
+
+def _source_stamp(path: str):
+    """ขนาดและเวลาแก้ไขของไฟล์ต้นฉบับ ใช้ตรวจสอบว่าข้อมูลใน bundle เก่าหรือไม่"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class AssetBundle:
+    """
+    ไฟล์ bundle ของภาพและเสียงที่ถอดรหัสไว้แล้ว
+    - ภาพเก็บเป็นพิกเซล RGBA ดิบ เสียงเก็บเป็น PCM ดิบ ตามรูปแบบของ mixer ตอนสร้าง bundle
+    - เปิดไฟล์ด้วย mmap และสร้าง surface ด้วย pygame.image.frombuffer จึงไม่ต้องถอดรหัส PNG/JPG ตอนเริ่มเกม
+    - ถ้าไฟล์ต้นฉบับถูกแก้ไขหลังสร้าง bundle (ขนาดหรือเวลาแก้ไขไม่ตรง) จะคืนค่า None ให้โหลดจากไฟล์แทน
+    """
+    def __init__(self, path: str = BUNDLE_PATH):
+        """
+        :param path: พาธของไฟล์ bundle
+        """
+        self.path = path
+        self._mmap = None
+        self._view = None
+        self._data_start = 0
+        self._entries = None  # key -> ข้อมูลของรายการ (dict จากดัชนี)
+        self._mixer = None  # (ความถี่, รูปแบบ, จำนวนช่อง) ของ mixer ตอนสร้าง bundle
+
+    def _open(self):
+        """เปิด bundle ครั้งแรกที่ถูกใช้ (ไม่มีไฟล์หรือไฟล์เสียหาย = bundle ว่าง)"""
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_length = HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                data.close()
+                return
+            index = json.loads(data[HEADER.size:HEADER.size + index_length].decode("utf-8"))
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Unable to open asset bundle: {self.path} ({e})")
+            return
+        self._mmap = data
+        self._view = memoryview(data)
+        self._data_start = _data_start(index_length)
+        self._mixer = tuple(index["mixer"]) if index.get("mixer") else None
+        self._entries = index["entries"]
+
+    def _entry(self, path: str, kind: str):
+        """ค้นหารายการใน bundle ที่ยังใช้ได้ (ตรงประเภทและไม่เก่ากว่าไฟล์ต้นฉบับ)"""
+        self._open()
+        entry = self._entries.get(_key(path))
+        if entry is None or entry["kind"] != kind:
+            return None
+        if os.path.exists(path):
+            try:
+                if list(_source_stamp(path)) != entry["stamp"]:
+                    return None
+            except OSError:
+                return None
+        return entry
+
+    def _blob(self, entry):
+        """ข้อมูลดิบของรายการ (memoryview ของ mmap ไม่มีการคัดลอก)"""
+        start = self._data_start + entry["offset"]
+        return self._view[start:start + entry["length"]]
+
+    def get_image(self, path: str):
+        """
+        สร้างภาพจากพิกเซลใน bundle (ยังไม่ได้ convert)
+
+        :param path: พาธของไฟล์ภาพต้นฉบับ
+        :return: pygame.Surface หรือ None ถ้าไม่มีใน bundle หรือข้อมูลเก่า
+        """
+        entry = self._entry(path, "image")
+        if entry is None:
+            return None
+        return pygame.image.frombuffer(self._blob(entry), (entry["width"], entry["height"]), "RGBA")
+
+    def get_sound(self, path: str):
+        """
+        สร้างเสียงจาก PCM ใน bundle
+
+        :param path: พาธของไฟล์เสียงต้นฉบับ
+        :return: pygame.mixer.Sound หรือ None ถ้าไม่มีใน bundle ข้อมูลเก่า หรือ mixer ใช้รูปแบบอื่น
+        """
+        entry = self._entry(path, "sound")
+        if entry is None or self._mixer != pygame.mixer.get_init():
+            return None
+        return pygame.mixer.Sound(buffer=self._blob(entry))
+
+    def __contains__(self, path: str) -> bool:
+        self._open()
+        return _key(path) in self._entries
+
+
+def collect_sources():
+    """
+    รายชื่อไฟล์ภาพและเสียงที่ต้องรวมไว้ใน bundle
+
+    :return: (รายการไฟล์ภาพ, รายการไฟล์เสียง)
+    """
+    from .Unit import UNIT_ATTACK_SOUNDS
+    from .game import Game
+
+    images = []
+    for source in BUNDLE_IMAGE_SOURCES:
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    images.append(os.path.join(source, name))
+        elif os.path.isfile(source):
+            images.append(source)
+    sounds = list(UNIT_ATTACK_SOUNDS.values()) + [Game.BOSS_SPAWN_SOUND]
+    return images, sounds
+
+
+def build_bundle(path: str = BUNDLE_PATH, images=None, sounds=None):
+    """
+    ถอดรหัสภาพและเสียงทั้งหมดแล้วเขียนลงไฟล์ bundle (ขั้นตอน offline)
+
+    :param path: พาธของไฟล์ bundle ที่ต้องการสร้าง
+    :param images: รายการไฟล์ภาพ (None = ใช้ collect_sources())
+    :param sounds: รายการไฟล์เสียง (None = ใช้ collect_sources())
+    :return: จำนวนรายการที่เขียนลง bundle
+    """
+    if images is None or sounds is None:
+        default_images, default_sounds = collect_sources()
+        images = default_images if images is None else images
+        sounds = default_sounds if sounds is None else sounds
+
+    # PCM ดิบต้องตรงกับรูปแบบของ mixer ตอนเล่น จึงใช้ค่าเริ่มต้นเดียวกับเกม
+    if sounds and not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+    entries = {}
+    blobs = []
+    offset = 0
+    for kind, paths in (("image", images), ("sound", sounds)):
+        for source in paths:
+            try:
+                if kind == "image":
+                    image = pygame.image.load(source)
+                    blob = pygame.image.tobytes(image, "RGBA")
+                    entry = {"width": image.get_width(), "height": image.get_height()}
+                else:
+                    blob = pygame.mixer.Sound(source).get_raw()
+                    entry = {}
+            except (pygame.error, OSError) as e:
+                print(f"Skipping {source}: {e}")
+                continue
+            entry.update(kind=kind, stamp=list(_source_stamp(source)), offset=offset, length=len(blob))
+            entries[_key(source)] = entry
+            blobs.append(blob)
+            offset += len(blob) + (-len(blob) % ALIGN)
+
+    index = {"mixer": list(pygame.mixer.get_init() or ()), "entries": entries}
+    index_bytes = json.dumps(index).encode("utf-8")
+    data_start = _data_start(len(index_bytes))
+
+    # เขียนลงไฟล์ชั่วคราวก่อน แล้วค่อยแทนที่ เพื่อไม่ให้เกมที่เปิดอยู่อ่านไฟล์ที่เขียนไม่เสร็จ
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(b"\0" * (data_start - HEADER.size - len(index_bytes)))
+        for blob in blobs:
+            f.write(blob)
+            f.write(b"\0" * (-len(blob) % ALIGN))
+    os.replace(temp_path, path)
+    return len(entries)
+
+
+# ใช้ร่วมกันทั้งเกม
+asset_bundle = AssetBundle()
+
+
+def load_image(path: str):
+    """โหลดภาพจาก bundle ถ้ามีและยังใหม่อยู่ ไม่เช่นนั้นถอดรหัสจากไฟล์ (ยังไม่ได้ convert)"""
+    image = asset_bundle.get_image(path)
+    return image if image is not None else pygame.image.load(path)
+
+
+def load_sound(path: str):
+    """โหลดเสียงจาก bundle ถ้ามีและยังใหม่อยู่ ไม่เช่นนั้นถอดรหัสจากไฟล์"""
+    sound = asset_bundle.get_sound(path)
+    return sound if sound is not None else pygame.mixer.Sound(path)
+
+
+if __name__ == "__main__":
+    # สร้าง bundle: python -m game.asset_bundle [พาธของ bundle]
+    output = sys.argv[1] if len(sys.argv) > 1 else BUNDLE_PATH
+    count = build_bundle(output)
+    print(f"Wrote {count} assets to {output} ({os.path.getsize(output) // 1024} KB)")
@@ -0,0 +1,109 @@
+import os
+from .SpriteSheetLoader import SpriteSheetLoader
+from .asset_bundle import load_image, load_sound
+from .sprite_atlas import sprite_atlas
+from .font_cache import DEFAULT_FONT_PATH, font_registry
+
+
+class AssetManager:
+    """
+    จุดโหลดทรัพยากรกลางของเกม (ภาพ เฟรมแอนิเมชัน ฟอนต์ และเสียง)
+    - โหลดแต่ละไฟล์จากดิสก์เพียงครั้งเดียว แล้วแจกจ่ายออบเจกต์เดียวกันให้ทุกที่ที่ใช้
+    - ภาพและเฟรมที่ได้เป็นของใช้ร่วมกัน ห้ามแก้ไขโดยตรง (เช่น set_alpha หรือ set_colorkey)
+    - รายงานการใช้หน่วยความจำโดยประมาณของทรัพยากรที่โหลดไว้
+    """
+    def __init__(self):
+        self._images = {}  # (พาธ, alpha) -> pygame.Surface
+        self._frames = {}  # (พาธ, กว้าง, สูง, color_key) -> tuple ของเฟรม
+        self._sounds = {}  # พาธ -> pygame.mixer.Sound
+        self._sound_bytes = {}  # พาธ -> ขนาดข้อมูลเสียง (ไบต์)
+
+    @staticmethod
+    def _key(path: str) -> str:
+        """แปลงพาธให้อยู่ในรูปแบบเดียวกันสำหรับใช้เป็น key"""
+        return os.path.normcase(os.path.normpath(path))
+
+    def get_image(self, path: str, alpha: bool = True):
+        """
+        ดึงภาพ (ภาพที่มีค่า alpha ใช้จาก sprite atlas ถ้ามี)
+
+        :param path: พาธของไฟล์ภาพ
+        :param alpha: True = convert_alpha(), False = convert() สำหรับภาพพื้นหลังทึบ
+        :return: pygame.Surface ที่ใช้ร่วมกัน
+        """
+        key = (self._key(path), alpha)
+        image = self._images.get(key)
+        if image is None:
+            if alpha:
+                image = SpriteSheetLoader.load_image(path)
+            else:
+                image = load_image(path).convert()
+            self._images[key] = image
+        return image
+
+    def get_frames(self, path: str, frame_width: int = 32, frame_height: int = 32, color_key=None):
+        """
+        ดึงเฟรมแอนิเมชันจาก sprite sheet
+
+        :param path: พาธของไฟล์ sprite sheet
+        :param frame_width: ความกว้างของแต่ละเฟรม
+        :param frame_height: ความสูงของแต่ละเฟรม
+        :param color_key: สีที่ต้องการให้โปร่งใส (ถ้ามี)
+        :return: tuple ของ pygame.Surface ที่ใช้ร่วมกัน
+        """
+        key = (self._key(path), frame_width, frame_height, tuple(color_key) if color_key else None)
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = tuple(SpriteSheetLoader.load_sprite_sheet(path, frame_width, frame_height, color_key))
+            self._frames[key] = frames
+        return frames
+
+    @staticmethod
+    def get_font(size: int, path: str = DEFAULT_FONT_PATH):
+        """ดึงฟอนต์จากทะเบียนฟอนต์ที่ใช้ร่วมกัน"""
+        return font_registry.get(size, path)
+
+    def get_sound(self, path: str):
+        """
+        ดึงเสียง (ต้องเรียก pygame.mixer.init() ก่อน)
+
+        :param path: พาธของไฟล์เสียง
+        :return: pygame.mixer.Sound ที่ใช้ร่วมกัน
+        """
+        key = self._key(path)
+        sound = self._sounds.get(key)
+        if sound is None:
+            sound = load_sound(path)
+            self._sounds[key] = sound
+            self._sound_bytes[key] = len(sound.get_raw())
+        return sound
+
+    def memory_usage(self) -> dict:
+        """
+        หน่วยความจำโดยประมาณของทรัพยากรที่โหลดไว้
+
+        :return: dict ของจำนวนไบต์แยกตามประเภท ('atlas', 'images', 'sounds', 'total')
+        """
+        atlas_bytes = sum(page.get_width() * page.get_height() * page.get_bytesize()
+                          for page in sprite_atlas.pages)
+        # ภาพที่เป็น subsurface ของ atlas หรือของภาพอื่นไม่ได้ใช้หน่วยความจำเพิ่ม
+        image_bytes = sum(image.get_width() * image.get_height() * image.get_bytesize()
+                          for image in self._images.values() if image.get_parent() is None)
+        sound_bytes = sum(self._sound_bytes.values())
+        return {
+            'atlas': atlas_bytes,
+            'images': image_bytes,
+            'sounds': sound_bytes,
+            'total': atlas_bytes + image_bytes + sound_bytes,
+        }
+
+    def clear(self):
+        """ล้างทรัพยากรทั้งหมดที่โหลดไว้"""
+        self._images.clear()
+        self._frames.clear()
+        self._sounds.clear()
+        self._sound_bytes.clear()
+
+
+# ใช้ร่วมกันทั้งเกม
+assets = AssetManager()
@@ -15,6 +15,12 @@ class Camera:
                             -self.boundary.width)
         self.position.y = max(min(self.position.y + dy, self.boundary.height), 
                         -self.boundary.height)
+
+    def center_on(self, iso_x: float, iso_y: float):
+        """เลื่อนกล้องให้ตำแหน่ง isometric ที่กำหนดอยู่กึ่งกลางหน้าจอ (ภายในขอบเขตการเคลื่อนที่)"""
+        target_x = self.config.SCREEN_WIDTH / 2 - self.config.OFFSET_X - iso_x * self.zoom
+        target_y = self.config.SCREEN_HEIGHT / 2 - self.config.OFFSET_Y - iso_y * self.zoom
+        self.move(target_x - self.position.x, target_y - self.position.y)
     
     def handle_input(self, keys, events):
         """จัดการอินพุตจากแป้นพิมพ์และล้อเมาส์สำหรับการเคลื่อนที่และการซูมกล้อง"""
@@ -0,0 +1,46 @@
+import pygame
+
+
+class DirtyRectTracker:
+    """
+    เก็บพื้นที่บนหน้าจอที่ถูกวาดในแต่ละเฟรม
+    - เมื่อเปิดใช้งาน จะอัปเดตหน้าจอเฉพาะพื้นที่ที่เปลี่ยนด้วย pygame.display.update(rects)
+    - รวมพื้นที่ของเฟรมก่อนหน้าด้วย เพื่อลบภาพเก่าที่ย้ายที่หรือหายไป
+    - ถ้าทั้งหน้าจอเปลี่ยน (เช่น กล้องขยับ) จะใช้ pygame.display.flip() ตามปกติ
+    """
+    def __init__(self, enabled: bool = False):
+        """
+        :param enabled: เปิดโหมด dirty rectangle หรือไม่
+        """
+        self.enabled = enabled
+        self._rects = []
+        self._previous_rects = []
+        self._full_redraw = True
+
+    def add(self, rects):
+        """
+        บันทึกพื้นที่ที่ถูกวาด
+
+        :param rects: pygame.Rect, รายการของ Rect หรือ None
+        """
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self._rects.append(rects)
+        else:
+            self._rects.extend(rect for rect in rects if rect is not None)
+
+    def invalidate(self):
+        """บังคับให้อัปเดตทั้งหน้าจอในเฟรมนี้"""
+        self._full_redraw = True
+
+    def present(self):
+        """แสดงผลเฟรมปัจจุบันบนหน้าจอ แล้วเริ่มเก็บพื้นที่ของเฟรมถัดไป"""
+        if not self.enabled or self._full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._previous_rects + self._rects)
+
+        self._previous_rects = self._rects
+        self._rects = []
+        self._full_redraw = False
@@ -0,0 +1,119 @@
+import sys
+from array import array
+
+UNREACHABLE = -1  # ค่าระยะทางของช่องที่ไปไม่ถึงเป้าหมายใดเลย
+
+
+class FlowField:
+    """
+    สนามระยะทาง (distance field) จากทุกช่องไปยังเป้าหมายที่ใกล้ที่สุด สำหรับให้มอนสเตอร์จำนวนมากเดินตาม
+    - คำนวณด้วย BFS แบบหลายจุดเริ่ม (multi-source) ครั้งเดียวต่อเทิร์น ทีละระดับทั้งแผนที่พร้อมกัน:
+      มองตารางช่องที่เดินได้ (1 byte ต่อช่อง) เป็นจำนวนเต็มขนาดใหญ่ แล้วเลื่อน (shift) frontier ไปทั้ง 8 ทิศ
+      และ AND กับช่องที่ยังไม่ถูกเยี่ยม ทุกระดับจึงเป็นการคำนวณระดับ byte ใน C ไม่ใช่ลูป Python ทีละช่อง
+    - ระยะทางนับเป็นจำนวนก้าว (เดินได้ 8 ทิศทางเหมือน PathFinder และเดินได้หนึ่งช่องต่อเทิร์น)
+    - มอนสเตอร์แต่ละตัวเลือกช่องข้างเคียงที่ระยะทางน้อยลง (เดินลงเนิน) ใช้เวลาคงที่ไม่ขึ้นกับจำนวนมอนสเตอร์
+    """
+    def __init__(self, grid, directions):
+        """
+        :param grid: WalkabilityGrid ของแผนที่
+        :param directions: ทิศทางที่เดินได้ [(dx, dy), ...] (ลำดับนี้ใช้ตัดสินเมื่อระยะทางเท่ากัน)
+        """
+        self.grid = grid
+        self.directions = directions
+        width = grid.width
+        # (จำนวนบิตที่เลื่อน, mask ของคอลัมน์ปลายทางที่ไม่ล้นข้ามขอบซ้าย/ขวาของแถว) ของแต่ละทิศ
+        self._shifts = [((dy * width + dx) * 8,
+                         int.from_bytes(bytes(1 if 0 <= x - dx < width else 0 for x in range(width)) * grid.height,
+                                        'little'))
+                        for dx, dy in directions]
+        self.distance = array('i', [UNREACHABLE]) * (width * grid.height)
+        self.goals = ()
+        self.version = None  # version ของ grid ตอนคำนวณ (None = ยังไม่ได้คำนวณ)
+
+    def build(self, goals):
+        """
+        คำนวณระยะทางจากทุกช่องไปยังเป้าหมายที่ใกล้ที่สุด
+
+        :param goals: ตำแหน่งของเป้าหมาย [(x, y), ...] เช่น ยูนิตของผู้เล่น
+        """
+        grid = self.grid
+        width = grid.width
+        size = width * grid.height
+
+        # byte ที่ i ของจำนวนเต็มแต่ละตัวคือช่อง index i (ค่า 0 หรือ 1)
+        goal_cells = bytearray(size)
+        for x, y in goals:
+            if grid.in_bounds(x, y):
+                goal_cells[y * width + x] = 1
+        frontier = int.from_bytes(goal_cells, 'little')
+        unvisited = int.from_bytes(grid.cells, 'little') & ~frontier
+        reached = frontier
+        # ระยะทางแยกเป็น 3 ระนาบ byte (บิต 0-7, 8-15, 16-23) เพื่อให้คูณ mask ด้วยค่า byte ได้โดยไม่ทด
+        planes = [0, 0, 0]
+
+        # ขยายทีละระดับ: ทุกช่องใน frontier มีระยะทางเท่ากัน จึงไม่ต้องใช้คิวลำดับความสำคัญ
+        level = 0
+        while frontier:
+            level += 1
+            spread = 0
+            for shift, columns in self._shifts:
+                spread |= (frontier << shift if shift > 0 else frontier >> -shift) & columns
+            frontier = spread & unvisited
+            unvisited ^= frontier
+            reached |= frontier
+            for plane in range(3):
+                value = (level >> (plane * 8)) & 0xFF
+                if value:
+                    planes[plane] |= frontier * value
+
+        # ช่องที่ไปไม่ถึงได้ทุก byte เป็น 0xFF ซึ่งก็คือ UNREACHABLE (-1)
+        unreached = (int.from_bytes(b'\x01' * size, 'little') ^ reached) * 0xFF
+        parts = [(plane | unreached).to_bytes(size, 'little') for plane in planes]
+        parts.append(unreached.to_bytes(size, 'little'))
+        if sys.byteorder == 'big':
+            parts.reverse()
+        packed = bytearray(size * 4)
+        for offset, part in enumerate(parts):
+            packed[offset::4] = part
+        distance = array('i')
+        distance.frombytes(packed)
+
+        self.distance = distance
+        self.goals = tuple(goals)
+        self.version = grid.version
+
+    def is_stale(self, goals) -> bool:
+        """True ถ้ายังไม่เคยคำนวณ เป้าหมายเปลี่ยน หรือช่องที่เดินได้เปลี่ยนหลังการคำนวณครั้งล่าสุด"""
+        return self.version != self.grid.version or self.goals != tuple(goals)
+
+    def distance_at(self, x: int, y: int) -> int:
+        """ระยะทาง (จำนวนก้าว) จาก (x, y) ถึงเป้าหมายที่ใกล้ที่สุด หรือ UNREACHABLE"""
+        if not self.grid.in_bounds(x, y):
+            return UNREACHABLE
+        return self.distance[y * self.grid.width + x]
+
+    def next_step(self, x: int, y: int, occupied=()):
+        """
+        ช่องถัดไปที่เข้าใกล้เป้าหมาย (ไม่เดินทับเป้าหมายหรือช่องที่มีตัวอื่นอยู่)
+
+        :param x: ตำแหน่ง X ปัจจุบัน
+        :param y: ตำแหน่ง Y ปัจจุบัน
+        :param occupied: ตำแหน่งที่ถูกครอบครองแล้ว (set ของ (x, y))
+        :return: (x, y) ของช่องถัดไป หรือ None ถ้าไม่มีช่องที่ใกล้กว่า (ถึงแล้ว ถูกล้อม หรือไปไม่ถึง)
+        """
+        width = self.grid.width
+        current = self.distance_at(x, y)
+        if current == UNREACHABLE:
+            return None
+        best = None
+        best_distance = current
+        for dx, dy in self.directions:
+            new_x, new_y = x + dx, y + dy
+            if not (0 <= new_x < width and 0 <= new_y < self.grid.height):
+                continue
+            distance = self.distance[new_y * width + new_x]
+            # ระยะ 0 คือช่องของเป้าหมายเอง หยุดอยู่ข้างๆ แทนการเดินทับ
+            if 0 < distance < best_distance and (new_x, new_y) not in occupied:
+                best = (new_x, new_y)
+                best_distance = distance
+        return best
@@ -0,0 +1,88 @@
+import os
+import pygame
+from collections import OrderedDict
+
+DEFAULT_FONT_PATH = "assets/Fonts/PixgamerRegular-OVD6A.ttf"
+
+
+class FontRegistry:
+    """
+    ทะเบียนฟอนต์ที่โหลดแล้ว
+    - โหลดฟอนต์แต่ละ (path, ขนาด) จากไฟล์เพียงครั้งเดียว
+    """
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, size: int, path: str = DEFAULT_FONT_PATH):
+        """
+        ดึงฟอนต์ตามขนาดและไฟล์ที่กำหนด
+
+        :param size: ขนาดฟอนต์
+        :param path: พาธไปยังไฟล์ฟอนต์ (None = ฟอนต์เริ่มต้นของ pygame)
+        :return: pygame.font.Font
+        """
+        key = (os.path.normpath(path) if path else None, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        """ล้างฟอนต์ทั้งหมดที่โหลดไว้"""
+        self._fonts.clear()
+
+
+class TextCache:
+    """
+    แคชภาพข้อความที่ render แล้ว
+    - key คือ (ฟอนต์, ข้อความ, สี, antialias)
+    - ลบรายการที่ไม่ได้ใช้นานที่สุด (LRU) เมื่อเกินจำนวนที่กำหนด
+    """
+    def __init__(self, max_size: int = 256):
+        """
+        :param max_size: จำนวนภาพข้อความสูงสุดที่เก็บในแคช
+        """
+        self.max_size = max_size
+        self._cache = OrderedDict()
+
+    def render(self, font, text: str, antialias: bool, color):
+        """
+        ดึงภาพข้อความจากแคช หรือ render ใหม่ถ้ายังไม่มี (ลำดับอาร์กิวเมนต์เหมือน Font.render)
+
+        :param font: ฟอนต์ที่ใช้ render
+        :param text: ข้อความ
+        :param antialias: เปิดการทำ antialias หรือไม่
+        :param color: สีของข้อความ
+        :return: pygame.Surface ของข้อความ
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self._cache[key] = surface
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """ล้างแคชทั้งหมด"""
+        self._cache.clear()
+
+
+# ใช้ร่วมกันทั้งเกม
+font_registry = FontRegistry()
+text_cache = TextCache()
+
+
+def get_font(size: int, path: str = DEFAULT_FONT_PATH):
+    """ดึงฟอนต์จากทะเบียนฟอนต์ที่ใช้ร่วมกัน"""
+    return font_registry.get(size, path)
+
+
+def render_text(font, text: str, antialias: bool, color):
+    """ดึงภาพข้อความจากแคชที่ใช้ร่วมกัน"""
+    return text_cache.render(font, text, antialias, color)
@@ -0,0 +1,83 @@
+import pygame
+from collections import OrderedDict
+from .tile_cache import quantize_zoom
+
+
+class ScaledFrameCache:
+    """
+    แคชเฟรมแอนิเมชันที่ถูกปรับขนาดตามระดับการซูม
+    - key คือ (เฟรมต้นฉบับ, ระดับการซูมที่ปัดแล้ว)
+    - จำกัดขนาดตามหน่วยความจำรวมของภาพ และลบรายการที่ไม่ได้ใช้นานที่สุด (LRU) เมื่อเกิน
+    - นับจำนวนครั้งที่พบ (hits) และไม่พบ (misses) ในแคช
+    """
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, precision: int = 100):
+        """
+        :param max_bytes: หน่วยความจำสูงสุดของภาพในแคช (ไบต์)
+        :param precision: จำนวนขั้นของการซูมต่อ 1.0
+        """
+        self.max_bytes = max_bytes
+        self.precision = precision
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def _surface_bytes(surface) -> int:
+        """ขนาดหน่วยความจำของภาพโดยประมาณ"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get_frame(self, frame, zoom: float):
+        """
+        ดึงเฟรมที่ปรับขนาดตามการซูมแล้ว (ปรับขนาดครั้งเดียวต่อเฟรมต่อระดับการซูม)
+
+        :param frame: pygame.Surface ของเฟรมต้นฉบับ
+        :param zoom: ระดับการซูมปัจจุบัน
+        :return: pygame.Surface ที่ปรับขนาดแล้ว
+        """
+        zoom_key = quantize_zoom(zoom, self.precision)
+        if zoom_key == self.precision:
+            # ซูม 1.0 ใช้เฟรมต้นฉบับได้เลย
+            self.hits += 1
+            return frame
+
+        key = (frame, zoom_key)
+        scaled = self._cache.get(key)
+        if scaled is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return scaled
+
+        self.misses += 1
+        scaled_zoom = zoom_key / self.precision
+        scaled = pygame.transform.scale(frame, (int(frame.get_width() * scaled_zoom),
+                                                int(frame.get_height() * scaled_zoom)))
+        self._cache[key] = scaled
+        self.used_bytes += self._surface_bytes(scaled)
+
+        # ลบเฟรมที่ไม่ได้ใช้นานที่สุดเมื่อเกินหน่วยความจำที่กำหนด (เก็บเฟรมล่าสุดไว้เสมอ)
+        while self.used_bytes > self.max_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self.used_bytes -= self._surface_bytes(evicted)
+        return scaled
+
+    def hit_rate(self) -> float:
+        """สัดส่วนการพบในแคช (0.0 - 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """ล้างแคชและตัวนับทั้งหมด"""
+        self._cache.clear()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+# ใช้ร่วมกันทั้งเกม
+frame_cache = ScaledFrameCache()
+
+
+def get_scaled_frame(frame, zoom: float):
+    """ดึงเฟรมที่ปรับขนาดแล้วจากแคชที่ใช้ร่วมกัน"""
+    return frame_cache.get_frame(frame, zoom)
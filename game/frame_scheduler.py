@@ -0,0 +1,54 @@
+import pygame
+
+
+class FrameScheduler:
+    """
+    ควบคุมอัตราเฟรมของลูปหลักตามสถานะของเกม
+    - ขณะมีแอนิเมชัน การเคลื่อนที่ หรือกล้องขยับ จะเดินที่อัตราเฟรมเต็ม
+    - เมื่อไม่มีอะไรเคลื่อนไหวนานเกินกำหนด จะรออินพุตด้วย pygame.event.wait ที่อัตราเฟรมต่ำ
+    - เมื่อมีอินพุตเข้ามา จะกลับไปใช้อัตราเฟรมเต็มทันที
+    """
+    def __init__(self, clock, active_fps: int, idle_fps: int, idle_delay: int = 500):
+        """
+        :param clock: pygame.time.Clock ของเกม
+        :param active_fps: อัตราเฟรมขณะมีสิ่งเคลื่อนไหว
+        :param idle_fps: อัตราเฟรมขณะไม่มีสิ่งเคลื่อนไหว
+        :param idle_delay: เวลา (มิลลิวินาที) ที่ไม่มีสิ่งเคลื่อนไหวก่อนเข้าสู่โหมดพัก
+        """
+        self.clock = clock
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_delay = idle_delay
+        self.idle = False  # อยู่ในโหมดพักหรือไม่
+        self._last_active_time = pygame.time.get_ticks()
+        self._last_frame_time = self._last_active_time
+
+    def mark_active(self):
+        """แจ้งว่ามีสิ่งเคลื่อนไหว ให้เดินที่อัตราเฟรมเต็ม"""
+        self._last_active_time = pygame.time.get_ticks()
+
+    def tick(self, active: bool) -> float:
+        """
+        รอจนถึงเวลาของเฟรมถัดไป
+
+        :param active: เฟรมนี้มีแอนิเมชันหรือการเคลื่อนไหวหรือไม่
+        :return: เวลาที่ผ่านไปตั้งแต่เฟรมก่อนหน้า (วินาที)
+        """
+        now = pygame.time.get_ticks()
+        if active or pygame.event.peek():
+            self._last_active_time = now
+        self.idle = now - self._last_active_time >= self.idle_delay
+
+        if self.idle:
+            # ไม่มีอะไรเคลื่อนไหว: บล็อกรออินพุตแทนการวนลูปเปล่า
+            timeout = max(1, 1000 // self.idle_fps - (now - self._last_frame_time))
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)  # คืน event เข้าคิวให้ลูปหลักจัดการตามปกติ
+                self.mark_active()
+            delta_time = self.clock.tick()
+        else:
+            delta_time = self.clock.tick(self.active_fps)
+
+        self._last_frame_time = pygame.time.get_ticks()
+        return delta_time / 1000.0
@@ -1,35 +1,77 @@
 import pygame
-import pytmx
 from .game_config import GameConfig
 from .iso_map import IsometricMap
 from .camera import Camera
 from .game_object import GameObject
 from .Unit import Unit
 from .Path import PathFinder
+from .walkability import WalkabilityGrid
+from .flow_field import FlowField, UNREACHABLE
 from .Point import CapturePoint
 import random
 import math
-from .Unit import Unit,UnitType
+from .Unit import Unit,UnitType, UNIT_IDLE_SHEETS
 from .Tower import Tower
 from .monster import Monster
 from .Boss import Boss
+from .tile_cache import ScaledTileCache
+from .map_renderer import MapRenderer
+from .render_queue import RenderQueue
+from .font_cache import get_font, render_text
+from .dirty_rects import DirtyRectTracker
+from .frame_scheduler import FrameScheduler
+from .reachable_overlay import ReachableOverlay
+from .frame_cache import frame_cache
+from .asset_manager import assets
+from .sound_bank import sound_bank, PRIORITY_HIGH
+from .minimap import Minimap
 
 
 class Game:
-    def __init__(self, config: GameConfig):
+    MAP_PATH = "assets/Map1.tmx"
+    BOSS_SPAWN_SOUND = "sound/Boss_spawn.mp3"
+    GAME_OVER_BACKGROUND = "assets/BG/Backgroud.jpg"
+    FONT_SIZES = (20, 24, 28, 32, 36, 48, 72)  # ขนาดฟอนต์ทั้งหมดที่ใช้ในเกม
+
+    def __init__(self, config: GameConfig, preload=None):
+        """
+        :param config: object ที่เก็บการตั้งค่าเกม
+        :param preload: AssetPreloader ที่โหลดแผนที่และทรัพยากรไว้แล้วระหว่างแสดงเมนู (None = โหลดตอนนี้)
+        """
         pygame.init()
         self.config = config
         self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
-        self.iso_map = IsometricMap("assets/Map1.tmx", config)
+        self.frame_scheduler = FrameScheduler(self.clock, config.FPS, config.IDLE_FPS, config.IDLE_DELAY)
+        if preload is not None:
+            # ใช้แผนที่และ chunk ที่ถูกสร้างไว้แล้วใน worker thread
+            preload.wait()
+            self.iso_map = preload.iso_map
+            self.tile_cache = preload.tile_cache
+            self.map_renderer = preload.map_renderer
+            self.walkability = preload.walkability
+            self.path_finder = preload.path_finder
+        else:
+            self.iso_map = IsometricMap(self.MAP_PATH, config)
+            self.tile_cache = ScaledTileCache(self.iso_map.tmx_data, config.TILE_CACHE_SIZE)
+            self.map_renderer = MapRenderer(self.iso_map, self.tile_cache, config, config.MAP_CHUNK_SIZE)
+            self.walkability = WalkabilityGrid.from_map(self.iso_map)  # ตารางช่องที่เดินได้ ใช้ร่วมกันทุกระบบ
+            # ไม่สร้างกราฟระดับบนของ HPA* ล่วงหน้าบน main thread (ต้นทุนภายใน cluster คำนวณเมื่อถูกใช้ครั้งแรก)
+            self.path_finder = self.create_path_finder(self.iso_map, self.walkability, config)
         self.camera = Camera(config, self.iso_map.width, self.iso_map.height)
-        self.debug_font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 24)
-        self.path_finder = PathFinder(self.iso_map)
+        self.render_queue = RenderQueue()
+        self.reachable_overlay = ReachableOverlay(self.iso_map, config)
+        self.dirty_rects = DirtyRectTracker(config.DIRTY_RECTS)
+        self.last_view = None  # ตำแหน่งกล้องและการซูมของเฟรมก่อนหน้า
+        self.debug_font = get_font(24)
+        self.flow_field = FlowField(self.walkability, self.path_finder.directions)  # ทิศทางที่มอนสเตอร์และบอสเดินเข้าหายูนิต
         self.selected_unit = None
         self.selected_tower = None
         self.current_action = None
         self.last_time = pygame.time.get_ticks()
         self.walkable_tiles = []
+        self.reachable_area = None  # ReachableArea ของยูนิตที่เลือก (ต้นทุนและเส้นทางไปยังช่องที่เดินได้)
+        self.visible_tile_range = None  # ช่วง tile ที่มองเห็นบนหน้าจอในเฟรมปัจจุบัน
         self.capture_points = []
         self.player_money = [250, 250]
         self.income_next_turn = [0, 0]  # เงินที่ได้จากจุดยึดครองในเทิร์นถัดไป
@@ -48,8 +90,7 @@ class Game:
         self.monsters = []  # สร้างตัวแปรสำหรับมอนสเตอร์
         self.monster_count = 0  # จำนวนมอนสเตอร์ที่มีอยู่
         self.turns_since_last_spawn = 0  # จำนวนเทิร์นตั้งแต่การเกิดใหม่ครั้งล่าสุด
-        self.boss_spawn_sound = pygame.mixer.Sound("sound/Boss_spawn.mp3")
-        self.boss_spawn_sound.set_volume(0.3)
+        self.boss_spawn_sound = self.BOSS_SPAWN_SOUND
         self.turns_since_last_boss_move = 0  # ตัวแปรใหม่สำหรับติดตามจำนวนเทิร์นที่บอสไม่เคลื่อนที่
 
         self.move_button_animation = {
@@ -83,13 +124,18 @@ class Game:
         self.end_turn_button = pygame.Rect(config.SCREEN_WIDTH - button_width - 10, config.SCREEN_HEIGHT - button_height - 10, button_width, button_height)
         self.move_button = pygame.Rect(self.end_turn_button.x, self.end_turn_button.y - button_height - 10, button_width, button_height)
         self.attack_button = pygame.Rect(self.move_button.x, self.move_button.y - button_height - 10, button_width, button_height)
+        # แผนที่ย่ออยู่มุมซ้ายล่าง เหนือข้อความจำนวนจุดที่ยึดได้
+        minimap_size = config.MINIMAP_SIZE
+        self.minimap = Minimap(self.iso_map, config, (10, self.end_turn_button.top - 50 - minimap_size,
+                                                      minimap_size, minimap_size))
         self.game_over_screen = False  # สถานะการแสดงหน้าจอ Game Over
-        self.game_over_background = pygame.image.load("assets/BG/Backgroud.jpg").convert()  # โหลดพื้นหลัง Game Over
-        self.font = pygame.font.Font("./assets/Fonts/PixgamerRegular-OVD6A.ttf", 28)
+        self.game_over_background = assets.get_image(self.GAME_OVER_BACKGROUND, alpha=False)  # โหลดพื้นหลัง Game Over
+        self.font = get_font(28)
 
         # สร้างยูนิตสำหรับผู้เล่น 1 และ 2
         self.units = []  # ลิสต์สำหรับเก็บยูนิตทั้งหมด
         self.player_units = []  # ลิสต์สำหรับเก็บยูนิตของผู้เล่น
+        self.preload_assets()
         self.create_player_units()
         self.generate_capture_points(5)
 
@@ -180,6 +226,37 @@ class Game:
         if self.current_round <= self.boss_spawn_rounds:
             self.spawn_boss()  # สร้างบอสใหม่ในรอบถัดไป
 
+    @staticmethod
+    def preload_assets():
+        """
+        โหลดทรัพยากรที่ใช้ระหว่างเล่นไว้ล่วงหน้า เพื่อไม่ให้การสร้างยูนิต Tower มอนสเตอร์ หรือบอสต้องอ่านไฟล์
+        (เรียกซ้ำได้ ทรัพยากรที่โหลดแล้วจะถูกดึงจาก AssetManager)
+        """
+        Unit.preload_assets()
+        assets.get_image("assets/sprites/building-blue.png")
+        assets.get_image("assets/sprites/building-red.png")
+        Monster.load_idle_animation()
+        Monster.load_death_animation()
+        Boss.load_idle_animation()
+        assets.get_image(Game.GAME_OVER_BACKGROUND, alpha=False)
+        for size in Game.FONT_SIZES:
+            get_font(size)
+        # เสียงบอสเกิดใช้ช่องเสียงที่จองไว้ จึงไม่ถูกเสียงโจมตีแย่งช่อง
+        sound_bank.register(Game.BOSS_SPAWN_SOUND, PRIORITY_HIGH, max_instances=1, volume=0.3)
+
+    @staticmethod
+    def create_path_finder(iso_map, walkability, config):
+        """
+        สร้าง PathFinder ตามการตั้งค่า (ยังไม่คำนวณกราฟระดับบนของ HPA* ล่วงหน้า)
+
+        :param iso_map: แผนที่ของเกม
+        :param walkability: WalkabilityGrid ของแผนที่
+        :param config: object ที่เก็บการตั้งค่าเกม
+        :return: PathFinder
+        """
+        return PathFinder(iso_map, walkability, config.PATH_CACHE_SIZE,
+                          config.PATHFINDING_MODE, config.HPA_CLUSTER_SIZE)
+
     def create_player_units(self):
         """สร้างยูนิตสำหรับผู้เล่น 1 และ 2"""
         try:
@@ -203,14 +280,12 @@ class Game:
 
             # สร้างยูนิตสำหรับผู้เล่น 1 และ 2
             for player in player_data:
-                unit_idle_spritesheet = pygame.image.load(player["sprite"]).convert_alpha()
-                unit_idle_frames = self.load_idle_frames(unit_idle_spritesheet)
+                unit_idle_frames = assets.get_frames(player["sprite"])
                 soldier_unit = Unit(unit_idle_frames=unit_idle_frames, unit_type=UnitType.SOLDIER, 
                                 x=player["position"][0], y=player["position"][1], 
                                 owner=player["owner"], name=f"{player['unit_name']} Soldier")
 
-                unit_idle_spritesheet_archer = pygame.image.load(player["archer_sprite"]).convert_alpha()
-                unit_idle_frames_archer = self.load_idle_frames(unit_idle_spritesheet_archer)
+                unit_idle_frames_archer = assets.get_frames(player["archer_sprite"])
                 archer_unit = Unit(unit_idle_frames=unit_idle_frames_archer, unit_type=UnitType.ARCHER, 
                                x=player["position"][0] + 1, y=player["position"][1], 
                                owner=player["owner"], name=f"{player['unit_name']} Archer")
@@ -231,7 +306,7 @@ class Game:
 
         for x in range(self.iso_map.tmx_data.width):
             for y in range(self.iso_map.tmx_data.height):
-                if self.path_finder.is_walkable((x, y)):
+                if self.walkability.is_walkable(x, y):
                     # ตรวจสอบว่าตำแหน่งนี้ห่างจากจุดยึดครองอื่น ๆ
                     if all(self.calculate_distance(x, y, cp.x, cp.y) >= min_distance for cp in self.capture_points):
                         # ตรวจสอบว่าตำแหน่งนี้ห่างจากยูนิตของผู้เล่น 1
@@ -258,48 +333,38 @@ class Game:
                 self.create_unit(tower, UnitType.SOLDIER)
                 print("สร้าง Soldier ที่ Tower")
 
-    def load_idle_frames(self, spritesheet):
-        frames = []
-        # สมมุติว่า spritesheet มีการแบ่งเฟรมเป็นแถวและคอลัมน์
-        frame_width = 32  # ความกว้างของแต่ละเฟรม
-        frame_height = 32  # ความสูงของแต่ละเฟรม
-        for i in range(0, spritesheet.get_height(), frame_height):
-            for j in range(0, spritesheet.get_width(), frame_width):
-                frame = spritesheet.subsurface((j, i, frame_width, frame_height))
-                frames.append(frame)
-        return frames
-
     def draw_info(self, screen, x, y):
         """วาดข้อมูล Tower บนหน้าจอ"""
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 20)
+        font = get_font(20)
     
         # สมมุติว่า Tower มีชื่อและสุขภาพ
-        tower_name_surface = font.render(f"Tower Name: {self.selected_tower.player_id}", True, (0, 0, 0))
-        screen.blit(tower_name_surface, (x, y + 50))
+        tower_name_surface = render_text(font, f"Tower Name: {self.selected_tower.player_id}", True, (0, 0, 0))
+        touched_rect = screen.blit(tower_name_surface, (x, y + 50))
 
-        health_surface = font.render(f"Health: {self.selected_tower.health}", True, (0, 0, 0))
-        screen.blit(health_surface, (x, y + 80 + 50))
+        health_surface = render_text(font, f"Health: {self.selected_tower.health}", True, (0, 0, 0))
+        touched_rect.union_ip(screen.blit(health_surface, (x, y + 80 + 50)))
 
-        attack_power_surface = font.render(f"Attack Power: {self.selected_tower.attack_power}", True, (0, 0, 0))
-        screen.blit(attack_power_surface, (x, y + 110 + 50))
+        attack_power_surface = render_text(font, f"Attack Power: {self.selected_tower.attack_power}", True, (0, 0, 0))
+        touched_rect.union_ip(screen.blit(attack_power_surface, (x, y + 110 + 50)))
 
-        attack_range_surface = font.render(f"Attack Range: {self.selected_tower.attack_range}", True, (0, 0, 0))
-        screen.blit(attack_range_surface, (x, y + 140 + 50))
+        attack_range_surface = render_text(font, f"Attack Range: {self.selected_tower.attack_range}", True, (0, 0, 0))
+        touched_rect.union_ip(screen.blit(attack_range_surface, (x, y + 140 + 50)))
+        return touched_rect
 
     def draw_round_display(self):
         """วาดข้อความแสดงรอบของเกมบนหน้าจอ"""
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 36)  # ใช้ฟอนต์ที่ต้องการ
+        font = get_font(36)  # ใช้ฟอนต์ที่ต้องการ
         round_text = f"Round: {self.current_round}"  # ข้อความแสดงรอบ
-        text_surface = font.render(round_text, True, (0, 0, 0))  # วาดข้อความด้วยสีขาว
+        text_surface = render_text(font, round_text, True, (0, 0, 0))  # วาดข้อความด้วยสีขาว
         text_rect = text_surface.get_rect(topright=(self.config.SCREEN_WIDTH - 10, 50))  # จัดตำแหน่งที่มุมขวาบน
-        self.screen.blit(text_surface, text_rect)  # วาดข้อความลงบนหน้าจอ
+        return self.screen.blit(text_surface, text_rect)  # วาดข้อความลงบนหน้าจอ
 
     def draw_end_turn_button(self):
         """วาดปุ่ม 'End Turn' บนหน้าจอ"""
-        pygame.draw.rect(self.screen, (255, 0, 0), self.end_turn_button)  # วาดปุ่มสีแดง
-        text_surface = self.font.render("End Turn", True, (0, 0, 0))
+        button_rect = pygame.draw.rect(self.screen, (255, 0, 0), self.end_turn_button)  # วาดปุ่มสีแดง
+        text_surface = render_text(self.font, "End Turn", True, (0, 0, 0))
         text_rect = text_surface.get_rect(center=self.end_turn_button.center)
-        self.screen.blit(text_surface, text_rect)
+        return button_rect.union(self.screen.blit(text_surface, text_rect))
 
     def draw_create_unit_buttons(self, tower):
         """วาดปุ่ม 'Create Archer', 'Create Soldier' และ 'Create Mage' ข้างๆ Tower ที่ถูกคลิก""" 
@@ -315,62 +380,64 @@ class Game:
         archer_button_y = screen_y - button_height - 10  # ปรับตำแหน่ง Y ให้อยู่เหนือ Tower 
 
         self.archer_button = pygame.Rect(archer_button_x, archer_button_y, button_width, button_height) 
-        pygame.draw.rect(self.screen, (0, 255, 0), self.archer_button)  # วาดปุ่มสีเขียว 
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 20) 
-        text_surface = font.render("Create Archer", True, (0, 0, 0)) 
+        touched_rect = pygame.draw.rect(self.screen, (0, 255, 0), self.archer_button)  # วาดปุ่มสีเขียว 
+        font = get_font(20) 
+        text_surface = render_text(font, "Create Archer", True, (0, 0, 0)) 
         text_rect = text_surface.get_rect(center=self.archer_button.center) 
-        self.screen.blit(text_surface, text_rect) 
+        touched_rect.union_ip(self.screen.blit(text_surface, text_rect)) 
 
         # ปุ่มสร้าง Soldier
         soldier_button_x = screen_x + 10  # ปรับตำแหน่ง X ให้อยู่ข้าง Tower 
         soldier_button_y = archer_button_y - button_height - 10  # ปรับตำแหน่ง Y ให้อยู่เหนือ Archer button 
 
         self.soldier_button = pygame.Rect(soldier_button_x, soldier_button_y, button_width, button_height) 
-        pygame.draw.rect(self.screen, (0, 0, 255), self.soldier_button)  # วาดปุ่มสีน้ำเงิน 
-        text_surface = font.render("Create Soldier", True, (0, 0, 0)) 
+        touched_rect.union_ip(pygame.draw.rect(self.screen, (0, 0, 255), self.soldier_button))  # วาดปุ่มสีน้ำเงิน 
+        text_surface = render_text(font, "Create Soldier", True, (0, 0, 0)) 
         text_rect = text_surface.get_rect(center=self.soldier_button.center) 
-        self.screen.blit(text_surface, text_rect) 
+        touched_rect.union_ip(self.screen.blit(text_surface, text_rect)) 
 
         # ปุ่มสร้าง Mage
         mage_button_x = screen_x + 10  # ปรับตำแหน่ง X ให้อยู่ข้าง Tower 
         mage_button_y = soldier_button_y - button_height - 10  # ปรับตำแหน่ง Y ให้อยู่เหนือ Soldier button 
 
         self.mage_button = pygame.Rect(mage_button_x, mage_button_y, button_width, button_height) 
-        pygame.draw.rect(self.screen, (255, 0, 255), self.mage_button)  # วาดปุ่มสีม่วง 
-        text_surface = font.render("Create Mage", True, (0, 0, 0)) 
+        touched_rect.union_ip(pygame.draw.rect(self.screen, (255, 0, 255), self.mage_button))  # วาดปุ่มสีม่วง 
+        text_surface = render_text(font, "Create Mage", True, (0, 0, 0)) 
         text_rect = text_surface.get_rect(center=self.mage_button.center) 
-        self.screen.blit(text_surface, text_rect)
+        touched_rect.union_ip(self.screen.blit(text_surface, text_rect))
 
         # ปุ่มสร้าง Cavalry
         cavalry_button_x = screen_x + 10  # ปรับตำแหน่ง X ให้อยู่ข้าง Tower 
         cavalry_button_y = mage_button_y - button_height - 10  # ปรับตำแหน่ง Y ให้อยู่เหนือ Mage button 
 
         self.cavalry_button = pygame.Rect(cavalry_button_x, cavalry_button_y, button_width, button_height) 
-        pygame.draw.rect(self.screen, (255, 165, 0), self.cavalry_button)  # วาดปุ่มสีส้ม 
-        text_surface = font.render("Create Cavalry", True, (0, 0, 0)) 
+        touched_rect.union_ip(pygame.draw.rect(self.screen, (255, 165, 0), self.cavalry_button))  # วาดปุ่มสีส้ม 
+        text_surface = render_text(font, "Create Cavalry", True, (0, 0, 0)) 
         text_rect = text_surface.get_rect(center=self.cavalry_button.center) 
-        self.screen.blit(text_surface, text_rect)
+        touched_rect.union_ip(self.screen.blit(text_surface, text_rect))
+        return touched_rect
 
     def draw_money_display(self):
         """แสดงจำนวนเงินของผู้เล่นที่มีเทิร์นบนหน้าจอ"""
         current_player_index = self.current_turn  # ดึงหมายเลขผู้เล่นที่มีเทิร์น
         # เปลี่ยนขนาดฟอนต์ให้ใหญ่ขึ้น
-        large_font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 32)  # เปลี่ยนขนาดฟอนต์เป็น 36
-        money_text = large_font.render(f"Player {current_player_index + 1} Money: ${self.player_money[current_player_index]}", 
+        large_font = get_font(32)  # เปลี่ยนขนาดฟอนต์เป็น 36
+        money_text = render_text(large_font, f"Player {current_player_index + 1} Money: ${self.player_money[current_player_index]}", 
                                    True, (205, 28, 24))  # เปลี่ยนสีตัวอักษรเป็นสีดำ
     
         # ปรับตำแหน่ง Y ของข้อความให้สูงขึ้นจากตำแหน่งปุ่ม "End Turn"
         money_text_y = self.end_turn_button.top - 10  # 10 พิกเซลด้านบนของปุ่ม
-        self.screen.blit(money_text, (10, money_text_y))  # แสดงเงินของผู้เล่นที่มีเทิร์น
+        money_rect = self.screen.blit(money_text, (10, money_text_y))  # แสดงเงินของผู้เล่นที่มีเทิร์น
 
         # แสดงจำนวนจุดที่ยึดได้
         captured_points = sum(1 for point in self.capture_points if point.owner is not None)
-        points_text = large_font.render(f"Captured Points: {captured_points}/{len(self.capture_points)}", 
+        points_text = render_text(large_font, f"Captured Points: {captured_points}/{len(self.capture_points)}", 
                                     True, (205, 28, 24))  # เปลี่ยนสีตัวอักษรเป็นสีดำ
     
         # ปรับตำแหน่ง Y ของข้อความจำนวนจุดที่ยึดได้ให้สูงขึ้นจากปุ่ม "End Turn"
         points_text_y = money_text_y - 30  # 30 พิกเซลด้านบนของข้อความเงิน
-        self.screen.blit(points_text, (10, points_text_y))  # แสดงจำนวนจุดที่ยึดได้
+        points_rect = self.screen.blit(points_text, (10, points_text_y))  # แสดงจำนวนจุดที่ยึดได้
+        return [money_rect, points_rect]
 
     def update_capture_points(self):
         """อัพเดทจุดยึดครอง"""
@@ -383,34 +450,16 @@ class Game:
                 # อาจจะมีการจัดการอื่น ๆ ที่เกี่ยวข้องกับเจ้าของจุดยึดครอง
                 pass  # คุณสามารถเพิ่มโค้ดเพิ่มเติมได้ที่นี่ถ้าต้องการ
 
-    def get_walkable_tiles(self, unit, max_distance=5):
-        """หาช่องที่สามารถเดินไปได้ในระยะที่กำหนด"""
-        walkable = []
-        start_pos = (int(unit.x), int(unit.y))
-        
-        # ใช้ BFS เพื่อหาช่องที่เดินได้
-        visited = {start_pos}
-        queue = [(start_pos, 0)]  # (position, distance)
-        
-        while queue:
-            pos, dist = queue.pop(0)
-            if dist <= max_distance:
-                walkable.append(pos)
-                
-                # ตรวจสอบช่องรอบๆ
-                for dx, dy in self.path_finder.directions:
-                    new_x, new_y = pos[0] + dx, pos[1] + dy
-                    new_pos = (new_x, new_y)
-                    
-                    if (new_pos not in visited and 
-                        0 <= new_x < self.iso_map.tmx_data.width and 
-                        0 <= new_y < self.iso_map.tmx_data.height and
-                        self.path_finder.is_walkable(new_pos)):
-                        
-                        visited.add(new_pos)
-                        queue.append((new_pos, dist + 1))
-        
-        return walkable
+    def get_walkable_tiles(self, unit):
+        """
+        หาช่องที่สามารถเดินไปได้ภายในระยะการเดินของยูนิต (Dijkstra ครั้งเดียวต่อการเลือกยูนิต)
+        ผลลัพธ์เก็บไว้ใน reachable_area ใช้ทั้งวาด highlight และสร้างเส้นทางเมื่อคลิกขวา จึงไม่ต้องค้นหาเส้นทางซ้ำ
+
+        :param unit: ยูนิตที่ถูกเลือก
+        :return: รายการช่องที่เดินไปถึงได้ [(x, y), ...]
+        """
+        self.reachable_area = self.path_finder.reachable((int(unit.x), int(unit.y)), unit.move_range)
+        return self.reachable_area.tiles
 
     def draw_move_button(self):
         """วาดปุ่ม 'Move' บนหน้าจอ"""
@@ -452,12 +501,12 @@ class Game:
         scaled_button = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
     
         # วาดปุ่ม
-        pygame.draw.rect(self.screen, color, scaled_button)
+        button_rect = pygame.draw.rect(self.screen, color, scaled_button)
     
         # วาดข้อความ
-        text_surface = self.font.render("Move", True, (0, 0, 0))
+        text_surface = render_text(self.font, "Move", True, (0, 0, 0))
         text_rect = text_surface.get_rect(center=scaled_button.center)
-        self.screen.blit(text_surface, text_rect)
+        return button_rect.union(self.screen.blit(text_surface, text_rect))
 
     def draw_attack_button(self):
         """วาดปุ่ม 'Attack' บนหน้าจอ"""
@@ -499,50 +548,74 @@ class Game:
         scaled_button = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
     
         # วาดปุ่ม
-        pygame.draw.rect(self.screen, color, scaled_button)
+        button_rect = pygame.draw.rect(self.screen, color, scaled_button)
     
         # วาดข้อความ
-        text_surface = self.font.render("Attack", True, (0, 0, 0))
+        text_surface = render_text(self.font, "Attack", True, (0, 0, 0))
         text_rect = text_surface.get_rect(center=scaled_button.center)
-        self.screen.blit(text_surface, text_rect)
+        return button_rect.union(self.screen.blit(text_surface, text_rect))
     
+    def update_flow_field(self):
+        """คำนวณสนามระยะทางไปยังยูนิตของผู้เล่นที่ยังมีชีวิต (เฉพาะเมื่อยูนิตย้ายหรือช่องที่เดินได้เปลี่ยน)"""
+        goals = [(int(unit.x), int(unit.y)) for unit in self.player_units if unit.current_hp > 0]
+        if self.flow_field.is_stale(goals):
+            self.flow_field.build(goals)
+
+    def occupied_positions(self):
+        """ตำแหน่งของมอนสเตอร์และบอสที่ยังมีชีวิต ใช้กันไม่ให้เดินทับกัน"""
+        occupied = {(monster.x, monster.y) for monster in self.monsters if not monster.is_dead}
+        if self.boss and not self.boss.is_dead:
+            occupied.add((self.boss.x, self.boss.y))
+        return occupied
+
+    def next_step_toward_units(self, x, y, occupied):
+        """
+        ช่องถัดไปของมอนสเตอร์หรือบอสที่ (x, y)
+        เดินลงตามสนามระยะทางเข้าหายูนิตที่ใกล้ที่สุด ถ้าไม่มีทางไปถึงยูนิตให้สุ่มทิศทางเหมือนเดิม
+
+        :return: (x, y) ของช่องถัดไป หรือ None ถ้าไม่เคลื่อนที่
+        """
+        if self.flow_field.distance_at(x, y) != UNREACHABLE:
+            return self.flow_field.next_step(x, y, occupied)  # None = อยู่ติดยูนิตแล้วหรือถูกขวาง
+
+        direction = random.choice(self.path_finder.directions)  # เลือกทิศทางแบบสุ่ม
+        new_x, new_y = x + direction[0], y + direction[1]
+        if self.walkability.is_walkable(new_x, new_y) and (new_x, new_y) not in occupied:
+            return new_x, new_y
+        return None
+
     def move_boss(self):
         """ฟังก์ชันเพื่อเคลื่อนที่บอส"""
         if self.boss and not self.boss.is_dead:  # ตรวจสอบว่าบอสยังมีชีวิตอยู่
-            # สุ่มเลือกทิศทางการเคลื่อนที่
-            direction = random.choice(self.path_finder.directions)  # เลือกทิศทางแบบสุ่ม
-
-            new_x = self.boss.x + direction[0]  # อัปเดตตำแหน่ง X
-            new_y = self.boss.y + direction[1]  # อัปเดตตำแหน่ง Y
-
-            # ตรวจสอบว่าตำแหน่งใหม่อยู่ในขอบเขตของแผนที่
-            if (0 <= new_x < self.iso_map.tmx_data.width) and (0 <= new_y < self.iso_map.tmx_data.height):
-                # ตรวจสอบว่าตำแหน่งใหม่เดินได้หรือไม่
-                if self.path_finder.is_walkable((new_x, new_y)):
-                    # อัปเดตตำแหน่งบอส
-                    self.boss.x = new_x
-                    self.boss.y = new_y
-                    print(f"Boss moved to position: ({new_x}, {new_y})")  # แสดงข้อความยืนยันการเคลื่อนที่
+            self.update_flow_field()
+            occupied = self.occupied_positions()
+            occupied.discard((self.boss.x, self.boss.y))
+            step = self.next_step_toward_units(self.boss.x, self.boss.y, occupied)
+
+            # ตรวจสอบว่ามีช่องถัดไปที่เดินได้หรือไม่
+            if step is not None:
+                new_x, new_y = step
+                # อัปเดตตำแหน่งบอส
+                self.boss.x = new_x
+                self.boss.y = new_y
+                print(f"Boss moved to position: ({new_x}, {new_y})")  # แสดงข้อความยืนยันการเคลื่อนที่
 
     def move_monsters(self):
+        """ให้มอนสเตอร์ทุกตัวเดินหนึ่งช่องเข้าหายูนิตของผู้เล่นตามสนามระยะทางที่คำนวณครั้งเดียวต่อเทิร์น"""
+        self.update_flow_field()
+        occupied = self.occupied_positions()
         for monster in self.monsters:
             if not monster.is_dead:  # ตรวจสอบว่ามอนสเตอร์ยังมีชีวิตอยู่
-                # สุ่มเลือกทิศทางการเคลื่อนที่
-                direction = random.choice(self.path_finder.directions)  # เลือกทิศทางแบบสุ่ม
-
-                new_x = monster.x + direction[0]  # อัปเดตตำแหน่ง X
-                new_y = monster.y + direction[1]  # อัปเดตตำแหน่ง Y
-
-                # ตรวจสอบว่าตำแหน่งใหม่อยู่ในขอบเขตของแผนที่
-                if (0 <= new_x < self.iso_map.tmx_data.width) and (0 <= new_y < self.iso_map.tmx_data.height):
-                    # ตรวจสอบว่าตำแหน่งใหม่เดินได้หรือไม่
-                    if self.path_finder.is_walkable((new_x, new_y)):
-                        # อัปเดตตำแหน่งมอนสเตอร์
-                        monster.x = new_x
-                        monster.y = new_y
-                        print(f"{monster.name} moved to position: ({new_x}, {new_y})")  # แสดงข้อความยืนยันการเคลื่อนที่
+                occupied.discard((monster.x, monster.y))
+                step = self.next_step_toward_units(monster.x, monster.y, occupied)
+
+                if step is not None:
+                    # อัปเดตตำแหน่งมอนสเตอร์
+                    monster.x, monster.y = step
+                    print(f"{monster.name} moved to position: ({monster.x}, {monster.y})")  # แสดงข้อความยืนยันการเคลื่อนที่
                 else:
-                    print(f"{monster.name} cannot move to position: ({new_x}, {new_y}) - out of bounds")  # แสดงข้อความเมื่อมอนสเตอร์ไม่สามารถเคลื่อนที่
+                    print(f"{monster.name} stays at position: ({monster.x}, {monster.y})")  # แสดงข้อความเมื่อมอนสเตอร์ไม่เคลื่อนที่
+                occupied.add((monster.x, monster.y))
 
     def spawn_monster(self):
         if self.monster_count < 5:  # ตรวจสอบว่าจำนวนมอนสเตอร์น้อยกว่า 5 หรือไม่
@@ -551,7 +624,7 @@ class Game:
             # สุ่มตำแหน่งที่อยู่ภายในขอบของแผนที่
             for x in range(1, self.iso_map.tmx_data.width - 1):  # เริ่มจาก 1 ถึง width - 1
                 for y in range(1, self.iso_map.tmx_data.height - 1):  # เริ่มจาก 1 ถึง height - 1
-                    if self.path_finder.is_walkable((x, y)) and not self.is_near_units(x, y):
+                    if self.walkability.is_walkable(x, y) and not self.is_near_units(x, y):
                         # ตรวจสอบระยะห่างจากมอนสเตอร์ที่มีอยู่แล้ว
                         if all(self.calculate_distance(x, y, monster.x, monster.y) >= 3 for monster in self.monsters):
                             # ตรวจสอบระยะห่างจากยูนิตของผู้เล่น
@@ -573,11 +646,12 @@ class Game:
     
     def draw_message(self, message, duration=500):
         """วาดข้อความลงบนหน้าจอ"""
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 48)  # ใช้ฟอนต์ที่ต้องการ
-        text_surface = font.render(message, True, (255, 0, 0))  # สีแดง
+        font = get_font(48)  # ใช้ฟอนต์ที่ต้องการ
+        text_surface = render_text(font, message, True, (255, 0, 0))  # สีแดง
         text_rect = text_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 30))  # จัดตำแหน่งกลาง
         self.screen.blit(text_surface, text_rect)  # วาดข้อความลงบนหน้าจอ
         pygame.display.flip()  # อัปเดตหน้าจอ
+        self.dirty_rects.invalidate()  # เฟรมถัดไปต้องวาดทับข้อความนี้ทั้งจอ
         pygame.time.delay(duration)  # รอเป็นระยะเวลาที่กำหนด
 
     def spawn_boss(self):
@@ -588,7 +662,7 @@ class Game:
             # สุ่มตำแหน่งที่อยู่ภายในขอบของแผนที่
             for x in range(1, self.iso_map.tmx_data.width - 1):  # เริ่มจาก 1 ถึง width - 1
                 for y in range(1, self.iso_map.tmx_data.height - 1):  # เริ่มจาก 1 ถึง height - 1
-                    if self.path_finder.is_walkable((x, y)) and not self.is_near_units(x, y):
+                    if self.walkability.is_walkable(x, y) and not self.is_near_units(x, y):
                         # ตรวจสอบระยะห่างจากยูนิตของผู้เล่น
                         if all(self.calculate_distance(x, y, unit.x, unit.y) >= 5 for unit in self.player_units):
                             valid_positions.append((x, y))
@@ -596,7 +670,7 @@ class Game:
             if valid_positions:
                 x, y = random.choice(valid_positions)  # สุ่มตำแหน่งจาก valid_positions
                 self.boss = Boss(x, y)  # สร้างบอสที่ตำแหน่งที่สุ่มได้
-                self.boss_spawn_sound.play()
+                sound_bank.play(self.boss_spawn_sound)
                 print(f"Among US!! spawned at position: ({x}, {y})")  # แสดงพิกัดที่บอสเกิด
                 self.draw_message("Among US!! has spawned!", duration=500)  # แสดงข้อความเมื่อบอสเกิด
 
@@ -613,40 +687,17 @@ class Game:
     
     def draw_walkable_tiles(self):
         """วาด highlight ช่องที่สามารถเดินได้แบบโปร่งแสง"""
+        rects = []
         if self.selected_unit and self.walkable_tiles:
             # สร้างเอฟเฟกต์กะพริบโดยใช้ฟังก์ชัน sine
             pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 155 + 100
-            highlight_color = (255, 255, 0, int(pulse))  # สีเหลืองที่มีความโปร่งใสเปลี่ยนแปลง
-
-            for tile_x, tile_y in self.walkable_tiles:
-                # ตรวจสอบว่าช่องนี้อยู่ในระยะการเดินของยูนิต
-                distance = self.calculate_distance(self.selected_unit.x, self.selected_unit.y, tile_x, tile_y)
-                if distance <= self.selected_unit.move_range:  # ตรวจสอบระยะการเดิน
-                    iso_x, iso_y = self.iso_map.cart_to_iso(tile_x, tile_y)
-                    screen_x = iso_x * self.camera.zoom + self.config.OFFSET_X + self.camera.position.x
-                    screen_y = iso_y * self.camera.zoom + self.config.OFFSET_Y + self.camera.position.y
-
-                    # กำหนดจุดสำหรับวาดกรอบรูปสี่เหลี่ยมข้าวหลามตัด
-                    points = [
-                    (screen_x, screen_y + (self.config.TILE_HEIGHT * self.camera.zoom) // 2),
-                    (screen_x + (self.config.TILE_WIDTH * self.camera.zoom) //  2, screen_y),
-                    (screen_x + (self.config.TILE_WIDTH * self.camera.zoom), 
-                     screen_y + (self.config.TILE_HEIGHT * self.camera.zoom) // 2),
-                    (screen_x + (self.config.TILE_WIDTH * self.camera.zoom) // 2, 
-                     screen_y + (self.config.TILE_HEIGHT * self.camera.zoom))
-                    ]
-
-                    # สร้าง surface แยกสำหรับการวาดกรอบที่มีความโปร่งใส
-                    highlight_surface = pygame.Surface((self.config.TILE_WIDTH * self.camera.zoom, 
-                                                    self.config.TILE_HEIGHT * self.camera.zoom), 
-                                                   pygame.SRCALPHA)
-
-                    # วาดกรอบบน highlight_surface
-                    pygame.draw.lines(highlight_surface, highlight_color, True, 
-                                  [(p[0]-screen_x, p[1]-screen_y) for p in points], 2)
-
-                    # วาด highlight_surface ลงบนหน้าจอหลัก
-                    self.screen.blit(highlight_surface, (screen_x, screen_y))
+
+            # ภาพกรอบทุกช่องถูกสร้างไว้ใน surface เดียว เปลี่ยนแค่ความโปร่งใสในแต่ละเฟรม
+            rect = self.reachable_overlay.draw(self.screen, self.camera, self.selected_unit,
+                                               self.walkable_tiles, int(pulse))
+            if rect is not None:
+                rects.append(rect)
+        return rects
 
     def create_unit(self, tower, unit_type):
         # ตรวจสอบว่าทาวเวอร์ที่ส่งเข้ามามีอยู่จริง
@@ -669,19 +720,9 @@ class Game:
         x = tower.x +  1   # ปรับตำแหน่ง X ให้ยูนิตอยู่ทางขวาของ Tower
         y = tower.y        # ปรับตำแหน่ง Y ให้อยู่ที่เดียวกับ Tower
 
-        # กำหนดสีหรือสไปรต์ตามผู้เล่น
-        if unit_type == UnitType.SOLDIER:
-            sprite_path = "assets/sprites/unit1_idle_blue.png" if player_index == 0 else "assets/sprites/unit1_idle_red.png"
-        elif unit_type == UnitType.ARCHER:
-            sprite_path = "assets/sprites/unit2_idle_blue.png" if player_index == 0 else "assets/sprites/unit2_idle_red.png"
-        elif unit_type == UnitType.MAGE:  # เพิ่มเงื่อนไขสำหรับ Mage
-            sprite_path = "assets/sprites/mage_blue.png" if player_index == 0 else "assets/sprites/mage_red.png"
-        elif unit_type == UnitType.CAVALRY:  # เพิ่มเงื่อนไขสำหรับ Cavalry
-            sprite_path = "assets/sprites/House-blue.png" if player_index == 0 else "assets/sprites/House-red.png"
-
-        # โหลดเฟรม idle สำหรับยูนิตที่ถูกสร้าง
-        unit_idle_spritesheet = pygame.image.load(sprite_path).convert_alpha()
-        unit_idle_frames = self.load_idle_frames(unit_idle_spritesheet)
+        # กำหนดสไปรต์ตามผู้เล่น แล้วดึงเฟรม idle ที่โหลดไว้แล้วจาก AssetManager
+        sprite_paths = UNIT_IDLE_SHEETS[unit_type]
+        unit_idle_frames = assets.get_frames(sprite_paths[0] if player_index == 0 else sprite_paths[1])
 
         # สร้างยูนิตใหม่ที่ตำแหน่ง (x, y) ที่คำนวณไว้
         new_unit = Unit(unit_idle_frames, unit_type, x, y, owner=player_index)  # ส่ง owner ให้กับ constructor
@@ -717,7 +758,7 @@ class Game:
             return False  # ไม่สามารถสร้าง Tower ได้เนื่องจากเงินไม่เพียงพอ
 
         # ตรวจสอบว่าตำแหน่งนั้นสามารถสร้าง Tower ได้หรือไม่
-        if self.path_finder.is_walkable((x, y)):  # ตรวจสอบว่า Tile เดินได้
+        if self.walkability.is_walkable(x, y):  # ตรวจสอบว่า Tile เดินได้ (ไม่มี Tower หรือสิ่งกีดขวางอื่น)
             # ตรวจสอบระยะการเคลื่อนที่ของ Unit
             distance = self.calculate_distance(self.selected_unit.x, self.selected_unit.y, x, y)
             if distance <= self.selected_unit.move_range:  # ตรวจสอบว่าตำแหน่งอยู่ในระยะ
@@ -726,12 +767,13 @@ class Game:
 
                     # โหลดภาพสำหรับ Tower
                     if player_id == 0:
-                        tower_image = pygame.image.load("assets/sprites/building-blue.png").convert_alpha()
+                        tower_image = assets.get_image("assets/sprites/building-blue.png")
                     else:
-                        tower_image = pygame.image.load("assets/sprites/building-red.png").convert_alpha()
+                        tower_image = assets.get_image("assets/sprites/building-red.png")
 
                     new_tower = Tower(x, y, player_id, tower_image)  # สร้าง Tower ใหม่
                     self.towers.append(new_tower)  # เพิ่ม Tower ลงในรายการ Tower
+                    self.walkability.add_obstacle(x, y)  # Tower บล็อกช่องที่ตั้งอยู่
                     self.tower_created[player_index] = True  # ตั้งค่าสถานะว่าผู้เล่นได้สร้าง Tower แล้ว
                     self.player_money[player_index] -= 100  # หักเงิน 100 บาทจากผู้เล่น
                     print(f"Tower created at position: ({x}, {y}) for Player {player_id}. Cost: 100.")  # แสดงข้อความยืนยันการสร้าง Tower
@@ -753,72 +795,111 @@ class Game:
         button_y = attack_button_y - button_height - 10  # ปรับตำแหน่ง Y ให้อยู่เหนือปุ่ม Attack
 
         self.create_tower_button = pygame.Rect(button_x, button_y, button_width, button_height)
-        pygame.draw.rect(self.screen, (0, 0, 255), self.create_tower_button)  # วาดปุ่มสีฟ้า
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 20)
-        text_surface = font.render("Create Tower", True, (255, 255, 255))
+        button_rect = pygame.draw.rect(self.screen, (0, 0, 255), self.create_tower_button)  # วาดปุ่มสีฟ้า
+        font = get_font(20)
+        text_surface = render_text(font, "Create Tower", True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=self.create_tower_button.center)
-        self.screen.blit(text_surface, text_rect)
+        return button_rect.union(self.screen.blit(text_surface, text_rect))
 
     def draw_map(self):
-        """วาดแผนที่ไอโซเมตริกพร้อมการชดเชยจากกล้องและการซูม"""
-        # วาดแผนที่พื้นฐาน
-        for layer in self.iso_map.tmx_data.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, gid in layer:
-                    tile = self.iso_map.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        # ปรับขนาดกระเบื้องตามระดับการซูมของกล้อง
-                        if self.camera.zoom != 1.0:
-                            new_width = int(tile.get_width() * self.camera.zoom)
-                            new_height = int(tile.get_height() * self.camera.zoom)
-                            tile = pygame.transform.scale(tile, (new_width, new_height))
-                        
-                        iso_x, iso_y = self.iso_map.cart_to_iso(x, y)
-                        screen_x = iso_x * self.camera.zoom + self.config.OFFSET_X + self.camera.position.x
-                        screen_y = iso_y * self.camera.zoom + self.config.OFFSET_Y + self.camera.position.y
-                        self.screen.blit(tile, (screen_x, screen_y))
-                        
-                       
+        """
+        วาดแผนที่ไอโซเมตริกพร้อมการชดเชยจากกล้องและการซูม
+
+        :return: รายการพื้นที่บนหน้าจอที่สิ่งบนแผนที่ถูกวาด (ไม่รวมพื้นแผนที่ที่ไม่เปลี่ยน)
+        """
+        # หาช่วง tile ที่มองเห็นบนหน้าจอ เพื่อข้ามการวาดสิ่งที่อยู่นอกจอ
+        self.visible_tile_range = self.iso_map.get_visible_tile_range(self.camera, self.camera.zoom)
+
+        # วาดแผนที่พื้นฐานจาก chunk ที่สร้างไว้ล่วงหน้า
+        self.map_renderer.draw(self.screen, self.camera)
         
         # วาด highlight ช่องที่เดินได้
-        self.draw_walkable_tiles()  
+        rects = self.draw_walkable_tiles()
 
+        # ส่งทุกสิ่งบนแผนที่เข้าคิวการวาด แล้ววาดตามความลึกในรอบเดียว
+        queue = self.render_queue
         for tower in self.towers:
-            tower.draw(self.screen, self.camera, self.config)  # วาด Tower
+            if self.is_visible(tower):
+                tower.queue_draw(queue, self.camera, self.config)  # วาด Tower
 
-        # วาด objects
+        # วาด objects รวมถึงยูนิตทั้งหมด (ยูนิตที่ถูกเลือกต้องวาดเสมอเพื่อแสดงข้อมูลยูนิต)
         for obj in self.iso_map.objects:
-            obj.draw(self.screen, self.iso_map, self.camera, self.config)
+            if getattr(obj, 'clicked_this_turn', False) or self.is_visible(obj):
+                obj.queue_draw(queue, self.iso_map, self.camera, self.config)
+
         # วาดจุดยึดครอง
         for point in self.capture_points:
-            point.draw(self.screen, self.iso_map, self.camera, self.config)
-        
-        for obj in self.iso_map.objects:
-            if isinstance(obj, Unit):  # ตรวจสอบว่า obj เป็น Unit หรือไม่
-                obj.draw(self.screen, self.iso_map, self.camera, self.config)
-        
-        for unit in self.units :  # ใช้ self.units หรือ self.iso_map.objects
-            unit.draw(self.screen, self.iso_map, self.camera, self.config)
+            if self.is_visible(point):
+                point.queue_draw(queue, self.iso_map, self.camera, self.config)
+
+        # วาดบอสถ้ามี
+        if self.boss and self.is_visible(self.boss):
+            self.boss.queue_draw(queue, self.camera, self.config)
         
+        # วาดมอนสเตอร์ทั้งหมด
+        for monster in self.monsters:
+            if self.is_visible(monster):
+                monster.queue_draw(queue, self.camera, self.config)  # วาดมอนสเตอร์
+
+        rects.extend(queue.flush(self.screen))
+
         # ตรวจสอบว่าเทิร์นของผู้เล่นตรงกับยูนิตที่ถูกเลือก
         if self.selected_unit and self.selected_unit.clicked_this_turn and self.selected_unit.owner == self.current_turn:
-            self.selected_unit.draw_attackable_targets(self.screen, self.iso_map, self.camera, self.config)
+            rects.extend(self.selected_unit.draw_attackable_targets(self.screen, self.iso_map, self.camera, self.config))
 
         # วาด highlight unit ที่เลือก
         if self.selected_unit:
-            self.draw_unit_highlight(self.selected_unit)
+            rects.append(self.draw_unit_highlight(self.selected_unit))
 
         # วาด highlight กระเบื้องที่ถูกเลือก
         if self.iso_map.selected_tile:
-            self.draw_tile_highlight(*self.iso_map.selected_tile)
+            rects.append(self.draw_tile_highlight(*self.iso_map.selected_tile))
+        return rects
 
-        # วาดบอสถ้ามี
-        if self.boss:
-            self.boss.draw(self.screen, self.camera, self.config)
-        
-        # วาดมอนสเตอร์ทั้งหมด
+    def is_animating(self):
+        """ตรวจสอบว่ามีสิ่งที่เคลื่อนไหวบนหน้าจอและต้องวาดด้วยอัตราเฟรมเต็มหรือไม่"""
+        # animation ของปุ่ม Move และ Attack
+        if self.move_button_animation['active'] or self.attack_button_animation['active']:
+            return True
+
+        # เอฟเฟกต์กะพริบของช่องที่เดินได้
+        if self.selected_unit and self.walkable_tiles:
+            return True
+
+        # ยูนิตที่กำลังเดินหรือกำลังโจมตี
+        if any(unit.moving or unit.is_attacking for unit in self.player_units):
+            return True
+
+        # แอนิเมชันการตายของมอนสเตอร์ที่ยังเล่นไม่จบ
+        if any(monster.is_dead and monster.death_frame_index < len(monster.death_frames) - 1
+               for monster in self.monsters):
+            return True
+
+        # ความคืบหน้าการยึดครองเปลี่ยนทุกเฟรม
+        return any(0 < point.capture_progress < 100 for point in self.capture_points)
+
+    def minimap_markers(self):
+        """รายการเครื่องหมายบนแผนที่ย่อ ((x, y), สี) เรียงจากความสำคัญต่ำไปสูง"""
+        team_colors = ((0, 0, 255), (255, 0, 0))  # ผู้เล่น 1 (สีน้ำเงิน), ผู้เล่น 2 (สีแดง)
+        markers = []
+        for point in self.capture_points:
+            color = team_colors[point.owner] if point.owner is not None else (255, 255, 255)
+            markers.append(((point.x, point.y), color))
+        for tower in self.towers:
+            markers.append(((tower.x, tower.y), (255, 215, 0)))
         for monster in self.monsters:
-            monster.draw(self.screen, self.camera, self.config)  # วาดมอนสเตอร์
+            if not monster.is_dead:
+                markers.append(((monster.x, monster.y), (255, 140, 0)))
+        if self.boss and not self.boss.is_dead:
+            markers.append(((self.boss.x, self.boss.y), (160, 32, 240)))
+        for unit in self.player_units:
+            if unit.current_hp > 0:
+                markers.append(((unit.x, unit.y), team_colors[unit.owner]))
+        return markers
+
+    def is_visible(self, obj):
+        """ตรวจสอบว่า object อยู่ในช่วง tile ที่มองเห็นบนหน้าจอหรือไม่"""
+        return self.iso_map.is_in_tile_range(self.visible_tile_range, obj.x, obj.y)
 
     def draw_unit_highlight(self, unit):
         """วาดเส้นไฮไลท์รอบ unit ที่ถูกเลือก"""
@@ -828,15 +909,15 @@ class Game:
         screen_y = iso_y * self.camera.zoom + self.config.OFFSET_Y + self.camera.position.y - (self.config.TILE_HEIGHT * self.camera.zoom)
 
         # วาดปุ่มสร้าง Tower
-        self.draw_create_tower_button(screen_x, screen_y)
+        return self.draw_create_tower_button(screen_x, screen_y)
 
     def draw_turn_display(self):
         """วาดข้อความแสดงเทิร์นของผู้เล่นบนหน้าจอ"""
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 36)  # ใช้ฟอนต์ที่ต้องการและขนาด 36
+        font = get_font(36)  # ใช้ฟอนต์ที่ต้องการและขนาด 36
         turn_text = f"Player {self.current_turn + 1}'s Turn"  # ข้อความแสดงเทิร์น
-        text_surface = font.render(turn_text, True, (0, 0, 0))  # วาดข้อความด้วยสีขาว
+        text_surface = render_text(font, turn_text, True, (0, 0, 0))  # วาดข้อความด้วยสีขาว
         text_rect = text_surface.get_rect(topright=(self.config.SCREEN_WIDTH - 10, 10))  # จัดตำแหน่งที่มุมขวาบน
-        self.screen.blit(text_surface, text_rect)  # วาดข้อความลงบนหน้าจอ
+        return self.screen.blit(text_surface, text_rect)  # วาดข้อความลงบนหน้าจอ
 
     def draw_tile_highlight(self, tile_x: int, tile_y: int):
         """วาดเส้นไฮไลท์สีเหลืองรอบกระเบื้องที่ถูกเลือก"""
@@ -856,7 +937,7 @@ class Game:
         ]
         
         # วาดเส้นรอบไฮไลท์ของกระเบื้อง
-        pygame.draw.lines(self.screen, (255, 0, 0), True, points, 2)
+        return pygame.draw.lines(self.screen, (255, 0, 0), True, points, 2)
 
     def update_selected_tile(self):
         """อัปเดตกระเบื้องที่ถูกเลือกตามตำแหน่งเมาส์"""
@@ -876,11 +957,15 @@ class Game:
             f"FPS: {int(self.clock.get_fps())}",
             f"Camera: ({int(self.camera.position.x)}, {int(self.camera.position.y)})",
             f"Zoom: {self.camera.zoom:.2f}",
-            f"Selected Tile: {self.iso_map.selected_tile}"
+            f"Selected Tile: {self.iso_map.selected_tile}",
+            f"Frame Cache: {frame_cache.hit_rate():.0%} hit ({frame_cache.used_bytes // 1024} KB)",
+            f"Assets: {assets.memory_usage()['total'] // 1024} KB"
         ]
+        rects = []
         for i, text in enumerate(debug_info):
-            surface = self.debug_font.render(text, True, (255, 255, 255))
-            self.screen.blit(surface, (10, 10 + i * 25))
+            surface = render_text(self.debug_font, text, True, (255, 255, 255))
+            rects.append(self.screen.blit(surface, (10, 10 + i * 25)))
+        return rects
 
     def move_unit(self, target_x, target_y):
         unit_info = self.get_info()  # ดึงข้อมูลเกี่ยวกับยูนิต
@@ -937,12 +1022,16 @@ class Game:
                 return False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 return False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.dirty_rects.invalidate()  # หน้าต่างถูกวาดใหม่โดยระบบ ต้องอัปเดตทั้งจอ
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_x, mouse_y = pygame.mouse.get_pos()
                 tile_x, tile_y = self.iso_map.get_tile_coord_from_screen(mouse_x, mouse_y, self.camera, self.camera.zoom)
 
                 if event.button == 1:  # Left click
-                    self.handle_left_click(mouse_x, mouse_y, tile_x, tile_y)
+                    # คลิกบนแผนที่ย่อเพื่อเลื่อนกล้อง
+                    if not self.minimap.handle_click((mouse_x, mouse_y), self.camera):
+                        self.handle_left_click(mouse_x, mouse_y, tile_x, tile_y)
                 elif event.button == 3:  # Right click
                     self.handle_right_click(tile_x, tile_y)
 
@@ -1085,6 +1174,7 @@ class Game:
             if not found_unit:
                 self.selected_unit = None
                 self.walkable_tiles = []
+                self.reachable_area = None
 
 
 
@@ -1094,12 +1184,18 @@ class Game:
         if self.selected_unit:
             if not self.selected_unit.moved_this_turn:  # ตรวจสอบว่ายูนิตยังไม่เคลื่อนที่ในเทิร์นนี้
                 if self.current_action == 'move':
-                    distance = self.calculate_distance(self.selected_unit.x, self.selected_unit.y, tile_x, tile_y)
-                    if distance <= self.selected_unit.move_range:
-                        self.selected_unit.set_destination(tile_x, tile_y, self.path_finder)
+                    # ใช้เส้นทางจากผลการคำนวณตอนเลือกยูนิต (คำนวณใหม่ถ้ายูนิตย้ายหรือมีสิ่งกีดขวางเปลี่ยน)
+                    area = self.reachable_area
+                    if (area is None or area.version != self.walkability.version or
+                            area.start != (int(self.selected_unit.x), int(self.selected_unit.y))):
+                        self.get_walkable_tiles(self.selected_unit)
+                        area = self.reachable_area
+                    if (tile_x, tile_y) in area:
+                        self.selected_unit.follow_path(area.path_to((tile_x, tile_y)))
                         self.selected_unit.clicked_this_turn = True
                         self.selected_unit.moved_this_turn = True  # ตั้งค่าสถานะว่ามีการเคลื่อนที่แล้ว
                         self.walkable_tiles = []
+                        self.reachable_area = None
                     else:
                         print("ยูนิตนี้ไม่สามารถเดินไปยังจุดนั้นได้ เนื่องจากอยู่นอกระยะการเดิน.")
                 elif self.current_action == 'create_tower':
@@ -1204,24 +1300,24 @@ class Game:
         # วาดพื้นหลังลงบนหน้าจอ
         self.screen.blit(game_over_background, (0, 0))
 
-        font = pygame.font.Font("assets/Fonts/PixgamerRegular-OVD6A.ttf", 72)
+        font = get_font(72)
         # วาดข้อความผู้ชนะตามเทิร์นของผู้เล่น
         if self.winner is not None:
-            winner_text = font.render(f"Player {self.winner} wins!", True, (255, 255, 0))
+            winner_text = render_text(font, f"Player {self.winner} wins!", True, (255, 255, 0))
         else:
             winner = 1 if self.current_turn == 0 else 2  # ผู้เล่นที่ชนะ
-            winner_text = font.render(f"Player {winner} wins Game Over!", True, (239,191,4))
+            winner_text = render_text(font, f"Player {winner} wins Game Over!", True, (239,191,4))
 
         # จัดตำแหน่งข้อความผู้ชนะให้แสดงที่ด้านบนกลางของหน้าจอ
         winner_rect = winner_text.get_rect(center=(self.screen.get_width() // 2, 100))
         self.screen.blit(winner_text, winner_rect)
 
         # วาดข้อความเพิ่มเติม เช่น "Press R to Restart" หรือ "Press Q to Quit"
-        restart_text = font.render("Press R to Restart", True, (255, 255, 255))
+        restart_text = render_text(font, "Press R to Restart", True, (255, 255, 255))
         restart_rect = restart_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
 
-        quit_text = font.render("Press Q to Quit", True, (255, 255, 255))
+        quit_text = render_text(font, "Press Q to Quit", True, (255, 255, 255))
         quit_rect = quit_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 120))
         self.screen.blit(quit_text, quit_rect)
 
@@ -1245,8 +1341,10 @@ class Game:
         pygame.mixer.music.set_volume(0.2)  # ลดเสียงเพลงพื้นหลังลงเหลือ 50%
         pygame.mixer.music.play(-1)  # เล่นเพลงซ้ำตลอดไป
 
+        camera_moved = False
         while running:
-            delta_time = self.clock.tick(self.config.FPS) / 1000.0
+            # เดินที่อัตราเฟรมเต็มเมื่อมีสิ่งเคลื่อนไหว และพักรออินพุตเมื่อหน้าจอนิ่ง
+            delta_time = self.frame_scheduler.tick(camera_moved or self.game_over_screen or self.is_animating())
             running = self.handle_events()
             events = pygame.event.get()
 
@@ -1277,20 +1375,30 @@ class Game:
             if not any(unit.current_hp > 0 for unit in self.player_units if unit.owner != self.current_turn):  # ตรวจสอบยูนิตของฝ่ายตรงข้าม
                 self.game_over_screen = True  # ตั้งค่าสถานะให้แสดงหน้าจอ Game Over
 
+            # กล้องขยับหรือซูม ทำให้ทั้งหน้าจอเปลี่ยน
+            view = (self.camera.position.x, self.camera.position.y, self.camera.zoom)
+            camera_moved = view != self.last_view
+            if camera_moved:
+                self.dirty_rects.invalidate()
+                self.last_view = view
+
             # วาดฉากของเกม
+            dirty_rects = self.dirty_rects
             self.screen.fill((0, 151, 167))
-            self.draw_map()
-            self.draw_move_button()  # วาดปุ่ม "Move"
-            self.draw_attack_button()  # วาดปุ่ม "Attack"
-            self.draw_end_turn_button()  # วาดปุ่ม "End Turn"
-            self.draw_turn_display()  # วาดข้อความแสดงเทิร์นของผู้เล่น
-            self.draw_money_display()  # วาดข้อความแสดงเงินของผู้เล่นที่มีเทิร์น
-            self.draw_round_display()  # วาดข้อความแสดงรอบของเกม
-            self.draw_debug_info()
+            dirty_rects.add(self.draw_map())
+            dirty_rects.add(self.draw_move_button())  # วาดปุ่ม "Move"
+            dirty_rects.add(self.draw_attack_button())  # วาดปุ่ม "Attack"
+            dirty_rects.add(self.draw_end_turn_button())  # วาดปุ่ม "End Turn"
+            dirty_rects.add(self.draw_turn_display())  # วาดข้อความแสดงเทิร์นของผู้เล่น
+            dirty_rects.add(self.draw_money_display())  # วาดข้อความแสดงเงินของผู้เล่นที่มีเทิร์น
+            dirty_rects.add(self.draw_round_display())  # วาดข้อความแสดงรอบของเกม
+            dirty_rects.add(self.draw_debug_info())
+            self.minimap.update(self.minimap_markers(), self.camera)
+            dirty_rects.add(self.minimap.draw(self.screen))  # แผนที่ย่อ (blit ครั้งเดียว)
 
             # วาดปุ่มสร้างยูนิตถ้ามี Tower ที่เลือก
             if self.selected_tower:
-                self.draw_create_unit_buttons(self.selected_tower)  # วาดปุ่มสร้างยูนิต
+                dirty_rects.add(self.draw_create_unit_buttons(self.selected_tower))  # วาดปุ่มสร้างยูนิต
 
             # ตรวจสอบการคลิกเมาส์
             mouse_pos = pygame.mouse.get_pos()
@@ -1299,15 +1407,13 @@ class Game:
 
             if self.game_over_screen:
                 self.draw_game_over()  # เรียกฟังก์ชันวาดหน้าจอ Game Over
+                dirty_rects.invalidate()  # หน้าจอ Game Over ทับทั้งจอ
                 
                 # โหลดและเล่นเพลงชนะถ้ายังไม่เคยเล่น
                 if not self.win_music_played:
                     pygame.mixer.music.load("sound/Victory Final Fantasy VII Music.mp3")  # โหลดเพลงชนะ
                     pygame.mixer.music.play(-1)  # เล่นเพลงชนะซ้ำตลอดไป
                     self.win_music_played = True 
-            pygame.display.flip()
-
-            # รักษาอัตราเฟรมเรต
-            self.clock.tick(self.config.FPS)
+            dirty_rects.present()  # แสดงผลทั้งจอ หรือเฉพาะพื้นที่ที่เปลี่ยนในโหมด dirty rectangle
 
         pygame.quit()
\ No newline at end of file
@@ -8,10 +8,19 @@ class GameConfig:
     TILE_WIDTH: int = 32
     TILE_HEIGHT: int = 16
     FPS: int = 120
+    IDLE_FPS: int = 20  # อัตราเฟรมเมื่อไม่มีสิ่งใดเคลื่อนไหวบนหน้าจอ
+    IDLE_DELAY: int = 500  # เวลา (มิลลิวินาที) ที่ไม่มีสิ่งเคลื่อนไหวก่อนลดอัตราเฟรม
     CAMERA_SPEED: int = 5
     MIN_ZOOM: float = 0.5
     MAX_ZOOM: float = 2.0
     ZOOM_SPEED: float = 0.1
+    TILE_CACHE_SIZE: int = 512  # จำนวนภาพ tile ที่ปรับขนาดแล้วสูงสุดในแคช
+    MAP_CHUNK_SIZE: int = 512  # ขนาดของ chunk แผนที่ที่วาดไว้ล่วงหน้า (พิกเซล)
+    DIRTY_RECTS: bool = False  # อัปเดตหน้าจอเฉพาะพื้นที่ที่เปลี่ยน แทนการ flip ทั้งจอทุกเฟรม
+    MINIMAP_SIZE: int = 160  # ขนาดของแผนที่ย่อ (พิกเซล)
+    PATH_CACHE_SIZE: int = 256  # จำนวนเส้นทางสูงสุดในแคชของ PathFinder.find_path (เช่น Unit.set_destination)
+    PATHFINDING_MODE: str = "astar"  # วิธีค้นหาเส้นทาง: "astar", "hpa" (ลำดับชั้น สำหรับแผนที่ใหญ่) หรือ "jps" (Jump Point Search)
+    HPA_CLUSTER_SIZE: int = 16  # ขนาดของ cluster เมื่อใช้ "hpa" (จำนวนช่อง)
     
     @property
     def OFFSET_X(self) -> int:
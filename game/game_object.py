@@ -1,5 +1,6 @@
-import pygame
 import math
+from .render_queue import RenderQueue
+from .frame_cache import get_scaled_frame
 
 class GameObject:
     def __init__(self, x, y, image, properties=None):
@@ -37,17 +38,14 @@ class GameObject:
                 self.x += move_x
                 self.y += move_y
 
-    def draw(self, screen, iso_map, camera, config):
+    def queue_draw(self, render_queue, iso_map, camera, config):
+        """ส่งภาพของ object เข้าคิวการวาดตามความลึก"""
         iso_x, iso_y = iso_map.cart_to_iso(self.x, self.y)
         screen_x = iso_x * camera.zoom + config.OFFSET_X + camera.position.x
         screen_y = iso_y * camera.zoom + config.OFFSET_Y + camera.position.y
 
-        # ปรับขนาดตามการซูม
-        if camera.zoom != 1.0:
-            new_width = int(self.image.get_width() * camera.zoom)
-            new_height = int(self.image.get_height() * camera.zoom)
-            scaled_image = pygame.transform.scale(self.image, (new_width, new_height))
-        else:
-            scaled_image = self.image
+        # ปรับขนาดตามการซูม (ใช้ภาพจากแคช)
+        scaled_image = get_scaled_frame(self.image, camera.zoom)
 
-        screen.blit(scaled_image, (screen_x, screen_y))
\ No newline at end of file
+        render_queue.submit(RenderQueue.depth_key(self.x, self.y, RenderQueue.LAYER_OBJECT),
+                            scaled_image, (screen_x, screen_y))
\ No newline at end of file
@@ -0,0 +1,75 @@
+import weakref
+import pygame
+from .font_cache import render_text
+
+
+class HealthBarCache:
+    """
+    แคชภาพหลอดเลือดและตัวเลขพลังชีวิตของแต่ละ entity
+    - สร้างภาพใหม่เฉพาะเมื่อพลังชีวิตหรือขนาด (จากการซูม) เปลี่ยน
+    - entity ที่ถูกลบออกจากเกมจะถูกลบออกจากแคชโดยอัตโนมัติ
+    """
+    def __init__(self):
+        self._bars = weakref.WeakKeyDictionary()  # entity -> (key, surface)
+        self._labels = weakref.WeakKeyDictionary()  # entity -> (key, surface)
+
+    @staticmethod
+    def _render_bar(width: int, height: int, fill_width: int, back_color, fill_color):
+        """สร้างภาพหลอดเลือดหนึ่งอัน"""
+        surface = pygame.Surface((max(width, 1), max(height, 1)))
+        surface.fill(back_color)
+        if fill_width > 0:
+            surface.fill(fill_color, (0, 0, fill_width, height))
+        return surface
+
+    def get_bar(self, entity, width: float, height: float, ratio: float, back_color, fill_color):
+        """
+        ดึงภาพหลอดเลือดของ entity
+
+        :param entity: เจ้าของหลอดเลือด (ยูนิต มอนสเตอร์ บอส หรือ Tower)
+        :param width: ความกว้างของหลอดเลือด (พิกเซล)
+        :param height: ความสูงของหลอดเลือด (พิกเซล)
+        :param ratio: สัดส่วนพลังชีวิตที่เหลือ (0.0 - 1.0)
+        :param back_color: สีพื้นหลังของหลอดเลือด
+        :param fill_color: สีของพลังชีวิตที่เหลือ
+        :return: pygame.Surface ของหลอดเลือด
+        """
+        width, height = int(width), int(height)
+        fill_width = min(width, max(0, int(width * ratio)))
+        key = (width, height, fill_width, back_color, fill_color)
+
+        entry = self._bars.get(entity)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        surface = self._render_bar(width, height, fill_width, back_color, fill_color)
+        self._bars[entity] = (key, surface)
+        return surface
+
+    def get_label(self, entity, font, text: str, color=(255, 255, 255)):
+        """
+        ดึงภาพตัวเลขพลังชีวิตของ entity
+
+        :param entity: เจ้าของข้อความ
+        :param font: ฟอนต์ที่ใช้ render
+        :param text: ข้อความ เช่น "80/100"
+        :param color: สีของข้อความ
+        :return: pygame.Surface ของข้อความ
+        """
+        key = (font, text, color)
+        entry = self._labels.get(entity)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        surface = render_text(font, text, True, color)
+        self._labels[entity] = (key, surface)
+        return surface
+
+    def clear(self):
+        """ล้างแคชทั้งหมด"""
+        self._bars.clear()
+        self._labels.clear()
+
+
+# ใช้ร่วมกันทั้งเกม
+health_bars = HealthBarCache()
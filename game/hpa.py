@@ -0,0 +1,402 @@
+import heapq
+import math
+from itertools import chain
+
+# ช่วงของช่องที่เดินข้ามขอบได้ที่ยาวตั้งแต่ค่านี้จะมีทางเข้า 2 จุดที่ปลายทั้งสองข้าง (สั้นกว่านี้ใช้จุดกึ่งกลาง)
+LONG_ENTRANCE = 6
+# จำนวน cluster ล่าสุดที่เก็บการเชื่อมต่อภายในไว้ใช้ซ้ำกับจุดเริ่มต้นและจุดหมายของการค้นหาครั้งถัดไป
+ADJACENCY_CACHE_SIZE = 8
+# ใช้คำนวณ heuristic แบบ octile ในลูปค้นหา: dx + dy + (√2 - 2) * min(dx, dy) เหมือน PathFinder.heuristic
+DIAGONAL_BONUS = math.sqrt(2) - 2
+
+
+class HierarchicalGraph:
+    """
+    กราฟระดับบนสำหรับค้นหาเส้นทางแบบลำดับชั้น (HPA*) บนแผนที่ขนาดใหญ่
+    - แบ่งแผนที่เป็น cluster ขนาด cluster_size x cluster_size
+    - ทางเข้า (entrance) คือคู่ช่องที่เดินได้ทั้งสองฝั่งของขอบระหว่าง cluster ที่ติดกัน
+    - ต้นทุนและเส้นทางระหว่างทางเข้าภายใน cluster เดียวกันคำนวณครั้งแรกที่ถูกใช้ แล้วเก็บไว้
+    - เมื่อช่องที่เดินได้เปลี่ยน (เช่น สร้าง Tower) จะสร้างข้อมูลใหม่เฉพาะ cluster ที่ถูกแตะและ cluster ข้างเคียง
+    - เส้นทางที่ต่อจากทางเข้าจะถูกปรับด้วย A* ในหน้าต่างเล็กๆ รอบจุดที่ข้ามขอบ cluster (refine=True)
+      เพื่อตัดทางอ้อมที่เกิดจากตำแหน่งของทางเข้า
+    """
+    def __init__(self, grid, steps, heuristic, cluster_size: int = 16, refine: bool = True):
+        """
+        :param grid: WalkabilityGrid ของแผนที่
+        :param steps: การเดินแต่ละทิศทาง [(dx, dy, ระยะห่างของ index, ต้นทุน), ...] เหมือนของ PathFinder
+        :param heuristic: ฟังก์ชันประมาณระยะทาง heuristic(a, b) ที่ไม่ประเมินเกินจริง
+        :param cluster_size: ขนาดด้านของ cluster (จำนวนช่อง)
+        :param refine: ปรับเส้นทางรอบจุดที่ข้ามขอบ cluster ให้สั้นลง (False = เร็วกว่าแต่เส้นทางอ้อมกว่า)
+        """
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.refine = refine
+        self._steps = steps
+        self._heuristic = heuristic
+        self.clusters_x = (grid.width + cluster_size - 1) // cluster_size
+        self.clusters_y = (grid.height + cluster_size - 1) // cluster_size
+        self._borders = {}  # (cluster, cluster ขวาหรือล่าง) -> [(ช่องฝั่งแรก, ช่องฝั่งที่สอง), ...]
+        self._nodes = {}  # cluster -> set ของช่องทางเข้าใน cluster
+        self._inter = {}  # ช่องทางเข้า -> set ของช่องทางเข้าฝั่งตรงข้ามขอบ
+        self._intra = {}  # cluster -> {ทางเข้า: {ทางเข้า: (ต้นทุน, เส้นทาง)}} (คำนวณเมื่อใช้)
+        self._adjacencies = {}  # cluster -> การเชื่อมต่อภายใน ของ cluster ที่เพิ่งใช้ (เก่าสุดอยู่หน้าสุด)
+        self._dirty = set()  # cluster ที่ต้องสร้างข้อมูลใหม่ก่อนค้นหาครั้งถัดไป
+        self.expanded = 0  # จำนวนโหนดที่ถูกขยายในการค้นหาครั้งล่าสุด (กราฟระดับบนและการปรับเส้นทาง)
+
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                for neighbor in ((cx + 1, cy), (cx, cy + 1)):
+                    if neighbor[0] < self.clusters_x and neighbor[1] < self.clusters_y:
+                        self._borders[((cx, cy), neighbor)] = self._find_entrances((cx, cy), neighbor)
+        for cluster in self._all_clusters():
+            self._nodes[cluster] = self._collect_nodes(cluster)
+        for entrances in self._borders.values():
+            self._link(entrances)
+        grid.add_listener(self._on_grid_changed)
+
+    def _all_clusters(self):
+        """cluster ทั้งหมดของแผนที่"""
+        return [(cx, cy) for cy in range(self.clusters_y) for cx in range(self.clusters_x)]
+
+    def cluster_of(self, pos):
+        """cluster ที่ช่อง pos อยู่"""
+        return pos[0] // self.cluster_size, pos[1] // self.cluster_size
+
+    def _bounds(self, cluster):
+        """ขอบเขตของ cluster (x0, y0, x1, y1) โดย x1, y1 ไม่รวม"""
+        size = self.cluster_size
+        x0, y0 = cluster[0] * size, cluster[1] * size
+        return x0, y0, min(x0 + size, self.grid.width), min(y0 + size, self.grid.height)
+
+    def _find_entrances(self, first, second):
+        """หาคู่ช่องทางเข้าบนขอบระหว่าง cluster first กับ cluster ทางขวาหรือด้านล่าง (second)"""
+        x0, y0, x1, y1 = self._bounds(first)
+        if second[0] != first[0]:
+            # ขอบแนวตั้ง: คอลัมน์สุดท้ายของ first กับคอลัมน์แรกของ second
+            pairs = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+        else:
+            # ขอบแนวนอน: แถวสุดท้ายของ first กับแถวแรกของ second
+            pairs = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+
+        entrances = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and self.grid.is_walkable(*a) and self.grid.is_walkable(*b):
+                run.append((a, b))
+                continue
+            # จบช่วงที่เดินข้ามได้ต่อเนื่อง
+            if len(run) >= LONG_ENTRANCE:
+                entrances.extend((run[0], run[-1]))
+            elif run:
+                entrances.append(run[len(run) // 2])
+            run = []
+        return entrances
+
+    def _cluster_borders(self, cluster):
+        """key ของขอบทั้งสี่ด้านของ cluster ที่มีอยู่จริง"""
+        cx, cy = cluster
+        keys = (((cx - 1, cy), cluster), ((cx, cy - 1), cluster), (cluster, (cx + 1, cy)), (cluster, (cx, cy + 1)))
+        return [key for key in keys if key in self._borders]
+
+    def _collect_nodes(self, cluster):
+        """ช่องทางเข้าทั้งหมดของ cluster จากขอบทั้งสี่ด้าน"""
+        nodes = set()
+        for first, second in self._cluster_borders(cluster):
+            for a, b in self._borders[(first, second)]:
+                nodes.add(a if first == cluster else b)
+        return nodes
+
+    def _link(self, entrances):
+        """เพิ่มการเชื่อมต่อข้ามขอบ (ต้นทุน 1) ของทางเข้าบนขอบหนึ่ง"""
+        for a, b in entrances:
+            self._inter.setdefault(a, set()).add(b)
+            self._inter.setdefault(b, set()).add(a)
+
+    def _unlink(self, entrances):
+        """ลบการเชื่อมต่อข้ามขอบของทางเข้าบนขอบหนึ่ง (ช่องที่มุม cluster อาจยังเชื่อมกับขอบอื่นอยู่)"""
+        for a, b in entrances:
+            for node, other in ((a, b), (b, a)):
+                links = self._inter[node]
+                links.discard(other)
+                if not links:
+                    del self._inter[node]
+
+    def _on_grid_changed(self, changed):
+        """ทำเครื่องหมาย cluster ที่ช่องเปลี่ยน เพื่อสร้างใหม่ก่อนค้นหาครั้งถัดไป"""
+        for pos in changed:
+            self._dirty.add(self.cluster_of(pos))
+
+    def _refresh(self):
+        """สร้างทางเข้าและต้นทุนภายในใหม่เฉพาะ cluster ที่ถูกแตะและ cluster ข้างเคียง"""
+        if not self._dirty:
+            return
+        borders = {key for cluster in self._dirty for key in self._cluster_borders(cluster)}
+        affected = set(self._dirty)
+        for first, second in borders:
+            # แทนที่การเชื่อมต่อข้ามขอบเฉพาะของขอบที่คำนวณใหม่
+            self._unlink(self._borders[(first, second)])
+            entrances = self._borders[(first, second)] = self._find_entrances(first, second)
+            self._link(entrances)
+            affected.update((first, second))
+        for cluster in affected:
+            self._nodes[cluster] = self._collect_nodes(cluster)
+            self._intra.pop(cluster, None)
+            self._adjacencies.pop(cluster, None)
+        self._dirty.clear()
+
+    def _adjacency(self, cluster):
+        """
+        การเชื่อมต่อระหว่างช่องที่เดินได้ภายใน cluster (สร้างครั้งเดียวแล้วใช้กับ Dijkstra ทุกครั้งใน cluster นั้น)
+
+        :return: dict index ของช่อง -> [(index ของช่องข้างเคียง, ต้นทุน), ...]
+        """
+        x0, y0, x1, y1 = self._bounds(cluster)
+        width = self.grid.width
+        cells = self.grid.cells
+        adjacency = {}
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                index = y * width + x
+                adjacency[index] = [(index + offset, step_cost) for dx, dy, offset, step_cost in self._steps
+                                    if x0 <= x + dx < x1 and y0 <= y + dy < y1 and cells[index + offset]]
+        return adjacency
+
+    def _cached_adjacency(self, cluster):
+        """การเชื่อมต่อภายใน cluster จากแคชของ cluster ที่เพิ่งใช้ (สร้างใหม่ถ้าไม่มี)"""
+        adjacency = self._adjacencies.pop(cluster, None)
+        if adjacency is None:
+            adjacency = self._adjacency(cluster)
+            if len(self._adjacencies) >= ADJACENCY_CACHE_SIZE:
+                del self._adjacencies[next(iter(self._adjacencies))]
+        self._adjacencies[cluster] = adjacency
+        return adjacency
+
+    def _local_search(self, source, adjacency, targets):
+        """
+        Dijkstra จาก source ภายใน cluster
+
+        :param adjacency: การเชื่อมต่อของ cluster จาก _adjacency()
+        :return: dict ช่องเป้าหมาย -> (ต้นทุน, เส้นทางจาก source) เฉพาะเป้าหมายที่ไปถึงได้
+        """
+        width = self.grid.width
+        start = source[1] * width + source[0]
+        remaining = {y * width + x for x, y in targets}
+        cost = {start: 0.0}
+        parent = {start: -1}
+        closed = set()
+        frontier = [(0.0, start)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        while frontier and remaining:
+            current_cost, current = heappop(frontier)
+            if current in closed:
+                continue
+            closed.add(current)
+            remaining.discard(current)
+            for next_index, step_cost in adjacency[current]:
+                new_cost = current_cost + step_cost
+                if new_cost < cost.get(next_index, math.inf) and next_index not in closed:
+                    cost[next_index] = new_cost
+                    parent[next_index] = current
+                    heappush(frontier, (new_cost, next_index))
+
+        result = {}
+        for target in targets:
+            index = target[1] * width + target[0]
+            if index not in closed:
+                continue
+            path = []
+            while index != -1:
+                path.append((index % width, index // width))
+                index = parent[index]
+            path.reverse()
+            result[target] = (cost[target[1] * width + target[0]], tuple(path))
+        return result
+
+    def _intra_edges(self, cluster):
+        """ต้นทุนและเส้นทางระหว่างทางเข้าทุกคู่ภายใน cluster (คำนวณครั้งแรกที่ใช้)"""
+        edges = self._intra.get(cluster)
+        if edges is None:
+            nodes = sorted(self._nodes[cluster])
+            edges = {node: {} for node in nodes}
+            adjacency = self._adjacency(cluster)
+            for i, node in enumerate(nodes):
+                others = nodes[i + 1:]
+                if not others:
+                    break
+                for other, (cost, path) in self._local_search(node, adjacency, others).items():
+                    edges[node][other] = (cost, path)
+                    edges[other][node] = (cost, path[::-1])
+            self._intra[cluster] = edges
+        return edges
+
+    def _window_search(self, segment):
+        """
+        A* จากต้นถึงปลายของ segment โดยค้นหาเฉพาะในกรอบสี่เหลี่ยมที่ครอบ segment
+        (segment เดิมอยู่ในกรอบ จึงได้เส้นทางที่ไม่ยาวกว่าเดิมเสมอ)
+
+        :param segment: ช่วงหนึ่งของเส้นทาง [(x, y), ...]
+        :return: เส้นทางที่สั้นที่สุดภายในกรอบ
+        """
+        start, goal = segment[0], segment[-1]
+        diagonals = sum(1 for a, b in zip(segment, segment[1:]) if a[0] != b[0] and a[1] != b[1])
+        length = len(segment) - 1 + DIAGONAL_BONUS * diagonals + diagonals
+        if length <= self._heuristic(start, goal) + 1e-9:
+            return segment  # ยาวเท่าระยะแบบ octile อยู่แล้ว ไม่มีทางที่สั้นกว่า
+        x0 = min(x for x, _ in segment)
+        x1 = max(x for x, _ in segment)
+        y0 = min(y for _, y in segment)
+        y1 = max(y for _, y in segment)
+        width = self.grid.width
+        cells = self.grid.cells
+        goal_x, goal_y = goal
+        start_index = start[1] * width + start[0]
+        goal_index = goal_y * width + goal_x
+        cost = {start_index: 0.0}
+        parent = {start_index: -1}
+        closed = set()
+        # (ค่าประเมินรวม, heuristic สำหรับตัดสินเมื่อค่าเท่ากัน, index)
+        frontier = [(0.0, 0.0, start_index)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        while frontier:
+            _, _, current = heappop(frontier)
+            if current == goal_index:
+                break
+            if current in closed:
+                continue
+            closed.add(current)
+            y, x = divmod(current, width)
+            current_cost = cost[current]
+            for dx, dy, offset, step_cost in self._steps:
+                new_x, new_y = x + dx, y + dy
+                next_index = current + offset
+                if not (x0 <= new_x <= x1 and y0 <= new_y <= y1) or not cells[next_index]:
+                    continue
+                new_cost = current_cost + step_cost
+                if new_cost < cost.get(next_index, math.inf):
+                    cost[next_index] = new_cost
+                    parent[next_index] = current
+                    h_x = abs(new_x - goal_x)
+                    h_y = abs(new_y - goal_y)
+                    h = h_x + h_y + DIAGONAL_BONUS * (h_x if h_x < h_y else h_y)
+                    heappush(frontier, (new_cost + h, h, next_index))
+        else:
+            return segment
+        self.expanded += len(closed)
+
+        path = []
+        current = goal_index
+        while current != -1:
+            y, x = divmod(current, width)
+            path.append((x, y))
+            current = parent[current]
+        path.reverse()
+        return path
+
+    def _refine(self, path, crossings):
+        """
+        ตัดทางอ้อมรอบจุดที่ข้ามขอบ cluster: หาเส้นทางที่สั้นที่สุดของช่วง cluster_size // 2 ก้าว
+        ก่อนและหลังจุดข้ามแต่ละจุดภายในกรอบของช่วงนั้น (ช่วงไม่ซ้อนกัน ส่วนอื่นของเส้นทางใช้ของเดิม)
+
+        :param path: เส้นทางที่ต่อจากทางเข้า
+        :param crossings: index ใน path ของช่องก่อนข้ามขอบ cluster (เรียงจากน้อยไปมาก)
+        :return: เส้นทางที่ไม่ยาวกว่าเดิม
+        """
+        radius = self.cluster_size // 2
+        last = len(path) - 1
+        refined = [path[0]]
+        done = 0  # index ใน path ของช่องสุดท้ายที่อยู่ใน refined แล้ว
+        for crossing in crossings:
+            if crossing < done:
+                continue
+            first = max(crossing - radius, done)
+            second = min(crossing + 1 + radius, last)
+            refined.extend(path[done + 1:first + 1])
+            refined.extend(self._window_search(path[first:second + 1])[1:])
+            done = second
+        refined.extend(path[done + 1:])
+        return refined
+
+    def prebuild(self):
+        """คำนวณต้นทุนภายในของทุก cluster ล่วงหน้า เพื่อไม่ให้การค้นหาครั้งแรกช้า"""
+        self._refresh()
+        for cluster in self._all_clusters():
+            self._intra_edges(cluster)
+
+    def find_path(self, start, goal):
+        """
+        ค้นหาเส้นทางบนกราฟของทางเข้า แล้วต่อเส้นทางภายในแต่ละ cluster ที่เก็บไว้เข้าด้วยกัน
+
+        :param start: จุดเริ่มต้น
+        :param goal: จุดหมายปลายทาง
+        :return: รายการตำแหน่งของเส้นทาง หรือ None ถ้าควรใช้ A* ปกติ
+                 (ระยะใกล้กว่าขนาด cluster ตำแหน่งไม่ถูกต้อง หรือไม่พบทางบนกราฟระดับบน
+                 เช่น ทางที่ข้าม cluster ได้เฉพาะแนวทแยงที่มุม)
+        """
+        self.expanded = 0
+        grid = self.grid
+        if not grid.in_bounds(*start) or not grid.is_walkable(*goal):
+            return None
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        if start_cluster == goal_cluster or self._heuristic(start, goal) <= self.cluster_size:
+            return None  # ระยะใกล้: A* ปกติเร็วพอและได้เส้นทางที่สั้นที่สุด
+        self._refresh()
+
+        # เชื่อมจุดเริ่มต้นและจุดหมายเข้ากับทางเข้าของ cluster ของตัวเองชั่วคราว
+        start_links = self._local_search(start, self._cached_adjacency(start_cluster), self._nodes[start_cluster])
+        goal_links = {node: (cost, path[::-1]) for node, (cost, path) in
+                      self._local_search(goal, self._cached_adjacency(goal_cluster), self._nodes[goal_cluster]).items()}
+        if not start_links or not goal_links:
+            return None
+
+        intra_edges = self._intra_edges
+        inter = self._inter
+        size = self.cluster_size
+        goal_x, goal_y = goal
+        cost = {start: 0.0}
+        came_from = {start: None}  # โหนด -> (โหนดก่อนหน้า, เส้นทางจากโหนดก่อนหน้า)
+        closed = set()
+        # (ค่าประเมินรวม, heuristic สำหรับตัดสินเมื่อค่าเท่ากัน, โหนด)
+        frontier = [(0.0, 0.0, start)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        while frontier:
+            _, _, current = heappop(frontier)
+            if current == goal:
+                break
+            if current in closed:
+                continue
+            closed.add(current)
+            current_cost = cost[current]
+            # เส้นเชื่อมภายใน cluster, เส้นเชื่อมข้ามขอบ (ต้นทุน 1) และเส้นเชื่อมไปยังจุดหมาย
+            links = start_links if current == start else intra_edges((current[0] // size, current[1] // size))[current]
+            crossing = [(other, (1.0, (current, other))) for other in inter.get(current, ())]
+            if current in goal_links:
+                crossing.append((goal, goal_links[current]))
+            for other, (edge_cost, path) in chain(links.items(), crossing):
+                if other in closed:
+                    continue
+                new_cost = current_cost + edge_cost
+                if new_cost < cost.get(other, math.inf):
+                    cost[other] = new_cost
+                    came_from[other] = (current, path)
+                    h_x = abs(other[0] - goal_x)
+                    h_y = abs(other[1] - goal_y)
+                    h = h_x + h_y + DIAGONAL_BONUS * (h_x if h_x < h_y else h_y)
+                    heappush(frontier, (new_cost + h, h, other))
+        else:
+            return None
+        self.expanded = len(closed)
+
+        # ต่อเส้นทางย่อยจากจุดหมายย้อนกลับไปจุดเริ่มต้น (ตัดช่องที่ซ้ำกันตรงรอยต่อ)
+        segments = []
+        node = goal
+        while came_from[node] is not None:
+            node, path = came_from[node]
+            segments.append(path)
+        full_path = [start]
+        crossings = []
+        for path in reversed(segments):
+            if self.refine and len(path) == 2 and self.cluster_of(path[0]) != self.cluster_of(path[1]):
+                crossings.append(len(full_path) - 1)  # เส้นเชื่อมข้ามขอบ
+            full_path.extend(path[1:])
+        return self._refine(full_path, crossings) if crossings else full_path
@@ -1,6 +1,8 @@
+import math
 import pytmx
 from .game_config import GameConfig
-from typing import Tuple
+from .map_cache import load_map, CompiledTileLayer
+from typing import Optional, Tuple
 
 class IsometricMap:
     """
@@ -17,8 +19,8 @@ class IsometricMap:
         :param config: object ที่เก็บการตั้งค่าเกม
         """
         self.config = config
-        # โหลดข้อมูลแผนที่จากไฟล์ TMX
-        self.tmx_data = pytmx.load_pygame(tmx_path)
+        # โหลดข้อมูลแผนที่ (ใช้ไฟล์ที่คอมไพล์ไว้ข้างไฟล์ TMX ถ้ายังตรงกับต้นฉบับ)
+        self.tmx_data = load_map(tmx_path)
         # คำนวณขนาดแผนที่ทั้งหมด
         self.width = self.tmx_data.width * config.TILE_WIDTH 
         self.height = self.tmx_data.height * config.TILE_HEIGHT
@@ -44,6 +46,15 @@ class IsometricMap:
         if obj in self.objects:
             self.objects.remove(obj)
 
+    def tile_layers(self):
+        """
+        คืนค่าเลเยอร์ tile ที่มองเห็นได้ทั้งหมดตามลำดับการวาด
+        
+        :return: รายการของ TiledTileLayer
+        """
+        return [layer for layer in self.tmx_data.visible_layers
+                if isinstance(layer, (pytmx.TiledTileLayer, CompiledTileLayer))]
+
     def cart_to_iso(self, x: float, y: float) -> Tuple[float, float]:
         """
         แปลงพิกัดจากระบบคาร์ทีเซียน (x,y) เป็นพิกัด Isometric
@@ -71,22 +82,100 @@ class IsometricMap:
         cart_y = (iso_y / (self.config.TILE_HEIGHT / 2) - iso_x / (self.config.TILE_WIDTH / 2)) / 2
         return cart_x, cart_y
 
-    def get_tile_coord_from_screen(self, screen_x: float, screen_y: float, camera, zoom: float) -> Tuple[int, int]:
+    def screen_to_cart(self, screen_x: float, screen_y: float, camera, zoom: float) -> Tuple[float, float]:
         """
-        แปลงพิกัดจากหน้าจอเป็นพิกัดของ tile บนแผนที่
+        แปลงพิกัดจากหน้าจอเป็นพิกัดคาร์ทีเซียน (ไม่ปัดเศษ)
         
         :param screen_x: พิกัด x บนหน้าจอ
         :param screen_y: พิกัด y บนหน้าจอ
         :param camera: object กล้องที่ใช้ในการมองแผนที่
         :param zoom: ระดับการซูมปัจจุบัน
-        :return: tuple ของพิกัด tile (x,y) บนแผนที่
+        :return: tuple ของพิกัด (x,y) ในระบบคาร์ทีเซียน
         """
         # ปรับพิกัดตามตำแหน่งกล้องและการซูม
         adjusted_x = (screen_x - self.config.OFFSET_X - camera.position.x) / zoom
         adjusted_y = (screen_y - self.config.OFFSET_Y - camera.position.y) / zoom
         
         # แปลงเป็นพิกัดคาร์ทีเซียน
-        cart_x, cart_y = self.iso_to_cart(adjusted_x, adjusted_y)
+        return self.iso_to_cart(adjusted_x, adjusted_y)
+
+    def get_tile_coord_from_screen(self, screen_x: float, screen_y: float, camera, zoom: float) -> Tuple[int, int]:
+        """
+        แปลงพิกัดจากหน้าจอเป็นพิกัดของ tile บนแผนที่
+        
+        :param screen_x: พิกัด x บนหน้าจอ
+        :param screen_y: พิกัด y บนหน้าจอ
+        :param camera: object กล้องที่ใช้ในการมองแผนที่
+        :param zoom: ระดับการซูมปัจจุบัน
+        :return: tuple ของพิกัด tile (x,y) บนแผนที่
+        """
+        cart_x, cart_y = self.screen_to_cart(screen_x, screen_y, camera, zoom)
         
         # ปัดเศษพิกัดให้เป็นพิกัดของกระเบื้องที่ใกล้ที่สุด
         return int(cart_x), int(cart_y)
+
+    def get_max_tile_size(self) -> Tuple[int, int]:
+        """
+        คืนค่าขนาดภาพ tile ที่ใหญ่ที่สุดจากทุก tileset
+        
+        :return: tuple ของ (ความกว้าง, ความสูง) เป็นพิกเซล
+        """
+        width = max((ts.tilewidth for ts in self.tmx_data.tilesets), default=self.config.TILE_WIDTH)
+        height = max((ts.tileheight for ts in self.tmx_data.tilesets), default=self.config.TILE_HEIGHT)
+        return width, height
+
+    def get_tile_range(self, iso_left: float, iso_top: float, iso_right: float, iso_bottom: float,
+                       margin: int = 0) -> Optional[Tuple[int, int, int, int]]:
+        """
+        หาช่วงพิกัด tile ที่ครอบคลุมสี่เหลี่ยมในระบบ Isometric (ก่อนซูม)
+        
+        :param iso_left: ขอบซ้ายของสี่เหลี่ยม
+        :param iso_top: ขอบบนของสี่เหลี่ยม
+        :param iso_right: ขอบขวาของสี่เหลี่ยม
+        :param iso_bottom: ขอบล่างของสี่เหลี่ยม
+        :param margin: จำนวน tile ที่ขยายออกไปทุกด้าน (เผื่อภาพที่สูงกว่า tile)
+        :return: tuple (min_x, min_y, max_x, max_y) ที่อยู่ในแผนที่ หรือ None ถ้าอยู่นอกแผนที่
+        """
+        # แปลงมุมทั้งสี่ของสี่เหลี่ยมกลับเป็นพิกัดคาร์ทีเซียน
+        corners = [self.iso_to_cart(x, y) for x, y in
+                   ((iso_left, iso_top), (iso_right, iso_top),
+                    (iso_left, iso_bottom), (iso_right, iso_bottom))]
+        min_x = max(0, math.floor(min(c[0] for c in corners)) - margin)
+        min_y = max(0, math.floor(min(c[1] for c in corners)) - margin)
+        max_x = min(self.tmx_data.width - 1, math.floor(max(c[0] for c in corners)) + margin)
+        max_y = min(self.tmx_data.height - 1, math.floor(max(c[1] for c in corners)) + margin)
+        if min_x > max_x or min_y > max_y:
+            return None
+        return min_x, min_y, max_x, max_y
+
+    def get_visible_tile_range(self, camera, zoom: float, margin: int = 4,
+                               screen_margin: int = 64) -> Optional[Tuple[int, int, int, int]]:
+        """
+        หาช่วงพิกัด tile ที่มองเห็นบนหน้าจอจากตำแหน่งกล้องและการซูม
+        
+        :param camera: object กล้องที่ใช้ในการมองแผนที่
+        :param zoom: ระดับการซูมปัจจุบัน
+        :param margin: จำนวน tile ที่ขยายออกไปทุกด้าน (เผื่อ sprite ที่สูงกว่า tile)
+        :param screen_margin: ระยะขยายขอบหน้าจอเป็นพิกเซล (เผื่อหลอดเลือดและข้อความ)
+        :return: tuple (min_x, min_y, max_x, max_y) หรือ None ถ้าไม่เห็นแผนที่เลย
+        """
+        left = (-screen_margin - self.config.OFFSET_X - camera.position.x) / zoom
+        top = (-screen_margin - self.config.OFFSET_Y - camera.position.y) / zoom
+        right = (self.config.SCREEN_WIDTH + screen_margin - self.config.OFFSET_X - camera.position.x) / zoom
+        bottom = (self.config.SCREEN_HEIGHT + screen_margin - self.config.OFFSET_Y - camera.position.y) / zoom
+        return self.get_tile_range(left, top, right, bottom, margin)
+
+    @staticmethod
+    def is_in_tile_range(tile_range, x: float, y: float) -> bool:
+        """
+        ตรวจสอบว่าพิกัดอยู่ในช่วง tile ที่กำหนดหรือไม่
+        
+        :param tile_range: ช่วง tile จาก get_tile_range หรือ get_visible_tile_range
+        :param x: พิกัด x ในระบบคาร์ทีเซียน
+        :param y: พิกัด y ในระบบคาร์ทีเซียน
+        :return: True ถ้าอยู่ในช่วง
+        """
+        if tile_range is None:
+            return False
+        min_x, min_y, max_x, max_y = tile_range
+        return min_x <= x < max_x + 1 and min_y <= y < max_y + 1
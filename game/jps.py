@@ -0,0 +1,206 @@
+import heapq
+import math
+
+
+class JumpPointSearch:
+    """
+    ค้นหาเส้นทางแบบ Jump Point Search (JPS) บนตารางที่เดินได้ 8 ทิศทางและมีต้นทุนสม่ำเสมอ
+    - กระโดดข้ามช่องที่มีเส้นทางสมมาตรกันไปจนถึงช่องที่มีเพื่อนบ้านบังคับ (forced neighbor) หรือถึงจุดหมาย
+    - ขยายเฉพาะ jump point จึงขยายโหนดน้อยกว่า A* มากบนพื้นที่โล่ง แต่ได้ความยาวเส้นทางเท่ากับ A*
+    - ใช้กติกาการเดินเดียวกับ PathFinder: เดินแนวทแยงได้แม้ช่องข้างๆ ถูกบล็อก
+    - การกระโดดแนวตรงค้นหาด้วย bytes.find บนสำเนาของแถวและคอลัมน์ (เก็บไว้จนกว่า version ของตารางจะเปลี่ยน)
+    """
+    def __init__(self, grid, heuristic):
+        """
+        :param grid: WalkabilityGrid ของแผนที่
+        :param heuristic: ระยะทางแบบ octile heuristic(a, b) ซึ่งเท่ากับต้นทุนจริงระหว่าง jump point ที่อยู่บนแนวเดียวกัน
+        """
+        self.grid = grid
+        self._heuristic = heuristic
+        self.expanded = 0  # จำนวน jump point ที่ถูกขยายในการค้นหาครั้งล่าสุด
+        self._rows = {}  # y -> bytes ของแถว
+        self._columns = {}  # x -> bytes ของคอลัมน์
+        self._lines_version = None  # version ของตารางที่ใช้สร้างแถวและคอลัมน์ที่เก็บไว้
+
+    def _walkable(self, x: int, y: int) -> bool:
+        """ตรวจสอบว่าช่อง (x, y) อยู่ในแผนที่และเดินผ่านได้"""
+        grid = self.grid
+        return 0 <= x < grid.width and 0 <= y < grid.height and grid.cells[y * grid.width + x] == 1
+
+    def _directions(self, x, y, dx, dy):
+        """ทิศทางที่ต้องพิจารณาจากช่อง (x, y) เมื่อมาจากทิศ (dx, dy): ทิศธรรมชาติและทิศของเพื่อนบ้านบังคับ"""
+        walkable = self._walkable
+        if dx == 0 and dy == 0:
+            return [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+        if dx and dy:
+            directions = [(dx, 0), (0, dy), (dx, dy)]
+            if not walkable(x - dx, y):
+                directions.append((-dx, dy))
+            if not walkable(x, y - dy):
+                directions.append((dx, -dy))
+        elif dx:
+            directions = [(dx, 0)]
+            if not walkable(x, y + 1):
+                directions.append((dx, 1))
+            if not walkable(x, y - 1):
+                directions.append((dx, -1))
+        else:
+            directions = [(0, dy)]
+            if not walkable(x + 1, y):
+                directions.append((1, dy))
+            if not walkable(x - 1, y):
+                directions.append((-1, dy))
+        return directions
+
+    def _row(self, y: int):
+        """แถว y เป็น bytes (None ถ้าอยู่นอกแผนที่)"""
+        if not 0 <= y < self.grid.height:
+            return None
+        row = self._rows.get(y)
+        if row is None:
+            width = self.grid.width
+            row = self._rows[y] = bytes(self.grid.cells[y * width:(y + 1) * width])
+        return row
+
+    def _column(self, x: int):
+        """คอลัมน์ x เป็น bytes (None ถ้าอยู่นอกแผนที่)"""
+        if not 0 <= x < self.grid.width:
+            return None
+        column = self._columns.get(x)
+        if column is None:
+            column = self._columns[x] = bytes(self.grid.cells[x::self.grid.width])
+        return column
+
+    @staticmethod
+    def _scan(line, before, after, position: int, step: int, target):
+        """
+        กระโดดแนวตรงบนหนึ่งเส้น (แถวหรือคอลัมน์) จาก position ไปทาง step (+1 หรือ -1)
+
+        :param line: เส้นที่กำลังเดิน
+        :param before: เส้นข้างเคียงด้านหนึ่ง (None ถ้าอยู่นอกแผนที่)
+        :param after: เส้นข้างเคียงอีกด้าน (None ถ้าอยู่นอกแผนที่)
+        :param target: ตำแหน่งของจุดหมายบนเส้นนี้ (None ถ้าจุดหมายไม่อยู่บนเส้นนี้)
+        :return: ตำแหน่งของ jump point บนเส้น หรือ None ถ้าชนสิ่งกีดขวางหรือขอบแผนที่ก่อน
+        """
+        # jump point คือช่องแรกที่เส้นข้างเคียงถูกบล็อกแต่ช่องถัดไปในทิศเดียวกันเดินได้ (เพื่อนบ้านบังคับ)
+        if step > 0:
+            end = line.find(b"\x00", position + 1)
+            if end == -1:
+                end = len(line)  # ไม่มีสิ่งกีดขวาง: เดินได้ถึงขอบแผนที่
+            best = end
+            for side in (before, after):
+                if side is not None:
+                    forced = side.find(b"\x00\x01", position + 1, end + 1)
+                    if forced != -1 and forced < best:
+                        best = forced
+            if target is not None and position < target < best:
+                best = target
+            return None if best == end else best
+        end = line.rfind(b"\x00", 0, position)
+        best = end
+        for side in (before, after):
+            if side is not None:
+                forced = side.rfind(b"\x01\x00", max(end, 0), position)
+                if forced != -1 and forced + 1 > best:
+                    best = forced + 1
+        if target is not None and best < target < position:
+            best = target
+        return None if best == end else best
+
+    def _jump(self, x, y, dx, dy, goal):
+        """
+        เดินจาก (x, y) ไปในทิศ (dx, dy) จนพบ jump point
+
+        :return: (x, y) ของ jump point หรือ None ถ้าชนสิ่งกีดขวางหรือขอบแผนที่
+        """
+        if dy == 0:
+            found = self._scan(self._row(y), self._row(y - 1), self._row(y + 1), x, dx,
+                               goal[0] if goal[1] == y else None)
+            return None if found is None else (found, y)
+        if dx == 0:
+            found = self._scan(self._column(x), self._column(x - 1), self._column(x + 1), y, dy,
+                               goal[1] if goal[0] == x else None)
+            return None if found is None else (x, found)
+
+        walkable = self._walkable
+        while True:
+            x += dx
+            y += dy
+            if not walkable(x, y):
+                return None
+            if (x, y) == goal:
+                return x, y
+            # แนวทแยง: มีเพื่อนบ้านบังคับ หรือการเดินแนวตรงที่แยกออกไปพบ jump point
+            if ((not walkable(x - dx, y) and walkable(x - dx, y + dy)) or
+                    (not walkable(x, y - dy) and walkable(x + dx, y - dy))):
+                return x, y
+            if self._jump(x, y, dx, 0, goal) is not None or self._jump(x, y, 0, dy, goal) is not None:
+                return x, y
+
+    def find_path(self, start, goal):
+        """
+        ค้นหาเส้นทางด้วย JPS แล้วเติมช่องระหว่าง jump point ให้เป็นเส้นทางทีละช่อง
+
+        :param start: จุดเริ่มต้น
+        :param goal: จุดหมายปลายทาง
+        :return: รายการตำแหน่งของเส้นทาง (รวมจุดเริ่มต้น) หรือ [] ถ้าไปไม่ถึง
+        """
+        self.expanded = 0
+        if start == goal:
+            return [start]
+        if not self.grid.in_bounds(start[0], start[1]) or not self._walkable(goal[0], goal[1]):
+            return []
+
+        if self._lines_version != self.grid.version:
+            self._rows.clear()
+            self._columns.clear()
+            self._lines_version = self.grid.version
+
+        octile = self._heuristic
+        cost = {start: 0.0}
+        came_from = {start: None}
+        closed = set()
+        frontier = [(octile(start, goal), 0.0, start)]
+        while frontier:
+            _, current_cost, current = heapq.heappop(frontier)
+            if current == goal:
+                break
+            if current in closed:
+                continue
+            closed.add(current)
+            self.expanded += 1
+
+            x, y = current
+            parent = came_from[current]
+            # ทิศที่มาถึงช่องนี้ (ปรับให้เหลือ -1, 0, 1)
+            dx = (x > parent[0]) - (x < parent[0]) if parent else 0
+            dy = (y > parent[1]) - (y < parent[1]) if parent else 0
+            for step_x, step_y in self._directions(x, y, dx, dy):
+                point = self._jump(x, y, step_x, step_y, goal)
+                if point is None or point in closed:
+                    continue
+                new_cost = current_cost + octile(current, point)
+                if new_cost < cost.get(point, math.inf):
+                    cost[point] = new_cost
+                    came_from[point] = current
+                    heapq.heappush(frontier, (new_cost + octile(point, goal), new_cost, point))
+        else:
+            return []
+
+        # jump point แต่ละคู่อยู่บนเส้นตรงหรือแนวทแยงเดียวกัน จึงเติมช่องระหว่างกันได้ทีละก้าว
+        points = []
+        node = goal
+        while node is not None:
+            points.append(node)
+            node = came_from[node]
+        points.reverse()
+        path = [start]
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            step_x = (x1 > x0) - (x1 < x0)
+            step_y = (y1 > y0) - (y1 < y0)
+            x, y = x0, y0
+            while (x, y) != (x1, y1):
+                x += step_x
+                y += step_y
+                path.append((x, y))
+        return path
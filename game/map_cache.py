@@ -0,0 +1,262 @@
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+from array import array
+import pytmx
+from pytmx.util_pygame import pygame_image_loader
+
+COMPILED_EXTENSION = ".mapc"
+# property แบบ boolean ของ tile ที่เก็บเป็นบิตในแผนที่ที่คอมไพล์แล้ว (property อื่นจะไม่ถูกเก็บ)
+FLAG_PROPERTIES = ("blocked",)
+
+# โครงสร้างไฟล์: magic, เวอร์ชัน, SHA-1 ของ TMX และ TSX, ความยาวของข้อมูลอธิบาย (JSON)
+# ตามด้วย gid ของแต่ละเลเยอร์ (array 'I') และ flag ของแต่ละ gid (bytearray)
+MAGIC = b"GMAP"
+VERSION = 1
+HEADER = struct.Struct("<4sI20sI")
+GID_TYPECODE = "I"
+
+_TILESET_SOURCE = re.compile(rb'<tileset[^>]*\bsource="([^"]+)"')
+
+
+def compiled_path(tmx_path: str) -> str:
+    """พาธของแผนที่ที่คอมไพล์แล้ว (อยู่ข้างไฟล์ TMX)"""
+    return os.path.splitext(tmx_path)[0] + COMPILED_EXTENSION
+
+
+def source_hash(tmx_path: str) -> bytes:
+    """
+    SHA-1 ของเนื้อหาไฟล์ TMX และไฟล์ TSX ที่อ้างถึง
+
+    :param tmx_path: พาธไปยังไฟล์ TMX
+    :return: digest ขนาด 20 ไบต์
+    """
+    digest = hashlib.sha1()
+    with open(tmx_path, "rb") as f:
+        content = f.read()
+    digest.update(content)
+    base = os.path.dirname(tmx_path)
+    for source in _TILESET_SOURCE.findall(content):
+        tsx_path = os.path.join(base, source.decode("utf-8"))
+        if os.path.isfile(tsx_path):
+            with open(tsx_path, "rb") as f:
+                digest.update(f.read())
+    return digest.digest()
+
+
+class CompiledTileset:
+    """ข้อมูล tileset ที่จำเป็นสำหรับโหลดภาพ (แทน pytmx.TiledTileset)"""
+    def __init__(self, meta):
+        self.name = meta["name"]
+        self.firstgid = meta["firstgid"]
+        self.source = meta["source"]
+        self.trans = meta["trans"]
+        self.tilewidth = meta["tilewidth"]
+        self.tileheight = meta["tileheight"]
+        self.width = meta["width"]
+        self.height = meta["height"]
+        self.offset = tuple(meta["offset"])
+        self.properties = {}
+
+
+class CompiledTileLayer:
+    """เลเยอร์ tile ที่เก็บ gid ใน array (แทน pytmx.TiledTileLayer, ใช้ layer.data[y][x] ได้เหมือนเดิม)"""
+    def __init__(self, meta, gids):
+        self.name = meta["name"]
+        self.width = meta["width"]
+        self.height = meta["height"]
+        self.visible = meta["visible"]
+        self.opacity = meta["opacity"]
+        self.offsetx = meta["offsetx"]
+        self.offsety = meta["offsety"]
+        self.properties = {}
+        self.data = [gids[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+
+
+class CompiledMap:
+    """
+    แผนที่ที่โหลดจากไฟล์คอมไพล์ ใช้แทน pytmx.TiledMap ในส่วนที่เกมใช้
+    (width, height, tilesets, visible_layers, get_tile_image_by_gid, get_tile_properties_by_gid)
+    """
+    def __init__(self, filename, meta, layers, tile_flags):
+        self.filename = filename
+        self.width = meta["width"]
+        self.height = meta["height"]
+        self.tilewidth = meta["tilewidth"]
+        self.tileheight = meta["tileheight"]
+        self.orientation = meta["orientation"]
+        self.tilesets = [CompiledTileset(ts) for ts in meta["tilesets"]]
+        self.layers = layers
+        self.tile_flags = tile_flags  # gid -> บิตของ FLAG_PROPERTIES
+        self.images = self._load_images(meta["images"])
+        self._properties = {gid: {name: True for bit, name in enumerate(FLAG_PROPERTIES) if flags >> bit & 1}
+                            for gid, flags in enumerate(tile_flags) if flags}
+
+    def _load_images(self, entries):
+        """ตัดภาพ tile จากภาพของ tileset ด้วย loader เดียวกับ pytmx.load_pygame"""
+        images = [None] * len(entries)
+        loaders = {}
+        for gid, entry in enumerate(entries):
+            if entry is None:
+                continue
+            index, x, y, flipped_h, flipped_v, flipped_d = entry
+            loader = loaders.get(index)
+            if loader is None:
+                tileset = self.tilesets[index]
+                path = os.path.join(os.path.dirname(self.filename), tileset.source)
+                loader = loaders[index] = pygame_image_loader(path, tileset.trans)
+            tileset = self.tilesets[index]
+            rect = (x, y, tileset.tilewidth, tileset.tileheight)
+            images[gid] = loader(rect, pytmx.TileFlags(flipped_h, flipped_v, flipped_d))
+        return images
+
+    @property
+    def visible_layers(self):
+        """เลเยอร์ที่มองเห็นได้ทั้งหมด"""
+        return (layer for layer in self.layers if layer.visible)
+
+    def get_tile_image_by_gid(self, gid: int):
+        """ภาพของ tile ตาม gid (None ถ้าไม่มีภาพ)"""
+        return self.images[gid]
+
+    def get_tile_properties_by_gid(self, gid: int):
+        """property ของ tile ตาม gid (เฉพาะ FLAG_PROPERTIES, None ถ้าไม่มี)"""
+        return self._properties.get(gid)
+
+
+def _image_entries(tmx_data):
+    """ตำแหน่งภาพของแต่ละ gid ภายใน tileset: [index ของ tileset, x, y, flip แนวนอน, flip แนวตั้ง, flip ทแยง]"""
+    tilesets = sorted(enumerate(tmx_data.tilesets), key=lambda item: item[1].firstgid)
+    entries = [None] * tmx_data.maxgid
+    for gid in range(1, tmx_data.maxgid):
+        tiled_gid = tmx_data.tiledgidmap[gid]
+        flags = next(f for g, f in tmx_data.gidmap[tiled_gid] if g == gid)
+        index, tileset = next((i, ts) for i, ts in reversed(tilesets) if ts.firstgid <= tiled_gid)
+        if tileset.source is None:
+            raise ValueError(f"tileset '{tileset.name}' has no image")
+
+        # ลำดับของ tile ในภาพเหมือนกับ TiledMap.reload_images
+        step_x = tileset.tilewidth + tileset.spacing
+        step_y = tileset.tileheight + tileset.spacing
+        columns = len(range(tileset.margin, tileset.width + tileset.margin - tileset.tilewidth + 1, step_x))
+        rows = len(range(tileset.margin, tileset.height + tileset.margin - tileset.tileheight + 1, step_y))
+        local_id = tiled_gid - tileset.firstgid
+        if columns == 0 or local_id >= columns * rows:
+            continue  # gid อยู่นอกภาพของ tileset (pytmx ก็ไม่มีภาพให้เช่นกัน)
+        entries[gid] = [index,
+                        tileset.margin + (local_id % columns) * step_x,
+                        tileset.margin + (local_id // columns) * step_y,
+                        int(flags.flipped_horizontally), int(flags.flipped_vertically),
+                        int(flags.flipped_diagonally)]
+    return entries
+
+
+def write_compiled(tmx_data, path: str, digest: bytes):
+    """
+    คอมไพล์แผนที่ที่โหลดด้วย pytmx แล้วเขียนลงไฟล์
+
+    :param tmx_data: แผนที่จาก pytmx.load_pygame
+    :param path: พาธของไฟล์ที่ต้องการเขียน
+    :param digest: SHA-1 ของไฟล์ต้นฉบับจาก source_hash()
+    """
+    if any(props.get("source") for props in tmx_data.tile_properties.values()):
+        raise ValueError("tiles with their own images are not supported")
+
+    tile_layers = [layer for layer in tmx_data.layers if isinstance(layer, pytmx.TiledTileLayer)]
+    tile_flags = bytearray(tmx_data.maxgid)
+    for gid in range(1, tmx_data.maxgid):
+        props = tmx_data.get_tile_properties_by_gid(gid) or {}
+        for bit, name in enumerate(FLAG_PROPERTIES):
+            if props.get(name):
+                tile_flags[gid] |= 1 << bit
+
+    meta = {
+        "byteorder": sys.byteorder,
+        "itemsize": array(GID_TYPECODE).itemsize,
+        "width": tmx_data.width,
+        "height": tmx_data.height,
+        "tilewidth": tmx_data.tilewidth,
+        "tileheight": tmx_data.tileheight,
+        "orientation": tmx_data.orientation,
+        "tilesets": [{
+            "name": ts.name, "firstgid": ts.firstgid, "source": ts.source, "trans": ts.trans,
+            "tilewidth": ts.tilewidth, "tileheight": ts.tileheight,
+            "width": ts.width, "height": ts.height, "offset": list(ts.offset),
+        } for ts in tmx_data.tilesets],
+        "layers": [{
+            "name": layer.name, "width": layer.width, "height": layer.height,
+            "visible": bool(layer.visible), "opacity": layer.opacity,
+            "offsetx": layer.offsetx, "offsety": layer.offsety,
+        } for layer in tile_layers],
+        "images": _image_entries(tmx_data),
+    }
+    meta_bytes = json.dumps(meta).encode("utf-8")
+
+    # เขียนลงไฟล์ชั่วคราวก่อน แล้วค่อยแทนที่ เพื่อไม่ให้อ่านไฟล์ที่เขียนไม่เสร็จ
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, digest, len(meta_bytes)))
+        f.write(meta_bytes)
+        for layer in tile_layers:
+            array(GID_TYPECODE, (gid for row in layer.data for gid in row)).tofile(f)
+        f.write(tile_flags)
+    os.replace(temp_path, path)
+
+
+def load_compiled(path: str, digest: bytes):
+    """
+    โหลดแผนที่ที่คอมไพล์แล้ว
+
+    :param path: พาธของไฟล์ที่คอมไพล์แล้ว
+    :param digest: SHA-1 ของไฟล์ต้นฉบับปัจจุบัน
+    :return: CompiledMap หรือ None ถ้าไม่มีไฟล์หรือไฟล์ไม่ตรงกับต้นฉบับ
+    """
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        magic, version, stored_digest, meta_length = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION or stored_digest != digest:
+            return None
+        offset = HEADER.size + meta_length
+        meta = json.loads(data[HEADER.size:offset].decode("utf-8"))
+        if meta["byteorder"] != sys.byteorder or meta["itemsize"] != array(GID_TYPECODE).itemsize:
+            return None
+
+        layers = []
+        for layer_meta in meta["layers"]:
+            gids = array(GID_TYPECODE)
+            length = layer_meta["width"] * layer_meta["height"] * gids.itemsize
+            gids.frombytes(data[offset:offset + length])
+            offset += length
+            layers.append(CompiledTileLayer(layer_meta, gids))
+        tile_flags = bytearray(data[offset:offset + len(meta["images"])])
+    except (ValueError, KeyError, struct.error) as e:
+        print(f"Ignoring invalid compiled map: {path} ({e})")
+        return None
+    return CompiledMap(path, meta, layers, tile_flags)
+
+
+def load_map(tmx_path: str):
+    """
+    โหลดแผนที่จากไฟล์คอมไพล์ถ้ายังตรงกับ TMX/TSX ไม่เช่นนั้นอ่าน XML ด้วย pytmx แล้วคอมไพล์เก็บไว้
+
+    :param tmx_path: พาธไปยังไฟล์ TMX
+    :return: CompiledMap หรือ pytmx.TiledMap
+    """
+    digest = source_hash(tmx_path)
+    path = compiled_path(tmx_path)
+    compiled = load_compiled(path, digest)
+    if compiled is not None:
+        return compiled
+
+    tmx_data = pytmx.load_pygame(tmx_path)
+    try:
+        write_compiled(tmx_data, path, digest)
+    except (OSError, ValueError) as e:
+        print(f"Unable to write compiled map: {path} ({e})")
+    return tmx_data
@@ -0,0 +1,140 @@
+import math
+import pygame
+from .tile_cache import quantize_zoom
+
+
+class MapRenderer:
+    """
+    วาดเลเยอร์ tile ของแผนที่ล่วงหน้าลงบน chunk ขนาดคงที่
+    - แบ่งภาพแผนที่ทั้งหมด (ในพิกัดหน้าจอที่ซูมแล้ว) เป็น chunk สี่เหลี่ยม
+    - สร้าง chunk ครั้งเดียวต่อระดับการซูม และสร้างเฉพาะ chunk ที่ถูกมองเห็น
+    - ทุกเฟรมวาดเฉพาะ chunk ที่ตัดกับหน้าจอ
+    """
+    def __init__(self, iso_map, tile_cache, config, chunk_size: int = 512):
+        """
+        :param iso_map: แผนที่ Isometric ที่ต้องการวาด
+        :param tile_cache: แคชภาพ tile ที่ปรับขนาดตามการซูม
+        :param config: object ที่เก็บการตั้งค่าเกม
+        :param chunk_size: ขนาดด้านของ chunk (พิกเซล)
+        """
+        self.iso_map = iso_map
+        self.tile_cache = tile_cache
+        self.config = config
+        self.chunk_size = chunk_size
+        self._zoom_key = None
+        self._zoom = 1.0
+        self._origin = (0, 0)  # มุมซ้ายบนของภาพแผนที่ในพิกัดที่ซูมแล้ว
+        self._grid_size = (0, 0)  # จำนวน chunk ในแนวนอนและแนวตั้ง
+        self._chunks = {}  # (cx, cy) -> pygame.Surface ที่วาดไว้แล้ว หรือ None ถ้าว่าง
+
+        # จำนวน tile ที่ต้องเผื่อ เพราะภาพ tile สูงกว่าพื้นที่ของ tile
+        max_width, max_height = iso_map.get_max_tile_size()
+        self._max_tile_size = (max_width, max_height)
+        self._tile_margin = math.ceil((max_width / (config.TILE_WIDTH / 2) +
+                                       max_height / (config.TILE_HEIGHT / 2)) / 2) + 1
+
+    def invalidate(self):
+        """ล้าง chunk ทั้งหมด ใช้เมื่อแผนที่ถูกแก้ไข"""
+        self._zoom_key = None
+        self._chunks = {}
+
+    def _prepare(self, zoom: float):
+        """คำนวณขอบเขตของ chunk ใหม่เมื่อระดับการซูมเปลี่ยน"""
+        zoom_key = quantize_zoom(zoom, self.tile_cache.precision)
+        if zoom_key == self._zoom_key:
+            return
+        self._zoom_key = zoom_key
+        self._zoom = zoom_key / self.tile_cache.precision
+        self._chunks = {}
+
+        # ขอบเขตของภาพแผนที่ทั้งหมดในระบบ Isometric
+        width = self.iso_map.tmx_data.width
+        height = self.iso_map.tmx_data.height
+        left = self.iso_map.cart_to_iso(0, height - 1)[0]
+        right = self.iso_map.cart_to_iso(width - 1, 0)[0] + self._max_tile_size[0]
+        bottom = self.iso_map.cart_to_iso(width - 1, height - 1)[1] + self._max_tile_size[1]
+
+        self._origin = (int(left * self._zoom), 0)
+        self._grid_size = (math.ceil((right - left) * self._zoom / self.chunk_size),
+                           math.ceil(bottom * self._zoom / self.chunk_size))
+
+    def _build_chunk(self, key):
+        """วาด tile ทั้งหมดที่ทับ chunk นี้ลงบน surface เดียว (ตามลำดับการวาดเดิม)"""
+        zoom = self._zoom
+        chunk_x = self._origin[0] + key[0] * self.chunk_size
+        chunk_y = self._origin[1] + key[1] * self.chunk_size
+
+        # หาช่วง tile ที่ทับ chunk ด้วยการแปลงพิกัดย้อนกลับ
+        tile_range = self.iso_map.get_tile_range(chunk_x / zoom, chunk_y / zoom,
+                                                 (chunk_x + self.chunk_size) / zoom,
+                                                 (chunk_y + self.chunk_size) / zoom,
+                                                 self._tile_margin)
+        surface = None
+        if tile_range is not None:
+            min_x, min_y, max_x, max_y = tile_range
+            for layer in self.iso_map.tile_layers():
+                for y in range(min_y, max_y + 1):
+                    row = layer.data[y]
+                    for x in range(min_x, max_x + 1):
+                        tile = self.tile_cache.get_tile(row[x], zoom)
+                        if not tile:
+                            continue
+                        if surface is None:
+                            surface = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
+                        iso_x, iso_y = self.iso_map.cart_to_iso(x, y)
+                        surface.blit(tile, (int(iso_x * zoom) - chunk_x, int(iso_y * zoom) - chunk_y))
+
+        self._chunks[key] = surface
+        return surface
+
+    def _visible_chunks(self, camera, width: int, height: int):
+        """คืนค่า key ของ chunk ที่ตัดกับหน้าจอ และตำแหน่งจุดกำเนิดแผนที่บนหน้าจอ"""
+        self._prepare(camera.zoom)
+
+        # ตำแหน่งของจุดกำเนิดแผนที่บนหน้าจอ
+        offset_x = self.config.OFFSET_X + camera.position.x
+        offset_y = self.config.OFFSET_Y + camera.position.y
+        size = self.chunk_size
+
+        # หาช่วง chunk ที่ตัดกับหน้าจอ
+        view_left = -offset_x - self._origin[0]
+        view_top = -offset_y - self._origin[1]
+        first_cx = max(0, math.floor(view_left / size))
+        last_cx = min(self._grid_size[0] - 1, math.floor((view_left + width) / size))
+        first_cy = max(0, math.floor(view_top / size))
+        last_cy = min(self._grid_size[1] - 1, math.floor((view_top + height) / size))
+
+        keys = [(cx, cy) for cy in range(first_cy, last_cy + 1) for cx in range(first_cx, last_cx + 1)]
+        return keys, (offset_x, offset_y)
+
+    def prebuild(self, camera, width: int, height: int):
+        """
+        สร้าง chunk ที่มองเห็นจากมุมกล้องที่กำหนดไว้ล่วงหน้า (เช่น ระหว่างแสดงเมนู)
+
+        :param camera: object กล้องที่ใช้ในการมองแผนที่
+        :param width: ความกว้างของหน้าจอ
+        :param height: ความสูงของหน้าจอ
+        """
+        keys, _ = self._visible_chunks(camera, width, height)
+        for key in keys:
+            if key not in self._chunks:
+                self._build_chunk(key)
+
+    def draw(self, screen, camera):
+        """
+        วาดแผนที่โดยใช้ chunk ที่สร้างไว้แล้ว
+
+        :param screen: หน้าจอที่ต้องการวาด
+        :param camera: object กล้องที่ใช้ในการมองแผนที่
+        """
+        keys, (offset_x, offset_y) = self._visible_chunks(camera, screen.get_width(), screen.get_height())
+        size = self.chunk_size
+
+        for key in keys:
+            if key in self._chunks:
+                chunk = self._chunks[key]
+            else:
+                chunk = self._build_chunk(key)
+            if chunk is not None:
+                screen.blit(chunk, (offset_x + self._origin[0] + key[0] * size,
+                                    offset_y + self._origin[1] + key[1] * size))
@@ -2,9 +2,11 @@ import pygame
 import sys
 
 class GameMenu:
-    def __init__(self, screen, config):
+    def __init__(self, screen, config, preloader=None):
         self.screen = screen
         self.config = config
+        self.preloader = preloader  # AssetPreloader running in the background (optional)
+        self.start_requested = False
         self.width = config.SCREEN_WIDTH
         self.height = config.SCREEN_HEIGHT
         
@@ -14,6 +16,8 @@ class GameMenu:
         self.BUTTON_COLOR = (30, 144, 255)
         self.BUTTON_HOVER_COLOR = (0, 191, 255)
         self.TEXT_COLOR = (255, 255, 255)
+        self.PROGRESS_BG_COLOR = (25, 25, 112)
+        self.PROGRESS_COLOR = (50, 205, 50)
         
         # Fonts
         self.title_font = pygame.font.Font(None, 74)
@@ -124,6 +128,10 @@ class GameMenu:
             text_rect = text.get_rect(center=button['rect'].center)
             self.screen.blit(text, text_rect)
         
+        # Draw loading progress
+        if self.preloader is not None and not self.preloader.done:
+            self.draw_progress()
+        
         # Draw instructions
         hint_text = self.small_font.render('Use Arrow Keys ↑↓ or Mouse | Enter/Space to Select', True, (255, 255, 255))
         hint_rect = hint_text.get_rect(center=(self.width // 2, self.height - 50))
@@ -131,6 +139,23 @@ class GameMenu:
         
         pygame.display.flip()
     
+    def draw_progress(self):
+        bar_width = 400
+        bar_height = 16
+        bar_rect = pygame.Rect(self.width // 2 - bar_width // 2, self.height - 110, bar_width, bar_height)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_width * self.preloader.progress)
+        
+        pygame.draw.rect(self.screen, self.PROGRESS_BG_COLOR, bar_rect, border_radius=8)
+        if fill_rect.width > 0:
+            pygame.draw.rect(self.screen, self.PROGRESS_COLOR, fill_rect, border_radius=8)
+        pygame.draw.rect(self.screen, self.TEXT_COLOR, bar_rect, 2, border_radius=8)
+        
+        label = 'Starting...' if self.start_requested else f'Loading {self.preloader.status}...'
+        text = self.small_font.render(label, True, self.TEXT_COLOR)
+        text_rect = text.get_rect(center=(self.width // 2, bar_rect.top - 20))
+        self.screen.blit(text, text_rect)
+    
     def run(self):
         clock = pygame.time.Clock()
         
@@ -138,6 +163,9 @@ class GameMenu:
             action = self.handle_events()
             
             if action == 'start':
+                # Wait for background loading so the game opens without a freeze
+                self.start_requested = True
+            if self.start_requested and (self.preloader is None or self.preloader.done):
                 return 'start'
             elif action == 'settings':
                 return 'settings'
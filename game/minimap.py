@@ -0,0 +1,144 @@
+import pygame
+
+
+class Minimap:
+    """
+    แผนที่ย่อแบบมองจากด้านบน (พิกัดคาร์ทีเซียน)
+    - ย่อเลเยอร์ของ TMX เป็นภาพพื้นฐานเพียงครั้งเดียว (สีเฉลี่ยของ tile บนสุดในแต่ละช่อง)
+    - อัปเดตเฉพาะช่องที่เครื่องหมายเปลี่ยน (ยูนิต มอนสเตอร์ บอส Tower และจุดยึดครอง)
+    - วาดกรอบพื้นที่ที่กล้องมองเห็น และรองรับการคลิกเพื่อเลื่อนกล้อง
+    - ประกอบภาพใหม่เฉพาะเมื่อมีการเปลี่ยนแปลง ทุกเฟรมจึงเหลือการ blit เพียงครั้งเดียว
+    """
+    BACKGROUND_COLOR = (0, 0, 0)
+    BORDER_COLOR = (255, 255, 255)
+    VIEWPORT_COLOR = (255, 255, 0)
+
+    def __init__(self, iso_map, config, rect):
+        """
+        :param iso_map: แผนที่ Isometric
+        :param config: object ที่เก็บการตั้งค่าเกม
+        :param rect: ตำแหน่งและขนาดของแผนที่ย่อบนหน้าจอ
+        """
+        self.iso_map = iso_map
+        self.config = config
+        self.rect = pygame.Rect(rect)
+
+        # ขนาดของหนึ่งช่องบนแผนที่ย่อ (น้อยกว่า 1 พิกเซลได้สำหรับแผนที่ขนาดใหญ่)
+        width = iso_map.tmx_data.width
+        height = iso_map.tmx_data.height
+        self._scale = min(self.rect.width / width, self.rect.height / height)
+        map_size = (max(1, int(width * self._scale)), max(1, int(height * self._scale)))
+        self._map_offset = ((self.rect.width - map_size[0]) // 2, (self.rect.height - map_size[1]) // 2)
+
+        self._base = self._build_base(map_size)  # ภาพพื้นฐานจาก TMX
+        self._map_surface = self._base.copy()  # ภาพพื้นฐาน + เครื่องหมาย
+        self._surface = pygame.Surface(self.rect.size)  # ภาพที่แสดงบนหน้าจอ
+        self._markers = {}  # (x, y) -> สีของเครื่องหมาย
+        self._viewport = None
+        self._dirty = True
+
+    def _cell_rect(self, x: int, y: int):
+        """พื้นที่ของช่อง (x, y) บนภาพแผนที่ย่อ"""
+        left = int(x * self._scale)
+        top = int(y * self._scale)
+        return pygame.Rect(left, top,
+                           max(1, int((x + 1) * self._scale) - left),
+                           max(1, int((y + 1) * self._scale) - top))
+
+    def _build_base(self, map_size):
+        """ย่อเลเยอร์ของแผนที่เป็นภาพพื้นฐาน"""
+        surface = pygame.Surface(map_size)
+        surface.fill(self.BACKGROUND_COLOR)
+        tmx_data = self.iso_map.tmx_data
+
+        # tile บนสุดที่มีภาพของแต่ละช่อง
+        top_gids = [[0] * tmx_data.width for _ in range(tmx_data.height)]
+        for layer in self.iso_map.tile_layers():
+            for y, row in enumerate(layer.data):
+                top_row = top_gids[y]
+                for x, gid in enumerate(row):
+                    if gid:
+                        top_row[x] = gid
+
+        colors = {}  # gid -> สีเฉลี่ยของภาพ tile
+        for y, row in enumerate(top_gids):
+            for x, gid in enumerate(row):
+                if not gid:
+                    continue
+                color = colors.get(gid)
+                if color is None:
+                    image = tmx_data.get_tile_image_by_gid(gid)
+                    color = pygame.transform.average_color(image, consider_alpha=True)[:3] if image else self.BACKGROUND_COLOR
+                    colors[gid] = color
+                surface.fill(color, self._cell_rect(x, y))
+        return surface
+
+    def _viewport_points(self, camera):
+        """มุมทั้งสี่ของหน้าจอบนแผนที่ย่อ"""
+        points = []
+        for screen_x, screen_y in ((0, 0), (self.config.SCREEN_WIDTH, 0),
+                                   (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT),
+                                   (0, self.config.SCREEN_HEIGHT)):
+            cart_x, cart_y = self.iso_map.screen_to_cart(screen_x, screen_y, camera, camera.zoom)
+            points.append((int(self._map_offset[0] + cart_x * self._scale),
+                           int(self._map_offset[1] + cart_y * self._scale)))
+        return points
+
+    def update(self, markers, camera):
+        """
+        อัปเดตเครื่องหมายและกรอบของกล้อง (ประกอบภาพใหม่เฉพาะเมื่อมีการเปลี่ยนแปลง)
+
+        :param markers: รายการ ((x, y), สี) เรียงจากความสำคัญต่ำไปสูง
+        :param camera: object กล้องที่ใช้ในการมองแผนที่
+        """
+        new_markers = {}
+        for (x, y), color in markers:
+            new_markers[(int(x), int(y))] = color
+
+        if new_markers != self._markers:
+            # คืนภาพพื้นฐานให้ช่องที่ไม่มีเครื่องหมายแล้ว
+            for cell in self._markers.keys() - new_markers.keys():
+                cell_rect = self._cell_rect(*cell)
+                self._map_surface.blit(self._base, cell_rect, cell_rect)
+            # วาดเฉพาะช่องที่เครื่องหมายเปลี่ยน
+            for cell, color in new_markers.items():
+                if self._markers.get(cell) != color:
+                    self._map_surface.fill(color, self._cell_rect(*cell))
+            self._markers = new_markers
+            self._dirty = True
+
+        viewport = self._viewport_points(camera)
+        if viewport != self._viewport:
+            self._viewport = viewport
+            self._dirty = True
+
+        if self._dirty:
+            self._surface.fill(self.BACKGROUND_COLOR)
+            self._surface.blit(self._map_surface, self._map_offset)
+            pygame.draw.polygon(self._surface, self.VIEWPORT_COLOR, self._viewport, 1)
+            pygame.draw.rect(self._surface, self.BORDER_COLOR, self._surface.get_rect(), 1)
+            self._dirty = False
+
+    def draw(self, screen):
+        """
+        วาดแผนที่ย่อลงบนหน้าจอ
+
+        :param screen: หน้าจอที่ต้องการวาด
+        :return: พื้นที่บนหน้าจอที่ถูกวาด
+        """
+        return screen.blit(self._surface, self.rect)
+
+    def handle_click(self, pos, camera) -> bool:
+        """
+        เลื่อนกล้องไปยังตำแหน่งที่คลิกบนแผนที่ย่อ
+
+        :param pos: ตำแหน่งเมาส์บนหน้าจอ
+        :param camera: object กล้องที่ต้องการเลื่อน
+        :return: True ถ้าคลิกอยู่บนแผนที่ย่อ
+        """
+        if not self.rect.collidepoint(pos):
+            return False
+        cart_x = (pos[0] - self.rect.x - self._map_offset[0]) / self._scale
+        cart_y = (pos[1] - self.rect.y - self._map_offset[1]) / self._scale
+        camera.center_on(*self.iso_map.cart_to_iso(cart_x, cart_y))
+        return True
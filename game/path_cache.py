@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+
+class PathCache:
+    """
+    แคชผลการค้นหาเส้นทางของ PathFinder.find_path
+    - key คือ (จุดเริ่มต้น, จุดหมาย, version ของตารางช่องที่เดินได้) จึงไม่คืนเส้นทางที่สร้างจากแผนที่เก่า
+    - จำกัดจำนวนรายการ และลบรายการที่ไม่ได้ใช้นานที่สุด (LRU) เมื่อเกิน
+    - นับจำนวนครั้งที่พบ (hits) และไม่พบ (misses) ในแคช
+    """
+    def __init__(self, max_entries: int = 256):
+        """
+        :param max_entries: จำนวนเส้นทางสูงสุดในแคช (0 = ไม่เก็บแคช)
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def get(self, start, goal, version: int):
+        """
+        ดึงเส้นทางจากแคช
+
+        :param start: จุดเริ่มต้น
+        :param goal: จุดหมายปลายทาง
+        :param version: version ของตารางช่องที่เดินได้ในปัจจุบัน
+        :return: tuple ของตำแหน่งในเส้นทาง หรือ None ถ้าไม่มีในแคช
+        """
+        key = (start, goal, version)
+        path = self._cache.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return path
+
+    def put(self, start, goal, version: int, path):
+        """
+        เก็บเส้นทางลงแคช (รวมถึงผลที่หาเส้นทางไม่พบ)
+
+        :param path: รายการตำแหน่งในเส้นทาง (เก็บเป็น tuple เพื่อไม่ให้ถูกแก้ไขจากภายนอก)
+        """
+        if self.max_entries <= 0:
+            return
+        key = (start, goal, version)
+        self._cache[key] = tuple(path)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def invalidate(self):
+        """ลบเส้นทางทั้งหมด (เรียกเมื่อช่องที่เดินได้เปลี่ยน) โดยเก็บตัวนับไว้"""
+        self._cache.clear()
+
+    def hit_rate(self) -> float:
+        """สัดส่วนการพบในแคช (0.0 - 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """ล้างแคชและตัวนับทั้งหมด"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
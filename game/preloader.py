@@ -0,0 +1,96 @@
+import threading
+from .camera import Camera
+from .game import Game
+from .iso_map import IsometricMap
+from .map_renderer import MapRenderer
+from .sprite_atlas import sprite_atlas
+from .tile_cache import ScaledTileCache
+from .walkability import WalkabilityGrid
+
+
+class AssetPreloader:
+    """
+    โหลดแผนที่และทรัพยากรของเกมใน worker thread ระหว่างที่เมนูแสดงอยู่
+    - เริ่มทำงานทันทีที่เรียก start() และรายงานความคืบหน้าผ่าน progress (0.0 - 1.0)
+    - ผลลัพธ์ (แผนที่ แคช tile chunk ของมุมกล้องเริ่มต้น และ PathFinder) ถูกส่งต่อให้ Game(config, preload=...)
+    - ภาพ ฟอนต์ และเสียงถูกเก็บไว้ใน AssetManager / SoundBank ที่ใช้ร่วมกัน
+    - ต้องสร้างหน้าต่างด้วย pygame.display.set_mode ก่อนเริ่ม เพราะการ convert ภาพต้องใช้รูปแบบพิกเซลของหน้าจอ
+    """
+    def __init__(self, config, tmx_path: str = Game.MAP_PATH):
+        """
+        :param config: object ที่เก็บการตั้งค่าเกม
+        :param tmx_path: พาธไปยังไฟล์ TMX ของแผนที่
+        """
+        self.config = config
+        self.tmx_path = tmx_path
+        self.iso_map = None
+        self.tile_cache = None
+        self.map_renderer = None
+        self.walkability = None
+        self.path_finder = None
+        self.progress = 0.0
+        self.status = ""  # ชื่อขั้นตอนที่กำลังโหลด
+        self.error = None  # exception ที่เกิดใน worker thread (ถ้ามี)
+        self._thread = None
+        self._steps = [
+            ("Sprites", sprite_atlas.build),
+            ("Map", self._load_map),
+            ("Assets", Game.preload_assets),
+            ("Terrain", self._prebuild_terrain),
+            ("Paths", self._prepare_paths),
+        ]
+
+    def _load_map(self):
+        """อ่านไฟล์ TMX และเตรียมแคชสำหรับวาดแผนที่"""
+        self.iso_map = IsometricMap(self.tmx_path, self.config)
+        self.tile_cache = ScaledTileCache(self.iso_map.tmx_data, self.config.TILE_CACHE_SIZE)
+        self.map_renderer = MapRenderer(self.iso_map, self.tile_cache, self.config, self.config.MAP_CHUNK_SIZE)
+
+    def _prebuild_terrain(self):
+        """สร้าง chunk ของแผนที่ที่มองเห็นจากมุมกล้องเริ่มต้น เพื่อให้เฟรมแรกไม่ต้องรอ"""
+        camera = Camera(self.config, self.iso_map.width, self.iso_map.height)
+        self.map_renderer.prebuild(camera, self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
+
+    def _prepare_paths(self):
+        """สร้างตารางช่องที่เดินได้และ PathFinder รวมถึงกราฟระดับบนของ HPA* (ใช้เวลาหลายวินาทีบนแผนที่ใหญ่)"""
+        self.walkability = WalkabilityGrid.from_map(self.iso_map)
+        self.path_finder = Game.create_path_finder(self.iso_map, self.walkability, self.config)
+        if self.path_finder.hierarchy is not None:
+            self.path_finder.hierarchy.prebuild()
+
+    def _run(self):
+        """ทำงานทีละขั้นตอนใน worker thread"""
+        try:
+            for i, (status, step) in enumerate(self._steps):
+                self.status = status
+                step()
+                self.progress = (i + 1) / len(self._steps)
+        except Exception as e:
+            self.error = e
+
+    def start(self):
+        """เริ่มโหลดใน worker thread (เรียกซ้ำได้ จะเริ่มเพียงครั้งเดียว)"""
+        if self._thread is None:
+            # daemon thread จึงไม่ค้างโปรแกรมถ้าผู้เล่นออกจากเมนูก่อนโหลดเสร็จ
+            self._thread = threading.Thread(target=self._run, name="asset-preloader", daemon=True)
+            self._thread.start()
+        return self
+
+    @property
+    def done(self) -> bool:
+        """True เมื่อ worker thread ทำงานจบแล้ว (สำเร็จหรือเกิดข้อผิดพลาด)"""
+        return self._thread is not None and not self._thread.is_alive()
+
+    def wait(self):
+        """
+        รอจนโหลดเสร็จ (ถ้ายังไม่เริ่มจะโหลดใน thread ปัจจุบัน)
+
+        :return: self
+        """
+        if self._thread is None:
+            self._run()
+        else:
+            self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self
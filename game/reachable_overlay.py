@@ -0,0 +1,88 @@
+import math
+import pygame
+from .tile_cache import quantize_zoom
+
+
+class ReachableOverlay:
+    """
+    ภาพ highlight ของช่องที่ยูนิตเดินไปได้ รวมไว้ใน surface เดียว
+    - สร้างใหม่เฉพาะเมื่อยูนิตที่เลือก ชุดช่องที่เดินได้ หรือระดับการซูมเปลี่ยน
+    - เอฟเฟกต์กะพริบทำได้ด้วยการเปลี่ยนค่า alpha ของ surface
+    """
+    def __init__(self, iso_map, config, color=(255, 255, 0), line_width: int = 2):
+        """
+        :param iso_map: แผนที่ Isometric
+        :param config: object ที่เก็บการตั้งค่าเกม
+        :param color: สีของกรอบ highlight
+        :param line_width: ความหนาของเส้นกรอบ
+        """
+        self.iso_map = iso_map
+        self.config = config
+        self.color = color
+        self.line_width = line_width
+        self._key = None
+        self._surface = None
+        self._origin = (0, 0)  # มุมซ้ายบนของ surface ในพิกัดแผนที่ที่ซูมแล้ว
+
+    def invalidate(self):
+        """บังคับให้สร้างภาพใหม่ในการวาดครั้งถัดไป"""
+        self._key = None
+        self._surface = None
+
+    def _build(self, tiles, zoom: float):
+        """วาดกรอบของทุกช่องที่อยู่ในระยะการเดินลงบน surface เดียว"""
+        tile_width = self.config.TILE_WIDTH * zoom
+        tile_height = self.config.TILE_HEIGHT * zoom
+
+        # กรอบรูปข้าวหลามตัดของหนึ่งช่อง ใช้ร่วมกันทุกช่องที่ระดับการซูมนี้
+        template = pygame.Surface((tile_width, tile_height), pygame.SRCALPHA)
+        points = [
+            (0, tile_height // 2),
+            (tile_width // 2, 0),
+            (tile_width, tile_height // 2),
+            (tile_width // 2, tile_height)
+        ]
+        pygame.draw.lines(template, self.color, True, points, self.line_width)
+
+        # ตำแหน่งของแต่ละช่องในพิกัดแผนที่ที่ซูมแล้ว (ช่องถูกจำกัดด้วยระยะการเดินตั้งแต่ PathFinder.reachable แล้ว)
+        positions = []
+        for tile_x, tile_y in tiles:
+            iso_x, iso_y = self.iso_map.cart_to_iso(tile_x, tile_y)
+            positions.append((iso_x * zoom, iso_y * zoom))
+
+        if not positions:
+            self._surface = None
+            return
+
+        left = math.floor(min(x for x, _ in positions))
+        top = math.floor(min(y for _, y in positions))
+        right = math.ceil(max(x for x, _ in positions)) + template.get_width()
+        bottom = math.ceil(max(y for _, y in positions)) + template.get_height()
+
+        self._surface = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        self._origin = (left, top)
+        for x, y in positions:
+            self._surface.blit(template, (x - left, y - top))
+
+    def draw(self, screen, camera, unit, tiles, alpha: int):
+        """
+        วาด highlight ช่องที่เดินได้ลงบนหน้าจอ
+
+        :param screen: หน้าจอที่ต้องการวาด
+        :param camera: object กล้องที่ใช้ในการมองแผนที่
+        :param unit: ยูนิตที่ถูกเลือก
+        :param tiles: รายการช่องที่เดินได้ [(x, y), ...]
+        :param alpha: ความโปร่งใสของเฟรมนี้ (0-255)
+        :return: พื้นที่บนหน้าจอที่ถูกวาด หรือ None ถ้าไม่มีอะไรให้วาด
+        """
+        key = (unit, unit.x, unit.y, tiles, len(tiles), quantize_zoom(camera.zoom))
+        if key != self._key:
+            self._key = key
+            self._build(tiles, camera.zoom)
+
+        if self._surface is None:
+            return None
+
+        self._surface.set_alpha(alpha)
+        return screen.blit(self._surface, (self._origin[0] + self.config.OFFSET_X + camera.position.x,
+                                           self._origin[1] + self.config.OFFSET_Y + camera.position.y))
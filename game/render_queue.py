@@ -0,0 +1,100 @@
+class RenderQueue:
+    """
+    คิวการวาดของหนึ่งเฟรม
+    - ทุกสิ่งที่วาดบนแผนที่ส่ง (ความลึก, surface, ตำแหน่ง) เข้าคิว
+    - เรียงตามความลึกแบบ Isometric แล้ววาดทั้งหมดในรอบเดียว
+    - หลอดเลือดและตัวเลขพลังชีวิตถูกวาดรวดเดียวหลังจากวาดโลกเสร็จแล้ว
+    - overlay (เช่น กล่องข้อมูลยูนิต) ถูกวาดหลังจากวาดโลกเสร็จแล้ว
+    """
+    # ลำดับชั้นเมื่ออยู่บน tile เดียวกัน
+    LAYER_GROUND = 0  # เครื่องหมายบนพื้น
+    LAYER_OBJECT = 1  # สิ่งก่อสร้างและจุดยึดครอง
+    LAYER_UNIT = 2  # ยูนิต มอนสเตอร์ และบอส
+
+    def __init__(self):
+        self._items = []
+        self._bars = []
+        self._overlays = []
+        self._order = 0  # รักษาลำดับการส่งเมื่อความลึกเท่ากัน
+
+    @staticmethod
+    def depth_key(x: float, y: float, layer: int = LAYER_UNIT):
+        """
+        คำนวณ key ความลึกแบบ Isometric (ยิ่ง x + y มาก ยิ่งอยู่ใกล้ผู้เล่น)
+
+        :param x: พิกัด x ในระบบคาร์ทีเซียน
+        :param y: พิกัด y ในระบบคาร์ทีเซียน
+        :param layer: ลำดับชั้นเมื่ออยู่บน tile เดียวกัน
+        :return: tuple ที่ใช้เรียงลำดับการวาด
+        """
+        return (x + y, layer)
+
+    def submit(self, depth, surface, position, alpha=None):
+        """
+        ส่งภาพเข้าคิวการวาด
+
+        :param depth: key ความลึกจาก depth_key
+        :param surface: ภาพที่ต้องการวาด
+        :param position: ตำแหน่งบนหน้าจอ
+        :param alpha: ความโปร่งใสขณะวาด (0-255) ใช้กับภาพที่แชร์กันโดยไม่ต้องคัดลอกภาพ
+        """
+        self._items.append((depth, self._order, surface, position, alpha))
+        self._order += 1
+
+    def submit_draw(self, depth, draw_func):
+        """
+        ส่งฟังก์ชันวาด (เช่น เส้นหรือสี่เหลี่ยม) เข้าคิวที่ความลึกที่กำหนด
+
+        :param depth: key ความลึกจาก depth_key
+        :param draw_func: ฟังก์ชันที่รับ screen เป็นอาร์กิวเมนต์ (คืนค่าพื้นที่ที่วาดได้)
+        """
+        self._items.append((depth, self._order, None, draw_func, None))
+        self._order += 1
+
+    def submit_bar(self, surface, position):
+        """
+        ส่งภาพหลอดเลือดหรือป้ายข้อความเข้าชั้นที่วาดทับโลก (ไม่เรียงตามความลึก)
+
+        :param surface: ภาพที่ต้องการวาด
+        :param position: ตำแหน่งบนหน้าจอ
+        """
+        self._bars.append((surface, position))
+
+    def submit_overlay(self, draw_func):
+        """
+        ส่งฟังก์ชันวาดที่ต้องอยู่เหนือทุกสิ่งบนแผนที่
+
+        :param draw_func: ฟังก์ชันที่รับ screen เป็นอาร์กิวเมนต์ (คืนค่าพื้นที่ที่วาดได้)
+        """
+        self._overlays.append(draw_func)
+
+    def flush(self, screen):
+        """
+        เรียงคิวตามความลึก วาดทั้งหมดลงบนหน้าจอ แล้วล้างคิว
+
+        :param screen: หน้าจอที่ต้องการวาด
+        :return: รายการพื้นที่บนหน้าจอที่ถูกวาด (pygame.Rect)
+        """
+        rects = []
+        self._items.sort(key=lambda item: (item[0], item[1]))
+        for _, _, surface, target, alpha in self._items:
+            if surface is None:
+                rects.append(target(screen))
+            elif alpha is None:
+                rects.append(screen.blit(surface, target))
+            else:
+                # ตั้งค่า alpha ชั่วคราวแล้วคืนค่าเดิม เพื่อไม่ให้กระทบผู้ใช้ภาพเดียวกันรายอื่น
+                previous_alpha = surface.get_alpha()
+                surface.set_alpha(alpha)
+                rects.append(screen.blit(surface, target))
+                surface.set_alpha(previous_alpha)
+        if self._bars:
+            rects.extend(screen.blits(self._bars, doreturn=True))
+        for draw_func in self._overlays:
+            rects.append(draw_func(screen))
+
+        self._items.clear()
+        self._bars.clear()
+        self._overlays.clear()
+        self._order = 0
+        return [rect for rect in rects if rect is not None]
@@ -0,0 +1,102 @@
+import pygame
+from .asset_manager import assets
+
+# ระดับความสำคัญของเสียง (สูงกว่า = สำคัญกว่า)
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 1
+
+
+class SoundBank:
+    """
+    คลังเสียงเอฟเฟกต์ที่ใช้ร่วมกันทั้งเกม
+    - ถอดรหัสไฟล์เสียงแต่ละไฟล์เพียงครั้งเดียวผ่าน AssetManager (หน่วยความจำไม่เพิ่มตามจำนวนยูนิต)
+    - จำกัดจำนวนเสียงเดียวกันที่เล่นพร้อมกัน ถ้าเกินจะหยุดเสียงที่เริ่มเล่นก่อนสุด
+    - จองช่องเสียง (channel) ไว้ให้เสียงสำคัญ เช่น บอสเกิด ไม่ถูกเสียงโจมตีแย่งช่อง
+    """
+    def __init__(self, num_channels: int = 16, reserved_channels: int = 2):
+        """
+        :param num_channels: จำนวนช่องเสียงทั้งหมดของ mixer
+        :param reserved_channels: จำนวนช่องเสียงที่จองไว้ให้เสียงความสำคัญสูง
+        """
+        self.num_channels = num_channels
+        self.reserved_channels = reserved_channels
+        self._effects = {}  # พาธ -> (ความสำคัญ, จำนวนเสียงสูงสุด, ระดับเสียง)
+        self._voices = {}  # พาธ -> รายการ Channel ที่กำลังเล่นเสียงนั้น (เก่าไปใหม่)
+        self._configured = False
+
+    def _configure_mixer(self) -> bool:
+        """ตั้งค่าจำนวนช่องเสียงและการจองช่องครั้งแรกที่ mixer พร้อมใช้งาน"""
+        if not pygame.mixer.get_init():
+            return False
+        if not self._configured:
+            pygame.mixer.set_num_channels(self.num_channels)
+            pygame.mixer.set_reserved(self.reserved_channels)
+            self._configured = True
+        return True
+
+    def register(self, path: str, priority: int = PRIORITY_NORMAL, max_instances: int = 2, volume: float = 1.0):
+        """
+        ลงทะเบียนเสียงเอฟเฟกต์และโหลดไว้ล่วงหน้า
+
+        :param path: พาธของไฟล์เสียง
+        :param priority: ความสำคัญของเสียง (PRIORITY_NORMAL หรือ PRIORITY_HIGH)
+        :param max_instances: จำนวนเสียงนี้ที่เล่นพร้อมกันได้สูงสุด
+        :param volume: ระดับเสียง (0.0 - 1.0)
+        """
+        self._effects[path] = (priority, max_instances, volume)
+        assets.get_sound(path)
+
+    def _find_channel(self, priority: int):
+        """
+        หาช่องเสียงว่าง (find_channel ของ pygame ไม่สนใจช่องที่จองไว้ จึงต้องค้นหาเอง)
+        - เสียงความสำคัญสูงใช้ช่องที่จองไว้ก่อน แล้วจึงใช้ช่องทั่วไป
+        - เสียงทั่วไปใช้ได้เฉพาะช่องที่ไม่ได้จอง ถ้าเต็มก็ไม่เล่น
+        """
+        first = 0 if priority >= PRIORITY_HIGH else self.reserved_channels
+        for channel_id in range(first, self.num_channels):
+            channel = pygame.mixer.Channel(channel_id)
+            if not channel.get_busy():
+                return channel
+        if priority >= PRIORITY_HIGH:
+            # ทุกช่องไม่ว่าง: แย่งช่องที่ใช้งานนานที่สุด
+            return pygame.mixer.find_channel(True)
+        return None
+
+    def play(self, path: str):
+        """
+        เล่นเสียงเอฟเฟกต์ตามความสำคัญและจำนวนเสียงสูงสุดที่ลงทะเบียนไว้
+
+        :param path: พาธของไฟล์เสียง (เสียงที่ไม่ได้ลงทะเบียนใช้ค่าเริ่มต้น)
+        :return: Channel ที่เล่นเสียง หรือ None ถ้าไม่ได้เล่น
+        """
+        if not path or not self._configure_mixer():
+            return None
+        priority, max_instances, volume = self._effects.get(path, (PRIORITY_NORMAL, 2, 1.0))
+        sound = assets.get_sound(path)
+
+        # ตัดช่องที่เล่นจบแล้วหรือถูกเสียงอื่นแย่งไปแล้วออก
+        voices = [channel for channel in self._voices.get(path, ())
+                  if channel.get_busy() and channel.get_sound() is sound]
+        if len(voices) >= max_instances:
+            voices.pop(0).stop()  # หยุดเสียงเดียวกันที่เริ่มเล่นก่อนสุด
+
+        channel = self._find_channel(priority)
+        if channel is None:
+            self._voices[path] = voices
+            return None
+        channel.play(sound)
+        channel.set_volume(volume)  # ตั้งหลัง play เพราะ play จะรีเซ็ตระดับเสียงของช่อง
+        voices.append(channel)
+        self._voices[path] = voices
+        return channel
+
+    def stop_all(self):
+        """หยุดเสียงเอฟเฟกต์ทั้งหมด"""
+        for voices in self._voices.values():
+            for channel in voices:
+                channel.stop()
+        self._voices.clear()
+
+
+# ใช้ร่วมกันทั้งเกม
+sound_bank = SoundBank()
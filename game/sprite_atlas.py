@@ -0,0 +1,135 @@
+import os
+import pygame
+from .asset_bundle import load_image
+
+# โฟลเดอร์และไฟล์ภาพที่ถูกรวมไว้ใน atlas
+ATLAS_SOURCES = (
+    "assets/sprites",
+    "assets/Monster",
+    "assets/crystal_mine_nocap.png",
+)
+
+
+class SpriteAtlas:
+    """
+    รวม sprite sheet หลายไฟล์ไว้ใน surface ขนาดใหญ่ไม่กี่แผ่น (atlas)
+    - โหลดและถอดรหัส PNG แต่ละไฟล์เพียงครั้งเดียว แล้วจัดวางแบบชั้นวาง (shelf packing)
+    - เก็บดัชนี ชื่อไฟล์ -> (หมายเลขแผ่น, Rect) สำหรับหาตำแหน่งภาพใน atlas
+    - คืนภาพเป็น subsurface ของ atlas จึงไม่ต้องสร้าง surface ใหม่ต่อการโหลดแต่ละครั้ง
+    """
+    def __init__(self, sources=ATLAS_SOURCES, page_size: int = 1024, padding: int = 1):
+        """
+        :param sources: โฟลเดอร์หรือไฟล์ PNG ที่ต้องการรวมไว้ใน atlas
+        :param page_size: ความกว้างและความสูงสูงสุดของ atlas แต่ละแผ่น (พิกเซล)
+        :param padding: ระยะห่างระหว่างภาพ ป้องกันสีของภาพข้างเคียงซึมเข้ามาเมื่อปรับขนาด
+        """
+        self.sources = sources
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []  # surface ของ atlas แต่ละแผ่น
+        self.index = {}  # ชื่อไฟล์ -> (หมายเลขแผ่น, pygame.Rect)
+        self._images = {}  # ชื่อไฟล์ -> subsurface ของ atlas
+        self._built = False
+
+    @staticmethod
+    def _key(path: str) -> str:
+        """แปลงพาธให้อยู่ในรูปแบบเดียวกันสำหรับใช้เป็น key"""
+        return os.path.normcase(os.path.normpath(path))
+
+    def _collect_files(self):
+        """รายชื่อไฟล์ PNG ทั้งหมดจาก sources"""
+        files = []
+        for source in self.sources:
+            if os.path.isdir(source):
+                for name in sorted(os.listdir(source)):
+                    if name.lower().endswith(".png"):
+                        files.append(os.path.join(source, name))
+            elif os.path.isfile(source):
+                files.append(source)
+        return files
+
+    def _pack(self, sizes):
+        """
+        จัดวางภาพแบบชั้นวาง: เรียงจากสูงไปต่ำ แล้ววางเรียงซ้ายไปขวาทีละชั้น
+
+        :param sizes: dict ชื่อไฟล์ -> (กว้าง, สูง)
+        :return: (dict ชื่อไฟล์ -> (หมายเลขแผ่น, x, y), รายการขนาดของแต่ละแผ่น)
+        """
+        placements = {}
+        page_sizes = []
+        page = -1
+        shelf_x = shelf_y = shelf_height = page_width = 0
+        limit = self.page_size
+
+        order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+        for name in order:
+            width, height = sizes[name]
+            width += self.padding
+            height += self.padding
+
+            # ขึ้นชั้นใหม่เมื่อชั้นปัจจุบันเต็ม
+            if page >= 0 and shelf_x + width > limit:
+                shelf_x = 0
+                shelf_y += shelf_height
+                shelf_height = 0
+
+            # ขึ้นแผ่นใหม่เมื่อแผ่นปัจจุบันเต็ม (ภาพที่ใหญ่กว่าแผ่นจะได้แผ่นของตัวเอง)
+            if page < 0 or shelf_y + height > limit:
+                if page >= 0:
+                    page_sizes.append((page_width, shelf_y + shelf_height))
+                page += 1
+                shelf_x = shelf_y = shelf_height = page_width = 0
+
+            placements[name] = (page, shelf_x, shelf_y)
+            shelf_x += width
+            shelf_height = max(shelf_height, height)
+            page_width = max(page_width, shelf_x)
+
+        if page >= 0:
+            page_sizes.append((page_width, shelf_y + shelf_height))
+        return placements, page_sizes
+
+    def build(self):
+        """โหลดภาพทั้งหมดและสร้าง atlas (ต้องเรียกหลังจากสร้างหน้าต่างด้วย pygame.display.set_mode)"""
+        images = {}
+        for path in self._collect_files():
+            try:
+                images[self._key(path)] = load_image(path).convert_alpha()
+            except pygame.error as e:
+                print(f"Unable to load image for atlas: {path} ({e})")
+
+        placements, page_sizes = self._pack({name: image.get_size() for name, image in images.items()})
+        self.pages = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha() for size in page_sizes]
+        for page in self.pages:
+            page.fill((0, 0, 0, 0))
+
+        self.index = {}
+        self._images = {}
+        for name, (page, x, y) in placements.items():
+            image = images[name]
+            rect = pygame.Rect(x, y, image.get_width(), image.get_height())
+            # BLEND_RGBA_MAX บนแผ่นที่โปร่งใสทั้งหมด = คัดลอกพิกเซลตรง ๆ โดยไม่ผสมค่า alpha
+            self.pages[page].blit(image, rect, special_flags=pygame.BLEND_RGBA_MAX)
+            self.index[name] = (page, rect)
+            self._images[name] = self.pages[page].subsurface(rect)
+        self._built = True
+
+    def get(self, path: str):
+        """
+        ดึงภาพจาก atlas
+
+        :param path: พาธของไฟล์ภาพต้นฉบับ
+        :return: subsurface ของ atlas หรือ None ถ้าภาพไม่ได้อยู่ใน atlas
+        """
+        if not self._built:
+            self.build()
+        return self._images.get(self._key(path))
+
+    def __contains__(self, path: str) -> bool:
+        if not self._built:
+            self.build()
+        return self._key(path) in self._images
+
+
+# ใช้ร่วมกันทั้งเกม
+sprite_atlas = SpriteAtlas()
@@ -0,0 +1,68 @@
+import pygame
+from collections import OrderedDict
+
+
+def quantize_zoom(zoom: float, precision: int = 100) -> int:
+    """
+    ปัดค่าซูมให้เป็นขั้นคงที่เพื่อใช้เป็น key ของแคช
+
+    :param zoom: ระดับการซูมปัจจุบัน
+    :param precision: จำนวนขั้นต่อการซูม 1.0 (100 = ละเอียด 0.01)
+    :return: ระดับการซูมที่ปัดแล้วในรูปจำนวนเต็ม
+    """
+    return int(round(zoom * precision))
+
+
+class ScaledTileCache:
+    """
+    แคชภาพ tile ที่ถูกปรับขนาดตามระดับการซูม
+    - key คือ (gid, ระดับการซูมที่ปัดแล้ว)
+    - ลบรายการที่ไม่ได้ใช้นานที่สุด (LRU) เมื่อแคชเต็ม
+    """
+    def __init__(self, tmx_data, max_size: int = 512, precision: int = 100):
+        """
+        :param tmx_data: ข้อมูลแผนที่จาก pytmx
+        :param max_size: จำนวนภาพสูงสุดที่เก็บในแคช
+        :param precision: จำนวนขั้นของการซูมต่อ 1.0
+        """
+        self.tmx_data = tmx_data
+        self.max_size = max_size
+        self.precision = precision
+        self._cache = OrderedDict()
+
+    def get_tile(self, gid: int, zoom: float):
+        """
+        ดึงภาพ tile ที่ปรับขนาดตามการซูมแล้ว (ปรับขนาดครั้งเดียวต่อระดับการซูม)
+
+        :param gid: Global ID ของ tile
+        :param zoom: ระดับการซูมปัจจุบัน
+        :return: pygame.Surface ของ tile หรือ None ถ้าไม่มีภาพ
+        """
+        tile = self.tmx_data.get_tile_image_by_gid(gid)
+        if not tile:
+            return tile
+
+        zoom_key = quantize_zoom(zoom, self.precision)
+        if zoom_key == self.precision:
+            # ซูม 1.0 ใช้ภาพต้นฉบับได้เลย
+            return tile
+
+        key = (gid, zoom_key)
+        scaled = self._cache.get(key)
+        if scaled is not None:
+            self._cache.move_to_end(key)
+            return scaled
+
+        scaled_zoom = zoom_key / self.precision
+        scaled = pygame.transform.scale(tile, (int(tile.get_width() * scaled_zoom),
+                                               int(tile.get_height() * scaled_zoom)))
+        self._cache[key] = scaled
+
+        # ลบภาพที่ไม่ได้ใช้นานที่สุดเมื่อเกินขนาดแคช
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return scaled
+
+    def clear(self):
+        """ล้างแคชทั้งหมด (เช่น เมื่อแผนที่ถูกแก้ไข)"""
+        self._cache.clear()
@@ -0,0 +1,101 @@
+class WalkabilityGrid:
+    """
+    ตารางช่องที่เดินได้ของแผนที่ (1 ไบต์ต่อช่อง เรียงแถวต่อแถว)
+    - สร้างครั้งเดียวจาก property 'blocked' ของ tile ในทุกเลเยอร์ที่มองเห็น
+    - สิ่งกีดขวางที่เพิ่มระหว่างเกม (เช่น Tower) ถูกนับแยกจากพื้นที่ของแผนที่ จึงลบออกได้
+    - version เพิ่มขึ้นทุกครั้งที่ช่องใดเปลี่ยน และแจ้งผู้ฟัง (listener) พร้อมรายการช่องที่เปลี่ยน
+    """
+    def __init__(self, width: int, height: int, terrain=None):
+        """
+        :param width: จำนวนช่องในแนวนอน
+        :param height: จำนวนช่องในแนวตั้ง
+        :param terrain: bytearray ของพื้นที่ที่เดินได้ตามแผนที่ (None = เดินได้ทุกช่อง)
+        """
+        self.width = width
+        self.height = height
+        self._terrain = bytearray(terrain) if terrain is not None else bytearray(b"\x01") * (width * height)
+        self.cells = bytearray(self._terrain)  # 1 = เดินได้, 0 = ถูกบล็อก
+        self.version = 0
+        self._obstacles = {}  # index -> จำนวนสิ่งกีดขวางบนช่อง
+        self._listeners = []
+
+    @classmethod
+    def from_map(cls, iso_map):
+        """
+        สร้างตารางจากแผนที่ Isometric
+
+        :param iso_map: แผนที่ที่มีเลเยอร์ tile และ property 'blocked'
+        :return: WalkabilityGrid
+        """
+        tmx_data = iso_map.tmx_data
+        width, height = tmx_data.width, tmx_data.height
+        terrain = bytearray(b"\x01") * (width * height)
+        blocked_gids = {}  # gid -> ถูกบล็อกหรือไม่ (อ่าน property ครั้งเดียวต่อ gid)
+        for layer in iso_map.tile_layers():
+            for y, row in enumerate(layer.data):
+                base = y * width
+                for x, gid in enumerate(row):
+                    blocked = blocked_gids.get(gid)
+                    if blocked is None:
+                        props = tmx_data.get_tile_properties_by_gid(gid)
+                        blocked = blocked_gids[gid] = bool(props and props.get('blocked', False))
+                    if blocked:
+                        terrain[base + x] = 0
+        return cls(width, height, terrain)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """ตรวจสอบว่าตำแหน่งอยู่ในขอบเขตของแผนที่"""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """ตรวจสอบว่าช่อง (x, y) อยู่ในแผนที่และเดินผ่านได้"""
+        return 0 <= x < self.width and 0 <= y < self.height and self.cells[y * self.width + x] == 1
+
+    def add_listener(self, callback):
+        """
+        ลงทะเบียนฟังก์ชันที่ถูกเรียกเมื่อช่องเปลี่ยน
+
+        :param callback: ฟังก์ชันที่รับรายการตำแหน่ง (x, y) ที่เปลี่ยน
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """ยกเลิกการลงทะเบียนฟังก์ชัน"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _update_cell(self, index: int):
+        """คำนวณสถานะของช่องใหม่ คืนค่า True ถ้าเปลี่ยน"""
+        value = 0 if self._obstacles.get(index) else self._terrain[index]
+        if self.cells[index] == value:
+            return False
+        self.cells[index] = value
+        return True
+
+    def _notify(self, changed):
+        """เพิ่ม version และแจ้งผู้ฟังเมื่อมีช่องเปลี่ยน"""
+        if not changed:
+            return
+        self.version += 1
+        for callback in list(self._listeners):
+            callback(changed)
+
+    def add_obstacle(self, x: int, y: int):
+        """วางสิ่งกีดขวางบนช่อง (x, y) เช่น Tower"""
+        if not self.in_bounds(x, y):
+            return
+        index = y * self.width + x
+        self._obstacles[index] = self._obstacles.get(index, 0) + 1
+        self._notify([(x, y)] if self._update_cell(index) else [])
+
+    def remove_obstacle(self, x: int, y: int):
+        """นำสิ่งกีดขวางออกจากช่อง (x, y)"""
+        index = y * self.width + x
+        count = self._obstacles.get(index, 0)
+        if count <= 0:
+            return
+        if count == 1:
+            del self._obstacles[index]
+        else:
+            self._obstacles[index] = count - 1
+        self._notify([(x, y)] if self._update_cell(index) else [])
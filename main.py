@@ -3,6 +3,7 @@ import sys
 from game.game import Game
 from game.game_config import GameConfig
 from game.menu import GameMenu
+from game.preloader import AssetPreloader
 
 if __name__ == "__main__":
     pygame.init()
@@ -12,15 +13,18 @@ if __name__ == "__main__":
     screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
     pygame.display.set_caption("My Game")
     
+    # เริ่มโหลดแผนที่และทรัพยากรเบื้องหลังทันทีที่เมนูแสดง
+    preloader = AssetPreloader(config).start()
+    
     # สร้างเมนู
-    menu = GameMenu(screen, config)
+    menu = GameMenu(screen, config, preloader)
     
     # รันเมนูและรอการเลือก
     menu_action = menu.run()
     
     if menu_action == 'start':
         # สร้างและรันเกม
-        game = Game(config)
+        game = Game(config, preload=preloader)
         game.run()
     elif menu_action == 'settings':
         print("Settings not implemented yet")